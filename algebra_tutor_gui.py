@@ -2,8 +2,8 @@ from owlready2 import get_ontology
 import tkinter as tk
 from tkinter import messagebox
 import matplotlib.pyplot as plt
-import numpy as np
 import time
+from utils.graph_sampler import graph_for
 
 # ---------------- GLOBAL STATE ----------------
 student_name = ""
@@ -264,8 +264,7 @@ def show_hint():
 
 
 def show_graph():
-    x = np.linspace(-10, 10, 100)
-    y = coefficient * x + constant
+    x, y = graph_for((coefficient, constant), [solution], samples=100)
     plt.figure(figsize=(6, 4))
     plt.plot(x, y, label=f"{equations[current_index].hasExpression[0]}")
     plt.scatter(solution, 0, color='red', label=f"Solution: x={solution}")
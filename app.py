@@ -1,15 +1,85 @@
+import os
+
 from flask import Flask
-from routes import auth, linear, quadratic, progress, quiz
+from routes import auth, linear, quadratic, progress, quiz, batch, admin, metrics, practice
+from utils.compression import DEFAULT_MIN_SIZE, init_compression
+from utils.instrumentation import install_instrumentation
+from utils.json_provider import CompactJSONProvider
+from utils.progress_store import DEFAULT_FLUSH_INTERVAL, init_progress_store
+from utils.ontology_loader import start_watcher, warm_up
+from utils.sampling_profiler import SamplingProfiler
+from utils.session_store import init_session_store
+from utils.static_assets import init_static_assets
+
+
+def create_app(warm=False, watch=True):
+    app = Flask(__name__)
+    app.secret_key = 'your-secret-key-here-change-in-production'
+
+    # Compact JSON (orjson when installed); gzip/brotli for larger responses.
+    # Set COMPRESSION=0 when a reverse proxy already compresses.
+    app.json = CompactJSONProvider(app)
+    app.config['COMPRESSION'] = os.environ.get('COMPRESSION', '1') not in ('', '0')
+    app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get('COMPRESS_MIN_SIZE', DEFAULT_MIN_SIZE))
+    if app.config['COMPRESSION']:
+        init_compression(app)
+
+    # Session data stays on the server; the cookie only carries its id
+    app.config['SESSION_BACKEND'] = os.environ.get('SESSION_BACKEND', 'memory')
+    app.config['SESSION_SQLITE_PATH'] = os.environ.get('SESSION_SQLITE_PATH')
+    init_session_store(app)
+
+    # Durable progress per student, written behind to SQLite. Defaults to
+    # instance/progress.sqlite3; set PROGRESS_DB_PATH empty to disable
+    app.config['PROGRESS_DB_PATH'] = os.environ.get('PROGRESS_DB_PATH')
+    app.config['PROGRESS_FLUSH_INTERVAL'] = float(os.environ.get('PROGRESS_FLUSH_INTERVAL',
+                                                                 DEFAULT_FLUSH_INTERVAL))
+    init_progress_store(app)
+
+    # Fingerprinted, precompressed CSS/JS served from /assets/ (see build_assets.py)
+    init_static_assets(app)
+
+    # Register blueprints
+    app.register_blueprint(auth.bp)
+    app.register_blueprint(linear.bp)
+    app.register_blueprint(quadratic.bp)
+    app.register_blueprint(progress.bp)
+    app.register_blueprint(quiz.bp)
+    app.register_blueprint(batch.bp)
+    app.register_blueprint(practice.bp)
+    app.register_blueprint(admin.bp)
+
+    # Load the ontology now instead of on the first request
+    if warm:
+        warm_up()
+
+    # Pick up edits to the ontology file without a restart
+    app.config['ADMIN_TOKEN'] = os.environ.get('ADMIN_TOKEN')
+    # Token-less access from this host; off by default under wsgi.py/asgi.py
+    app.config['ADMIN_LOCAL_ACCESS'] = os.environ.get('ADMIN_LOCAL_ACCESS', '1') not in ('', '0')
+    app.config['ONTOLOGY_WATCH'] = os.environ.get('ONTOLOGY_WATCH', '') not in ('', '0')
+    app.config['ONTOLOGY_WATCH_INTERVAL'] = float(os.environ.get('ONTOLOGY_WATCH_INTERVAL', 2.0))
+    # watch=False defers the thread, e.g. to each worker after a pre-fork load
+    if app.config['ONTOLOGY_WATCH'] and watch:
+        start_watcher(app.config['ONTOLOGY_WATCH_INTERVAL'])
+
+    # Opt-in metrics at /metrics; PROFILE_SLOW_MS also dumps stacks of slow requests
+    app.config['INSTRUMENTATION'] = os.environ.get('INSTRUMENTATION', '') not in ('', '0')
+    if app.config['INSTRUMENTATION']:
+        profiler = None
+        if os.environ.get('PROFILE_SLOW_MS'):
+            profiler = SamplingProfiler(float(os.environ['PROFILE_SLOW_MS']),
+                                        float(os.environ.get('PROFILE_INTERVAL_MS', 5)),
+                                        os.environ.get('PROFILE_DIR', 'profiles'))
+        install_instrumentation(app, profiler)
+        app.register_blueprint(metrics.bp)
 
-app = Flask(__name__)
-app.secret_key = 'your-secret-key-here-change-in-production'
+    return app
 
-# Register blueprints
-app.register_blueprint(auth.bp)
-app.register_blueprint(linear.bp)
-app.register_blueprint(quadratic.bp)
-app.register_blueprint(progress.bp)
-app.register_blueprint(quiz.bp)
 
 if __name__ == '__main__':
+    # Built only here: wsgi.py, asgi.py and the benchmarks import create_app()
+    # and build their own app, so importing this module must not start one
+    app = create_app()
+    warm_up()
     app.run(debug=True, port=5001)
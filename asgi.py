@@ -0,0 +1,24 @@
+"""
+ASGI entry point:
+
+    uvicorn asgi:app --port 5001        (or: hypercorn asgi:app)
+
+Serves the same routes as wsgi.py. The server's event loop holds the
+connections, so idle classroom clients cost no threads; complete requests
+run on a pool of ASGI_THREADS threads (8 by default). As with wsgi.py,
+admin routes and /metrics need ADMIN_TOKEN, and the vendored assets must
+be in place.
+"""
+import os
+
+# Before create_app(), which reads it
+os.environ.setdefault('ADMIN_LOCAL_ACCESS', '0')
+
+from app import create_app
+from utils.asgi_bridge import AsgiBridge
+from utils.ontology_loader import warm_up
+from utils.static_assets import require_vendor_assets
+
+flask_app = create_app()
+require_vendor_assets(flask_app.static_folder)
+app = AsgiBridge(flask_app, int(os.environ.get('ASGI_THREADS', 8)), on_startup=warm_up)
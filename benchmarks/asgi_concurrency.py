@@ -0,0 +1,283 @@
+"""
+Concurrency benchmark: thread-per-connection WSGI vs. the ASGI bridge.
+
+Both modes serve the same Flask app in-process, with no sockets:
+    wsgi - every connection gets a thread, like a threaded WSGI server;
+           an idle client (one still sending its request body) holds its
+           thread for as long as it stays connected
+    asgi - asgi.py's AsgiBridge; connections are coroutines, and only
+           complete requests take one of the --threads pool threads
+Each run keeps --idle slow clients connected while --clients active students
+make the dashboard's fetch calls. It reports latency, throughput, peak
+threads and memory growth. Each mode runs in its own interpreter.
+
+Run from the project root: python -m benchmarks.asgi_concurrency [--idle N] [--clients N] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.load_test import scratch_progress_store, summarize
+from utils.asgi_bridge import AsgiBridge, build_environ, call_wsgi
+
+MODES = ('wsgi', 'asgi')
+
+# One dashboard interaction per round, as issued by the templates' fetch calls
+ROUND = [
+    ('GET', '/linear/equations', None),
+    ('GET', '/linear/equation/0', None),
+    ('POST', '/linear/check_answer', {"answer": "999"}),
+    ('GET', '/linear/hint', None),
+    ('GET', '/linear/graph_data/0', None),
+    ('GET', '/quadratic/equations', None),
+    ('GET', '/quadratic/equation/0', None),
+    ('POST', '/quadratic/check_answer', {"a": 0, "b": 0, "c": 0}),
+    ('GET', '/quadratic/hint', None),
+    ('GET', '/quadratic/graph_data/0', None),
+    ('GET', '/progress/data', None),
+]
+LOGIN = [
+    ('POST', '/login', {"name": "bench"}),
+    ('POST', '/quiz/submit', {"answers": {"1": 0, "2": 0}}),
+]
+
+
+def rss_kb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def make_scope(method, path, body, cookie):
+    headers = [(b'host', b'localhost'), (b'content-length', str(len(body)).encode())]
+    if body:
+        headers.append((b'content-type', b'application/json'))
+    if cookie:
+        headers.append((b'cookie', cookie.encode('latin-1')))
+    return {'type': 'http', 'http_version': '1.1', 'method': method, 'scheme': 'http',
+            'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+            'headers': headers, 'server': ('localhost', 80), 'client': ('127.0.0.1', 50000)}
+
+
+def session_cookie(headers, cookie):
+    for name, value in headers:
+        if name.lower() == b'set-cookie' and value.startswith(b'session='):
+            return value.split(b';', 1)[0].decode('latin-1')
+    return cookie
+
+
+def encode(payload):
+    return json.dumps(payload).encode() if payload is not None else b''
+
+
+class ThreadSampler:
+    """Tracks the peak thread count while a run is in progress."""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+# --- thread-per-connection WSGI -------------------------------------------
+
+class SlowInput:
+    """wsgi.input of a client that has not finished sending its body."""
+
+    def __init__(self, release, body):
+        self.release = release
+        self.body = body
+
+    def read(self, size=-1):
+        self.release.wait()
+        body, self.body = self.body, b''
+        return body
+
+
+def run_wsgi(flask_app, idle, clients, rounds):
+    release = threading.Event()
+    timings = []
+    lock = threading.Lock()
+
+    def idle_connection():
+        body = encode({"answer": "1"})
+        environ = build_environ(make_scope('POST', '/linear/check_answer', body, None), body)
+        environ['wsgi.input'] = SlowInput(release, body)
+        call_wsgi(flask_app, environ)
+
+    def active_client():
+        cookie = None
+        for i, (method, path, payload) in enumerate(LOGIN + ROUND * rounds):
+            body = encode(payload)
+            start = time.perf_counter()
+            status, headers, _ = call_wsgi(flask_app, build_environ(make_scope(method, path, body, cookie), body))
+            elapsed = time.perf_counter() - start
+            cookie = session_cookie(headers, cookie)
+            if i >= len(LOGIN):
+                with lock:
+                    timings.append(elapsed)
+
+    idle_threads = [threading.Thread(target=idle_connection, daemon=True) for _ in range(idle)]
+    for t in idle_threads:
+        t.start()
+
+    with ThreadSampler() as sampler:
+        start = time.perf_counter()
+        active = [threading.Thread(target=active_client) for _ in range(clients)]
+        for t in active:
+            t.start()
+        for t in active:
+            t.join()
+        wall = time.perf_counter() - start
+        memory = rss_kb()
+
+    release.set()
+    for t in idle_threads:
+        t.join()
+    return timings, wall, sampler.peak, memory
+
+
+# --- ASGI bridge ------------------------------------------------------------
+
+async def asgi_request(bridge, method, path, payload, cookie):
+    body = encode(payload)
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await bridge(make_scope(method, path, body, cookie), receive, send)
+    return sent[0]['status'], sent[0]['headers']
+
+
+async def asgi_main(flask_app, threads, idle, clients, rounds):
+    bridge = AsgiBridge(flask_app, threads)
+    release = asyncio.Event()
+    timings = []
+
+    async def idle_connection():
+        body = encode({"answer": "1"})
+        parts = [body[:1], body[1:]]
+
+        async def receive():
+            # First byte now, the rest only once the run is over
+            if len(parts) == 2:
+                return {'type': 'http.request', 'body': parts.pop(0), 'more_body': True}
+            await release.wait()
+            return {'type': 'http.request', 'body': parts.pop(0), 'more_body': False}
+
+        async def send(message):
+            pass
+
+        await bridge(make_scope('POST', '/linear/check_answer', body, None), receive, send)
+
+    async def active_client():
+        cookie = None
+        for i, (method, path, payload) in enumerate(LOGIN + ROUND * rounds):
+            start = time.perf_counter()
+            _, headers = await asgi_request(bridge, method, path, payload, cookie)
+            elapsed = time.perf_counter() - start
+            cookie = session_cookie(headers, cookie)
+            if i >= len(LOGIN):
+                timings.append(elapsed)
+
+    idle_tasks = [asyncio.create_task(idle_connection()) for _ in range(idle)]
+    await asyncio.sleep(0)
+
+    with ThreadSampler() as sampler:
+        start = time.perf_counter()
+        await asyncio.gather(*(active_client() for _ in range(clients)))
+        wall = time.perf_counter() - start
+        memory = rss_kb()
+
+    release.set()
+    await asyncio.gather(*idle_tasks)
+    bridge.executor.shutdown()
+    return timings, wall, sampler.peak, memory
+
+
+def run_mode(mode, idle, clients, rounds, threads):
+    from app import create_app
+    from utils.ontology_loader import warm_up
+
+    scratch_progress_store()
+    flask_app = create_app()
+    warm_up()
+    baseline_rss = rss_kb()
+    if mode == 'wsgi':
+        timings, wall, peak_threads, memory = run_wsgi(flask_app, idle, clients, rounds)
+    else:
+        timings, wall, peak_threads, memory = asyncio.run(
+            asgi_main(flask_app, threads, idle, clients, rounds))
+    return dict(summarize(timings, wall), mode=mode, idle=idle, clients=clients,
+                peak_threads=peak_threads, rss_growth_kb=memory - baseline_rss,
+                wall_seconds=round(wall, 3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--idle', type=int, default=1000, help="slow clients held open during the run")
+    parser.add_argument('--clients', type=int, default=50, help="active simulated students")
+    parser.add_argument('--rounds', type=int, default=5, help="dashboard interactions per student")
+    parser.add_argument('--threads', type=int, default=8, help="ASGI handler pool size")
+    parser.add_argument('--output', help="write the JSON results here")
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        # Child run: one mode in a clean interpreter, JSON on the last line
+        print(json.dumps(run_mode(args.mode, args.idle, args.clients, args.rounds, args.threads)))
+        return
+
+    results = []
+    for mode in MODES:
+        out = subprocess.run([sys.executable, '-m', 'benchmarks.asgi_concurrency', '--mode', mode,
+                              '--idle', str(args.idle), '--clients', str(args.clients),
+                              '--rounds', str(args.rounds), '--threads', str(args.threads)],
+                             check=True, capture_output=True, text=True).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+
+    print(f"{args.idle} idle connections, {args.clients} active students x {args.rounds} rounds, "
+          f"{args.threads} ASGI threads, {os.cpu_count()} CPUs")
+    print(f"{'mode':<6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'threads':>8} {'RSS +MB':>8}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['throughput_rps']:>9.1f} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} "
+              f"{r['p99_ms']:>9.3f} {r['peak_threads']:>8} {r['rss_growth_kb'] / 1024:>8.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"config": {k: v for k, v in vars(args).items() if k not in ('output', 'mode')},
+                       "results": results}, f, indent=2)
+            f.write('\n')
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
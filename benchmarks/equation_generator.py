@@ -0,0 +1,37 @@
+"""
+Generator throughput: bank build time and equations generated per second by tier.
+Run from the project root: python -m benchmarks.equation_generator [--count N]
+"""
+import argparse
+import time
+
+from utils.equation_generator import (TIERS, generate_data, generate_record,
+                                      linear_bank, quadratic_bank, student_seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args()
+
+    for bank in (linear_bank, quadratic_bank):
+        bank.cache_clear()
+        start = time.perf_counter()
+        sizes = [len(bank(tier)) for tier in TIERS]
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{bank.__name__:<15} {elapsed:8.2f} ms   sizes {dict(zip(TIERS, sizes))}")
+
+    for eq_type in ('linear', 'quadratic'):
+        for tier in TIERS:
+            seed = student_seed('benchmark', eq_type, tier)
+            for label, fn in (('data', generate_data), ('record', generate_record)):
+                start = time.perf_counter()
+                for index in range(args.count):
+                    fn(eq_type, tier, seed, index)
+                elapsed = time.perf_counter() - start
+                print(f"{eq_type:<10} {tier:<7} {label:<7} "
+                      f"{args.count / elapsed:12,.0f} equations/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Step-verification throughput: checks per second with a cold and a warm parse cache.
+Run from the project root: python -m benchmarks.expression_checker [--checks N]
+"""
+import argparse
+import random
+import time
+
+from utils.expression_checker import check_step, parse_expression
+
+
+def student_answers(rng, count):
+    """Rewritten/factored forms of random integer-root quadratics, some wrong."""
+    pairs = []
+    for _ in range(count):
+        r1, r2 = rng.randint(-12, 12), rng.randint(-12, 12)
+        b, c = -(r1 + r2), r1 * r2
+        target = f"x^2 + {b}x + {c} = 0"
+        if rng.random() < 0.5:
+            answer = f"x(x {-r1:+d}) {-r2:+d}(x {-r1:+d}) = 0"
+        else:
+            answer = f"(x {-r1:+d})(x {-r2 + rng.choice([0, 0, 1]):+d}) = 0"
+        pairs.append((answer, target))
+    return pairs
+
+
+def run(pairs):
+    start = time.perf_counter()
+    correct = 0
+    for answer, target in pairs:
+        ok, _ = check_step(answer, target, min_factors=2)
+        correct += ok
+    return time.perf_counter() - start, correct
+
+
+def report(label, elapsed, count):
+    print(f"{label:<12} {count / elapsed:12,.0f} checks/s   "
+          f"{elapsed / count * 1e6:8.2f} us/check")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--checks', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    pairs = student_answers(random.Random(args.seed), args.checks)
+
+    parse_expression.cache_clear()
+    cold, correct = run(pairs)
+    warm, _ = run(pairs)
+
+    print(f"{args.checks} checks, {correct} correct, "
+          f"{parse_expression.cache_info().currsize} cached parses")
+    report("cold cache", cold, args.checks)
+    report("warm cache", warm, args.checks)
+
+
+if __name__ == '__main__':
+    main()
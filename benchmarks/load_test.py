@@ -0,0 +1,339 @@
+"""
+Load test of the tutoring flow plus micro-benchmarks of the hot helpers.
+
+Simulated students run concurrently against the real app through Flask's
+test client, so no network or server is needed. Each one does
+login -> quiz -> linear and quadratic solves (with wrong answers and hint
+requests) -> progress polling. The report has per-endpoint throughput and
+p50/p95/p99 latency. Runs are reproducible for a given --seed.
+
+Run from the project root:
+    python -m benchmarks.load_test [--students N] [--concurrency N] [--output results.json]
+    python -m benchmarks.load_test --compare baseline.json   # exit 1 on regressions
+
+Student threads share one interpreter, so with --concurrency above the core
+count the latencies include queueing behind the GIL. Record baselines for
+--compare with --concurrency 1; use higher values for throughput.
+"""
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from app import create_app
+from routes.quiz import QUIZ_QUESTIONS
+from utils.factor_pairs import get_factor_index
+from utils.hint_personalizer import PERFORMANCE_LEVELS, STEP_KEYS, get_hint_for_performance
+from utils.ontology_loader import get_catalog, get_equation_data, get_hints, get_index
+from utils.progress_model import ProgressTable, save_progress
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+def summarize(timings, wall=None):
+    """Latency summary in milliseconds; throughput when the wall time is known."""
+    ordered = sorted(timings)
+    summary = {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 4),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4) if ordered else 0.0,
+    }
+    if wall:
+        summary["throughput_rps"] = round(len(ordered) / wall, 1)
+    return summary
+
+
+class Recorder:
+    """Per-endpoint latencies and error counts, shared by all student threads."""
+
+    def __init__(self):
+        self.timings = defaultdict(list)
+        self.errors = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add(self, label, elapsed, ok):
+        with self._lock:
+            self.timings[label].append(elapsed)
+            if not ok:
+                self.errors[label] += 1
+
+
+class Student:
+    """One simulated student with its own cookie jar and random stream."""
+
+    def __init__(self, app, recorder, student_id, seed, error_rate, hint_rate):
+        self.client = app.test_client()
+        self.recorder = recorder
+        self.rng = random.Random(f"{seed}:{student_id}")
+        self.name = f"student-{student_id}"
+        self.error_rate = error_rate
+        self.hint_rate = hint_rate
+
+    def call(self, method, label, url, payload=None):
+        # The label is the route template so /equation/3 and /equation/4 pool together
+        start = time.perf_counter()
+        response = self.client.open(url, method=method, json=payload)
+        elapsed = time.perf_counter() - start
+        self.recorder.add(f"{method} {label}", elapsed, response.status_code < 400)
+        return response.get_json(silent=True) or {}
+
+    def stumble(self, method, label, url, wrong_payloads):
+        """Send a few wrong answers (and maybe ask for a hint) before the right one."""
+        if self.rng.random() < self.error_rate:
+            for _ in range(self.rng.randint(1, 3)):
+                self.call(method, label, url, self.rng.choice(wrong_payloads))
+        if self.rng.random() < self.hint_rate:
+            prefix = label.rsplit('/', 1)[0]
+            self.call('GET', f"{prefix}/hint", f"{prefix}/hint")
+
+    def take_quiz(self):
+        self.call('POST', '/login', '/login', {"name": self.name})
+        self.call('GET', '/quiz/get_questions', '/quiz/get_questions')
+        skill = self.rng.random()
+        answers = {str(q['id']): q['correct'] if self.rng.random() < skill
+                   else (q['correct'] + 1) % len(q['options'])
+                   for q in QUIZ_QUESTIONS}
+        self.call('POST', '/quiz/submit', '/quiz/submit', {"answers": answers})
+
+    def solve_linear(self, eq_id, record):
+        data = record.data
+        self.call('GET', '/linear/equation/<id>', f'/linear/equation/{eq_id}')
+        url = '/linear/check_answer'
+        for right in (data['constant'], data['coefficient'], int(data['solution'])):
+            self.stumble('POST', url, url, [{"answer": str(right + d)} for d in (-2, -1, 1, 3)])
+            self.call('POST', url, url, {"answer": str(right)})
+
+    def solve_quadratic(self, eq_id, record):
+        data = record.data
+        a, b, c = data['a_coefficient'], data['b_coefficient'], data['c_coefficient']
+        pair = get_factor_index(a * c).pair_for(a * c, b) or (0, 0)
+        steps = [
+            ({"a": a, "b": b, "c": c}, [{"a": a, "b": c, "c": b}, {"a": b, "b": a, "c": c}]),
+            ({"answer": a * c}, [{"answer": a + c}, {"answer": -a * c}]),
+            ({"num1": pair[0], "num2": pair[1]}, [{"num1": pair[0] + 1, "num2": pair[1] - 1},
+                                                  {"num1": -pair[0], "num2": -pair[1]}]),
+            ({"answer": data.get('step4_expression', '')}, [{"answer": f"x^2 + {b + 1}x + {c} = 0"}]),
+            ({"answer": data.get('step5_expression', '')}, [{"answer": f"(x + {b})(x - {c}) = 0"}]),
+            ({"sol1": data['solution1'], "sol2": data['solution2']},
+             [{"sol1": -data['solution1'], "sol2": data['solution2'] + 1}]),
+        ]
+        self.call('GET', '/quadratic/equation/<id>', f'/quadratic/equation/{eq_id}')
+        url = '/quadratic/check_answer'
+        for right, wrong in steps:
+            self.stumble('POST', url, url, wrong)
+            self.call('POST', url, url, right)
+
+    def run(self, catalog, equations):
+        self.take_quiz()
+        for kind, records, solve in (('linear', catalog.linear, self.solve_linear),
+                                     ('quadratic', catalog.quadratic, self.solve_quadratic)):
+            self.call('GET', f'/{kind}/equations', f'/{kind}/equations')
+            for eq_id, record in enumerate(records[:equations]):
+                solve(eq_id, record)
+                self.call('GET', '/progress/data', '/progress/data')
+            self.call('GET', f'/{kind}/equations', f'/{kind}/equations')
+
+
+def run_load(app, students, concurrency, seed, equations, error_rate, hint_rate):
+    catalog = get_catalog()
+    recorder = Recorder()
+
+    def simulate(student_id):
+        Student(app, recorder, student_id, seed, error_rate, hint_rate).run(catalog, equations)
+
+    # One untimed student first, so template and parse caches are warm
+    Student(app, Recorder(), -1, seed, error_rate, hint_rate).run(catalog, equations)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(simulate, range(students)))
+    wall = time.perf_counter() - start
+
+    endpoints = {}
+    for label in sorted(recorder.timings):
+        endpoints[label] = dict(summarize(recorder.timings[label], wall),
+                                errors=recorder.errors[label])
+    all_timings = [t for timings in recorder.timings.values() for t in timings]
+    return {
+        "wall_seconds": round(wall, 3),
+        "total": dict(summarize(all_timings, wall), errors=sum(recorder.errors.values())),
+        "endpoints": endpoints,
+    }
+
+
+def scratch_progress_store():
+    """Use an empty, temporary progress store (unless PROGRESS_DB_PATH is set).
+
+    Otherwise simulated students would resume the progress of earlier runs.
+    Call before create_app().
+    """
+    if 'PROGRESS_DB_PATH' in os.environ:
+        return
+    directory = tempfile.mkdtemp(prefix='progress-bench-')
+    # Registered before the store's own atexit flush, so it runs after it
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    os.environ['PROGRESS_DB_PATH'] = os.path.join(directory, 'progress.sqlite3')
+
+
+def time_calls(fn, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+def run_micro(app, iterations):
+    """Per-call latency of the functions behind the hot endpoints."""
+    index = get_index()
+    individuals = index.individuals_of('LinearEquation') + index.individuals_of('QuadraticEquation')
+    hints = get_hints(individuals[-1])
+    catalog = get_catalog()
+    cycle = {'eq': 0, 'hint': 0}
+
+    def equation_data():
+        get_equation_data(individuals[cycle['eq'] % len(individuals)])
+        cycle['eq'] += 1
+
+    def equation_hints():
+        get_hints(individuals[cycle['eq'] % len(individuals)])
+        cycle['eq'] += 1
+
+    def hint_for_performance():
+        i = cycle['hint']
+        cycle['hint'] += 1
+        get_hint_for_performance(hints, PERFORMANCE_LEVELS[i % len(PERFORMANCE_LEVELS)],
+                                 'quadratic', i % len(STEP_KEYS))
+
+    results = {
+        "get_equation_data": time_calls(equation_data, iterations),
+        "get_hints": time_calls(equation_hints, iterations),
+        "get_hint_for_performance": time_calls(hint_for_performance, iterations),
+    }
+
+    # The progress view against a session where every equation is solved
+    view = app.view_functions['progress.get_progress_data']
+    with app.test_request_context('/progress/data'):
+        from flask import session
+        session['student_name'] = 'bench'
+        for kind, records in (('linear', catalog.linear), ('quadratic', catalog.quadratic)):
+            table = ProgressTable()
+            for i in range(len(records)):
+                table.complete(i, 20.0 + i)
+            save_progress(session, kind, table)
+        results["get_progress_data"] = time_calls(view, iterations)
+        # Includes the write-behind to the progress store (cache, journal, queue)
+        results["save_progress"] = time_calls(lambda: save_progress(session, 'quadratic', table),
+                                              iterations)
+    return results
+
+
+def compare(current, baseline, metric, tolerance, min_count=20):
+    """Series whose `metric` grew by more than `tolerance` (a fraction) over the baseline."""
+    regressions = []
+    for section in ('endpoints', 'micro'):
+        old_section = baseline.get(section, {})
+        for name, stats in current.get(section, {}).items():
+            old = old_section.get(name)
+            # Tails of tiny samples are scheduling noise, not regressions
+            if not old or not old.get(metric) or min(old['count'], stats['count']) < min_count:
+                continue
+            change = stats[metric] / old[metric] - 1
+            if change > tolerance:
+                regressions.append({"section": section, "name": name, "baseline": old[metric],
+                                    "current": stats[metric], "change": round(change, 3)})
+    return regressions
+
+
+def print_report(results):
+    print(f"{'endpoint':<34} {'count':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'err':>5}")
+    for label, stats in list(results['load']['endpoints'].items()) + [('TOTAL', results['load']['total'])]:
+        print(f"{label:<34} {stats['count']:>7} {stats['throughput_rps']:>9.1f} {stats['p50_ms']:>9.3f} "
+              f"{stats['p95_ms']:>9.3f} {stats['p99_ms']:>9.3f} {stats['errors']:>5}")
+    print()
+    print(f"{'function':<34} {'calls':>7} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}")
+    for name, stats in results['micro'].items():
+        print(f"{name:<34} {stats['count']:>7} {stats['p50_ms'] * 1000:>9.2f} "
+              f"{stats['p95_ms'] * 1000:>9.2f} {stats['p99_ms'] * 1000:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--equations', type=int, default=5, help="equations of each type per student")
+    parser.add_argument('--error-rate', type=float, default=0.3, help="chance of wrong answers before a step")
+    parser.add_argument('--hint-rate', type=float, default=0.2, help="chance of a hint request per step")
+    parser.add_argument('--micro-iterations', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write the JSON results here")
+    parser.add_argument('--compare', help="baseline JSON results to check for regressions")
+    parser.add_argument('--metric', default='p50_ms', choices=('mean_ms', 'p50_ms', 'p95_ms', 'p99_ms'),
+                        help="statistic compared against the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed growth vs. the baseline")
+    args = parser.parse_args()
+
+    scratch_progress_store()
+    app = create_app(warm=True)
+    catalog = get_catalog()
+    results = {
+        "version": RESULTS_FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "catalog_version": catalog.version,
+        "config": {key: value for key, value in vars(args).items()
+                   if key not in ('output', 'compare', 'metric', 'tolerance')},
+        "load": run_load(app, args.students, args.concurrency, args.seed, args.equations,
+                         args.error_rate, args.hint_rate),
+        "micro": run_micro(app, args.micro_iterations),
+    }
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get('config') != results['config']:
+            print(f"Note: {args.compare} was recorded with different settings: {baseline.get('config')}")
+        flat = {"endpoints": results['load']['endpoints'], "micro": results['micro']}
+        regressions = compare(flat, {"endpoints": baseline['load']['endpoints'],
+                                     "micro": baseline['micro']}, args.metric, args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['section']}/{r['name']}: {args.metric} {r['baseline']} -> "
+                  f"{r['current']} (+{r['change']:.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No {args.metric} regressions beyond {args.tolerance:.0%} vs {args.compare}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Bytes on the wire and encode time for the JSON API endpoints.
+
+For each endpoint the payload is encoded as:
+    pretty   - Flask's default provider in debug mode (app.py runs debug=True)
+    stdlib   - Flask's default provider, compact (non-debug)
+    compact  - CompactJSONProvider (orjson when installed)
+then gzip- and, with the brotli package, brotli-compressed at the levels
+utils/compression.py uses. Graph endpoints are also measured with
+?series=compact. The wire column is the Content-Length the app actually
+sends to a client that accepts gzip and br, and request is the mean time
+of that whole request through the test client.
+
+Run from the project root: python -m benchmarks.response_encoding [--iterations N] [--output results.json]
+"""
+import argparse
+import json
+import time
+
+from flask.json.provider import DefaultJSONProvider
+
+from app import create_app
+from benchmarks.load_test import Recorder, Student, scratch_progress_store
+from utils.compression import compress, supported_encodings
+from utils.json_provider import CompactJSONProvider, orjson
+from utils.ontology_loader import get_catalog
+
+ENDPOINTS = [
+    '/progress/data',
+    '/linear/equations',
+    '/quadratic/equations',
+    '/quiz/get_questions',
+    '/linear/graph_data/0',
+    '/linear/graph_data/0?series=compact',
+    '/quadratic/graph_data/0',
+    '/quadratic/graph_data/0?series=compact',
+    '/quadratic/graph_data/0?samples=2001',
+    '/quadratic/graph_data/0?samples=2001&series=compact',
+    '/quadratic/bootstrap/0',
+    '/quadratic/bootstrap/0?series=compact',
+]
+
+
+def mean_us(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return round((time.perf_counter() - start) / iterations * 1e6, 2)
+
+
+def logged_in_client(app):
+    """A student who has solved every equation, so /progress/data is full size."""
+    student = Student(app, Recorder(), 0, seed=0, error_rate=0.3, hint_rate=0.2)
+    student.take_quiz()
+    catalog = get_catalog()
+    for eq_id, record in enumerate(catalog.linear):
+        student.solve_linear(eq_id, record)
+    for eq_id, record in enumerate(catalog.quadratic):
+        student.solve_quadratic(eq_id, record)
+    return student.client
+
+
+def measure(app, client, path, iterations):
+    pretty = DefaultJSONProvider(app)
+    pretty.compact = False
+    stdlib = DefaultJSONProvider(app)
+    stdlib.compact = True
+    compact = CompactJSONProvider(app)
+
+    # Bootstrap restarts the equation; the payload is the same each time
+    payload = client.get(path).get_json()
+    headers = {'Accept-Encoding': 'br, gzip'}
+    wire = client.get(path, headers=headers)
+    body = compact.encode(payload)
+
+    with app.app_context():
+        result = {
+            "bytes": {
+                "pretty": len(pretty.response(payload).get_data()),
+                "stdlib": len(stdlib.response(payload).get_data()),
+                "compact": len(body) + 1,
+                "wire": int(wire.headers['Content-Length']),
+                "wire_encoding": wire.headers.get('Content-Encoding', 'identity'),
+            },
+            "encode_us": {
+                "pretty": mean_us(lambda: pretty.response(payload), iterations),
+                "stdlib": mean_us(lambda: stdlib.response(payload), iterations),
+                "compact": mean_us(lambda: compact.response(payload), iterations),
+            },
+            "request_us": mean_us(lambda: client.get(path, headers=headers), iterations),
+        }
+    for encoding in supported_encodings():
+        result["bytes"][encoding] = len(compress(body, encoding))
+        result["encode_us"][encoding] = mean_us(lambda: compress(body, encoding), iterations)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=500, help="encodes timed per endpoint and format")
+    parser.add_argument('--output', help="write the JSON results here")
+    args = parser.parse_args()
+
+    scratch_progress_store()
+    app = create_app(warm=True)
+    client = logged_in_client(app)
+    results = {path: measure(app, client, path, args.iterations) for path in ENDPOINTS}
+
+    encodings = supported_encodings()
+    print(f"JSON encoder: {'orjson' if orjson is not None else 'stdlib'}; "
+          f"min size {app.config['COMPRESS_MIN_SIZE']} B; mean of {args.iterations} encodes")
+    columns = ('pretty', 'stdlib', 'compact') + encodings
+    print(f"{'':<52} {'bytes':<{8 * len(columns) + 8}} {'encode us':<{8 * len(columns)}} request")
+    print(f"{'endpoint':<52}" + ''.join(f"{c:>8}" for c in columns + ('wire',))
+          + ''.join(f"{c:>8}" for c in columns) + f"{'us':>8}")
+    for path, r in results.items():
+        print(f"{path:<52}" + ''.join(f"{r['bytes'][c]:>8}" for c in columns + ('wire',))
+              + ''.join(f"{r['encode_us'][c]:>8.1f}" for c in columns) + f"{r['request_us']:>8.0f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"iterations": args.iterations, "encodings": list(encodings),
+                       "orjson": orjson is not None, "results": results}, f, indent=2)
+            f.write('\n')
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
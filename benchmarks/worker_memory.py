@@ -0,0 +1,139 @@
+"""
+Per-worker memory with and without building the catalog before fork.
+
+Forks N workers the way a pre-fork server does, runs a short tutoring flow
+in each, then reads every live worker's memory from /proc (Linux only):
+    per-worker - each worker loads the ontology and builds its own catalog
+    preload    - the master builds it (wsgi.py's prepare_for_fork) and the
+                 workers inherit it copy-on-write
+RSS counts shared pages in every worker, so it barely moves; PSS (shared
+pages split between the processes using them) and private memory show
+the saving.
+
+Run from the project root: python -m benchmarks.worker_memory [--workers N] [--output results.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+MODES = ('per-worker', 'preload')
+
+
+def memory_kb(pid):
+    """RSS, PSS and private (clean + dirty) kB of a process, from smaps_rollup."""
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return {"rss_kb": fields.get('Rss', 0), "pss_kb": fields.get('Pss', 0),
+            "private_kb": fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)}
+
+
+def exercise(app):
+    # Enough of the flow to touch the catalog, hints, sessions and progress
+    client = app.test_client()
+    client.post('/login', json={"name": "bench"})
+    client.post('/quiz/submit', json={"answers": {}})
+    for kind in ('linear', 'quadratic'):
+        client.get(f'/{kind}/equations')
+        client.get(f'/{kind}/equation/0')
+        for _ in range(3):
+            client.post(f'/{kind}/check_answer', json={"answer": "0", "a": 0, "b": 0, "c": 0})
+        client.get(f'/{kind}/hint')
+    client.get('/progress/data')
+
+
+def run_mode(mode, workers):
+    """Fork `workers` children in this process and measure them while all are alive."""
+    from app import create_app
+    from utils.ontology_loader import prepare_for_fork, warm_up
+
+    app = create_app(watch=False)
+    if mode == 'preload':
+        prepare_for_fork()
+
+    children = []
+    for _ in range(workers):
+        ready_r, ready_w = os.pipe()
+        done_r, done_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            os.close(done_w)
+            if mode == 'per-worker':
+                warm_up()
+            exercise(app)
+            os.write(ready_w, b'1')
+            os.read(done_r, 1)  # stay alive until the master has measured everyone
+            os._exit(0)
+        os.close(ready_w)
+        os.close(done_r)
+        children.append((pid, ready_r, done_w))
+
+    for _, ready_r, _ in children:
+        os.read(ready_r, 1)
+    master = memory_kb(os.getpid())
+    per_worker = [memory_kb(pid) for pid, _, _ in children]
+
+    for pid, ready_r, done_w in children:
+        os.write(done_w, b'1')
+        os.close(done_w)
+        os.close(ready_r)
+        os.waitpid(pid, 0)
+
+    def mean(key):
+        return round(sum(w[key] for w in per_worker) / len(per_worker))
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "master": master,
+        "per_worker": per_worker,
+        "mean_rss_kb": mean('rss_kb'),
+        "mean_pss_kb": mean('pss_kb'),
+        "mean_private_kb": mean('private_kb'),
+        "total_pss_kb": master['pss_kb'] + sum(w['pss_kb'] for w in per_worker),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--output', help="write the JSON results here")
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        sys.exit("worker_memory needs Linux /proc/<pid>/smaps_rollup")
+
+    if args.mode:
+        # Child run: one mode in a clean interpreter, JSON on the last line
+        print(json.dumps(run_mode(args.mode, args.workers)))
+        return
+
+    results = []
+    for mode in MODES:
+        out = subprocess.run([sys.executable, '-m', 'benchmarks.worker_memory',
+                              '--mode', mode, '--workers', str(args.workers)],
+                             check=True, capture_output=True, text=True).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+
+    print(f"{args.workers} workers")
+    print(f"{'mode':<12} {'RSS/worker':>12} {'PSS/worker':>12} {'private/worker':>15} {'total PSS':>12}")
+    for r in results:
+        print(f"{r['mode']:<12} {r['mean_rss_kb'] / 1024:>9.1f} MB {r['mean_pss_kb'] / 1024:>9.1f} MB "
+              f"{r['mean_private_kb'] / 1024:>12.1f} MB {r['total_pss_kb'] / 1024:>9.1f} MB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({"workers": args.workers, "results": results}, f, indent=2)
+            f.write('\n')
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
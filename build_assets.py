@@ -0,0 +1,74 @@
+"""
+Build the fingerprinted, precompressed static assets into static/dist/.
+
+The app also does this at startup when a source has changed; run it at
+deploy time to keep that off the first request, or with --vendor to
+download the third-party files (Chart.js) into static/vendor/ and record
+their checksums in vendor.lock.json, both for commit. Pages never use the
+CDN, so the build fails while a vendored file is missing or altered.
+
+    python build_assets.py [--vendor]
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import urllib.request
+
+from utils.static_assets import (VENDOR_ASSETS, VENDOR_BANNERS, brotli, build,
+                                 check_vendor_assets, load_vendor_lock, vendor_lock_path)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+
+def vendor(static_dir):
+    lock = load_vendor_lock(static_dir)
+    for name, url in VENDOR_ASSETS.items():
+        path = os.path.join(static_dir, name)
+        print(f"Downloading {url}")
+        with urllib.request.urlopen(url, timeout=60) as response:
+            content = response.read()
+        banner = VENDOR_BANNERS.get(name)
+        if banner is not None and banner not in content[:500]:
+            raise OSError(f"{url} is not the pinned {banner.decode()}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+        lock[name] = {"url": url, "sha256": hashlib.sha256(content).hexdigest()}
+        print(f"  -> {os.path.relpath(path)} ({len(content)} bytes)")
+    with open(vendor_lock_path(static_dir), 'w') as f:
+        json.dump(lock, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vendor', action='store_true', help="download VENDOR_ASSETS into static/ first")
+    args = parser.parse_args()
+
+    if args.vendor:
+        try:
+            vendor(STATIC_DIR)
+        except OSError as e:
+            sys.exit(f"Error downloading vendor assets: {e}")
+
+    manifest = build(STATIC_DIR)
+    if brotli is None:
+        print("brotli is not installed; writing gzip variants only")
+    for name, entry in sorted(manifest['files'].items()):
+        sizes = [f"{os.path.getsize(os.path.join(STATIC_DIR, name))} B"]
+        for encoding, suffix in (('gzip', '.gz'), ('br', '.br')):
+            if encoding in entry['encodings']:
+                path = os.path.join(STATIC_DIR, 'dist', entry['path'] + suffix)
+                sizes.append(f"{encoding} {os.path.getsize(path)} B")
+        print(f"{name:<32} -> {entry['path']:<44} {', '.join(sizes)}")
+
+    problems = check_vendor_assets(STATIC_DIR)
+    if problems:
+        sys.exit(f"Error: {'; '.join(problems)}. Run with --vendor and commit "
+                 f"static/vendor/ and vendor.lock.json")
+
+
+if __name__ == '__main__':
+    main()
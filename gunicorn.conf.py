@@ -0,0 +1,22 @@
+import os
+
+# Import wsgi.py (and build the catalog) once, before forking the workers
+preload_app = True
+wsgi_app = 'wsgi:app'
+bind = os.environ.get('BIND', '127.0.0.1:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+
+# Sessions must be shared by the workers (wsgi.py defaults to sqlite);
+# the in-memory store is per worker
+if workers > 1 and os.environ.get('SESSION_BACKEND') == 'memory':
+    raise SystemExit("SESSION_BACKEND=memory keeps sessions per worker; use sqlite "
+                     "(the default) or cookie with WEB_CONCURRENCY > 1")
+
+
+def post_fork(server, worker):
+    # Threads don't survive fork; each worker watches the ontology itself
+    from wsgi import app
+    from utils.ontology_loader import start_watcher
+
+    if app.config['ONTOLOGY_WATCH']:
+        start_watcher(app.config['ONTOLOGY_WATCH_INTERVAL'])
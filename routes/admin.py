@@ -0,0 +1,45 @@
+import hmac
+
+from flask import Blueprint, current_app, jsonify, request
+from utils.ontology_loader import reload_catalog, reload_status, request_reload
+
+bp = Blueprint('admin', __name__, url_prefix='/admin')
+
+LOOPBACK_ADDRESSES = ('127.0.0.1', '::1')
+
+# Set by a reverse proxy; behind one on the same host every client is loopback
+PROXY_HEADERS = ('X-Forwarded-For', 'Forwarded', 'X-Real-IP')
+
+
+def is_local_request():
+    return (request.remote_addr in LOOPBACK_ADDRESSES
+            and not any(header in request.headers for header in PROXY_HEADERS))
+
+
+@bp.before_request
+def require_admin():
+    # With ADMIN_TOKEN set, callers must send it. Otherwise only direct local
+    # calls, and only when ADMIN_LOCAL_ACCESS is on (wsgi.py/asgi.py turn it off)
+    token = current_app.config.get('ADMIN_TOKEN')
+    if token:
+        sent = request.headers.get('X-Admin-Token', '')
+        if not hmac.compare_digest(sent, token):
+            return jsonify({"success": False, "message": "Forbidden"}), 403
+    elif not current_app.config.get('ADMIN_LOCAL_ACCESS') or not is_local_request():
+        return jsonify({"success": False, "message": "Forbidden"}), 403
+
+
+@bp.route('/ontology', methods=['GET'])
+def ontology_status():
+    return jsonify(reload_status())
+
+
+@bp.route('/ontology/reload', methods=['POST'])
+def reload_ontology():
+    """Rebuild the catalog in the background; ?wait=1 reloads before replying."""
+    if request.args.get('wait'):
+        reload_catalog()
+        return jsonify(dict(reload_status(), success=True))
+
+    started = request_reload()
+    return jsonify(dict(reload_status(), success=True, started=started)), 202
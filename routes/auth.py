@@ -1,6 +1,7 @@
 
 from flask import Blueprint, render_template, request, jsonify, session, redirect, url_for
 from utils.ontology_loader import get_linear_equations, get_quadratic_equations
+from utils.progress_model import restore_progress
 
 bp = Blueprint('auth', __name__)
 
@@ -16,6 +17,7 @@ def login():
     session['student_name'] = data.get('name', '')
     session['quiz_completed'] = False  # Track if quiz is done
     session['performance_level'] = None  # Will be set after quiz
+    restore_progress(session)  # Saved progress survives a new browser or login
 
     return jsonify({"success": True})
 
@@ -0,0 +1,172 @@
+from flask import Blueprint, request, jsonify, session
+from utils.ontology_loader import get_catalog
+from utils.progress_model import dump_progress, load_progress
+from utils.step_engine import (check_linear_answer, check_quadratic_answer,
+                               current_equation, start_linear, start_quadratic)
+import time
+
+bp = Blueprint('batch', __name__, url_prefix='/batch')
+
+# Upper bound on answers per request, across all students
+MAX_BATCH_ITEMS = 5000
+
+# eq_type -> (first step, start function, check function)
+STEP_MACHINES = {
+    'linear': (0, start_linear, check_linear_answer),
+    'quadratic': (1, start_quadratic, check_quadratic_answer),
+}
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_item(item, catalog):
+    """Return (error, position) for one answer; it may name its equation by
+    `equation_id` (position) or by stable `uid`."""
+    if not isinstance(item, dict):
+        return "Each answer must be an object", None
+    eq_type = item.get('type')
+    if eq_type not in STEP_MACHINES:
+        return "type must be 'linear' or 'quadratic'", None
+    if item.get('equation_id') is None and 'uid' in item:
+        eq = catalog.by_uid(item['uid']) if _is_int(item['uid']) else None
+        eq_id = eq.id if eq is not None and eq.type == eq_type else -1
+    else:
+        eq_id = item.get('equation_id')
+        if not _is_int(eq_id):
+            return "equation_id must be an integer", None
+    if catalog.get(eq_type, eq_id) is None:
+        return "Equation not found", None
+    step = item.get('step')
+    if step is not None and not _is_int(step):
+        return "step must be an integer", None
+    elapsed = item.get('elapsed')
+    if elapsed is not None and (not isinstance(elapsed, (int, float)) or elapsed < 0):
+        return "elapsed must be a non-negative number", None
+    return None, eq_id
+
+
+def student_state(student):
+    """Return (error, state) for one student of a stateless batch, with the
+    progress they supply checked before any answer is graded."""
+    if not isinstance(student, dict):
+        return "Each student must be an object", None
+    if not isinstance(student.get('answers') or [], list):
+        return "answers must be a list", None
+    progress = student.get('progress') or {}
+    if not isinstance(progress, dict):
+        return "progress must be an object", None
+    level = student.get('performance_level') or 'moderate'
+    if not isinstance(level, str):
+        return "performance_level must be a string", None
+    state = {
+        'performance_level': level,
+        'linear_progress': progress.get('linear'),
+        'quadratic_progress': progress.get('quadratic'),
+    }
+    for eq_type in STEP_MACHINES:
+        try:
+            table = load_progress(state, eq_type, trust_aggregates=False)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return f"{eq_type} progress is malformed", None
+        # Aggregates are recomputed here, not taken from the client
+        state[f'{eq_type}_progress'] = dump_progress(table, eq_type)
+    return None, state
+
+
+def grade_answers(state, items, catalog):
+    """Run answers through the step state machine in order, mutating `state`.
+
+    Each item carries the same fields as the matching /check_answer request
+    plus `type`, `equation_id` (or stable `uid`) and optionally `step` (0-2
+    for linear, 1-6 for quadratic, as in the session) and `elapsed` (seconds
+    since the student opened the equation). Switching equation, or sending the first step of the
+    current one, starts it afresh; any other step mismatch is rejected.
+    """
+    results = []
+    for index, item in enumerate(items):
+        error, eq_id = validate_item(item, catalog)
+        if error:
+            results.append({"index": index, "success": False, "message": error})
+            continue
+
+        eq_type, step = item['type'], item.get('step')
+        first_step, start, check = STEP_MACHINES[eq_type]
+        equations = catalog.equations(eq_type)
+
+        same_equation = (state.get('current_type') == eq_type
+                         and current_equation(state, equations) == eq_id)
+        if not same_equation or (step == first_step and state.get('current_step') != step):
+            start(state, eq_id, equations[eq_id])
+
+        if step is not None and step != state.get('current_step'):
+            results.append({"index": index, "success": False,
+                            "message": "Answer is for a different step",
+                            "expected_step": state.get('current_step')})
+            continue
+
+        if item.get('elapsed') is not None:
+            state['start_time'] = time.time() - item['elapsed']
+
+        results.append(dict(check(state, item, equations), index=index))
+    return results
+
+
+def progress_snapshot(state):
+    return {eq_type: dump_progress(load_progress(state, eq_type), eq_type)
+            for eq_type in STEP_MACHINES}
+
+
+@bp.route('/check_answers', methods=['POST'])
+def check_answers():
+    """Grade many answers in one request.
+
+    {"answers": [...]} grades the current student against their session.
+    {"students": [{"student_id", "performance_level", "progress", "answers"}]}
+    grades several students statelessly, starting from the given progress.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    catalog = get_catalog()
+
+    if 'students' in data:
+        students = data['students']
+        if not isinstance(students, list):
+            return jsonify({"success": False, "message": "students must be a list"}), 400
+        # Malformed students are reported in their own entry below
+        batches = [student.get('answers') or [] if isinstance(student, dict) else []
+                   for student in students]
+        batches = [items if isinstance(items, list) else [] for items in batches]
+    else:
+        students = None
+        batches = [data.get('answers') or []]
+        if not isinstance(batches[0], list):
+            return jsonify({"success": False, "message": "answers must be a list"}), 400
+
+    if sum(len(items) for items in batches) > MAX_BATCH_ITEMS:
+        return jsonify({"success": False,
+                        "message": f"At most {MAX_BATCH_ITEMS} answers per request"}), 413
+
+    if students is None:
+        results = grade_answers(session, batches[0], catalog)
+        return jsonify({"success": True, "results": results,
+                        "progress": progress_snapshot(session)})
+
+    graded = []
+    for index, (student, items) in enumerate(zip(students, batches)):
+        error, state = student_state(student)
+        student_id = student.get('student_id') if isinstance(student, dict) else None
+        if error:
+            graded.append({"index": index, "student_id": student_id,
+                           "success": False, "message": error})
+            continue
+        graded.append({
+            "index": index,
+            "student_id": student_id,
+            "results": grade_answers(state, items, catalog),
+            "progress": progress_snapshot(state),
+        })
+
+    return jsonify({"success": True, "students": graded})
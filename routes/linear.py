@@ -1,12 +1,14 @@
 from flask import Blueprint, render_template, request, jsonify, session
-from utils.ontology_loader import get_linear_equations, get_equation_data, get_hints
-from utils.hint_personalizer import get_hint_for_performance
-import time
+from utils.bootstrap import bootstrap_payload, parse_fields, step_hints, student_step
+from utils.ontology_loader import get_catalog
+from utils.graph_sampler import compact_series, graph_for, graph_params
+from utils.hint_personalizer import lookup_hint
+from utils.http_cache import conditional
+from utils.progress_model import load_progress
+from utils.step_engine import LINEAR_STEPS, check_linear_answer, start_linear, current_equation
 
 bp = Blueprint('linear', __name__, url_prefix='/linear')
 
-linear_equations = get_linear_equations()
-
 
 @bp.route('/dashboard')
 def dashboard():
@@ -15,141 +17,68 @@ def dashboard():
 
 @bp.route('/equations')
 def get_equations():
-    progress = session.get('linear_progress', {})
+    linear_equations = get_catalog().linear
+    progress = load_progress(session, 'linear')
     equation_list = []
 
     for i, eq in enumerate(linear_equations):
-        eq_data = get_equation_data(eq)
         equation_list.append({
             "id": i,
-            "expression": eq_data['expression'],
-            "status": progress.get(f"Equation{i+1}", {}).get("status", "locked"),
-            "attempts": progress.get(f"Equation{i+1}", {}).get("attempts", 0),
-            "time": progress.get(f"Equation{i+1}", {}).get("time", 0)
+            "uid": eq.uid,
+            "expression": eq.expression,
+            **progress.row(i)
         })
 
     return jsonify({"equations": equation_list})
 
 
 @bp.route('/equation/<int:eq_id>')
+@conditional(stateful=True)
 def get_equation(eq_id):
+    linear_equations = get_catalog().linear
     if eq_id >= len(linear_equations):
         return jsonify({"error": "Equation not found"}), 404
 
     eq = linear_equations[eq_id]
-    eq_data = get_equation_data(eq)
+    start_linear(session, eq_id, eq)
+    return jsonify(equation_payload(eq_id, eq))
 
-    session['current_equation'] = eq_id
-    session['current_type'] = 'linear'
-    session['current_step'] = 0
-    session['step_attempts'] = 0
-    session['start_time'] = time.time()
 
-    return jsonify({
+def equation_payload(eq_id, eq):
+    eq_data = eq.data
+    return {
         "id": eq_id,
+        "uid": eq.uid,
         "type": "linear",
         "expression": eq_data['expression'],
         "constant": eq_data.get('constant', 0),
         "coefficient": eq_data.get('coefficient', 0),
         "solution": eq_data.get('solution', 0)
-    })
-
+    }
 
-@bp.route('/check_answer', methods=['POST'])
-def check_answer():
-    data = request.json
-    user_input = data.get('answer', '')
-    eq_id = session.get('current_equation', 0)
-    current_step = session.get('current_step', 0)
-    step_attempts = session.get('step_attempts', 0)
 
-    try:
-        user_value = int(user_input)
-    except ValueError:
-        return jsonify({"success": False, "message": "Please enter a valid number"})
+@bp.route('/equation/uid/<int:uid>')
+def get_equation_by_uid(uid):
+    # Stable ids survive ontology edits; positions may not
+    eq = get_catalog().by_uid(uid)
+    if eq is None or eq.type != 'linear':
+        return jsonify({"error": "Equation not found"}), 404
+    return get_equation(eq.id)
 
-    eq = linear_equations[eq_id]
-    eq_data = get_equation_data(eq)
-    constant = eq_data.get('constant', 0)
-    coefficient = eq_data.get('coefficient', 0)
-    solution = eq_data.get('solution', 0)
 
-    step_attempts += 1
-    session['step_attempts'] = step_attempts
-
-    # Get personalized hint after 3 attempts
-    hint = None
-    if step_attempts >= 3:
-        performance_level = session.get('performance_level', 'moderate')
-        hints = get_hints(eq)
-
-        # Get adaptive hint based on performance level
-        hint = get_hint_for_performance(
-            hints, performance_level, 'linear', current_step)
-        session['step_attempts'] = 0
-
-    # Check answer based on step
-    if current_step == 0:  # Constant
-        if user_value == constant:
-            session['current_step'] = 1
-            session['step_attempts'] = 0
-            return jsonify({
-                "success": True,
-                "correct": True,
-                "message": "Correct! Moving to next step.",
-                "next_step": 1,
-                "progress_text": f"After subtracting constant: {coefficient}x = {solution * coefficient}"
-            })
-        else:
-            return jsonify({"success": True, "correct": False, "message": "Incorrect. Try again!", "hint": hint})
-
-    elif current_step == 1:  # Coefficient
-        if user_value == coefficient:
-            session['current_step'] = 2
-            session['step_attempts'] = 0
-            return jsonify({
-                "success": True,
-                "correct": True,
-                "message": "Correct! Moving to final step.",
-                "next_step": 2,
-                "progress_text": f"After dividing: x = {solution}"
-            })
-        else:
-            return jsonify({"success": True, "correct": False, "message": "Incorrect. Try again!", "hint": hint})
-
-    elif current_step == 2:  # Solution
-        if user_value == solution:
-            time_taken = round(
-                time.time() - session.get('start_time', time.time()), 2)
-
-            progress = session.get('linear_progress', {})
-            progress[f"Equation{eq_id+1}"]["attempts"] += 1
-            progress[f"Equation{eq_id+1}"]["time"] = time_taken
-            progress[f"Equation{eq_id+1}"]["status"] = "completed"
-
-            if eq_id + 2 <= len(linear_equations):
-                progress[f"Equation{eq_id+2}"]["status"] = "unlocked"
-
-            session['linear_progress'] = progress
-
-            return jsonify({
-                "success": True,
-                "correct": True,
-                "message": "Excellent! You've solved the equation!",
-                "completed": True,
-                "time": time_taken
-            })
-        else:
-            return jsonify({"success": True, "correct": False, "message": "Incorrect. Try again!", "hint": hint})
+@bp.route('/check_answer', methods=['POST'])
+def check_answer():
+    return jsonify(check_linear_answer(session, request.json, get_catalog().linear))
 
 
 @bp.route('/hint')
 def get_hint():
+    linear_equations = get_catalog().linear
     current_step = session.get('current_step', 0)
-    eq_id = session.get('current_equation', 0)
+    eq_id = current_equation(session, linear_equations)
     performance_level = session.get('performance_level', 'moderate')
 
-    if eq_id >= len(linear_equations):
+    if eq_id is None or eq_id >= len(linear_equations):
         default_hints = [
             "The constant is the number added or subtracted from x in the equation.",
             "The coefficient is the number multiplied by x.",
@@ -161,32 +90,61 @@ def get_hint():
         })
 
     eq = linear_equations[eq_id]
-    hints = get_hints(eq)
 
     # Get personalized hint
-    hint = get_hint_for_performance(
-        hints, performance_level, 'linear', current_step)
+    hint = lookup_hint(eq.hint_table, performance_level, current_step)
 
     return jsonify({"hint": hint, "source": "Personalized for your level"})
 
 
 @bp.route('/graph_data/<int:eq_id>')
+@conditional()
 def graph_data(eq_id):
+    linear_equations = get_catalog().linear
     if eq_id >= len(linear_equations):
         return jsonify({"error": "Equation not found"}), 404
 
-    eq = linear_equations[eq_id]
-    eq_data = get_equation_data(eq)
+    return jsonify(graph_payload(linear_equations[eq_id], request.args))
+
+
+def graph_payload(eq, args):
+    eq_data = eq.data
 
     constant = eq_data.get('constant', 0)
     coefficient = eq_data.get('coefficient', 0)
     solution = eq_data.get('solution', 0)
 
-    x_vals = list(range(-10, 11))
-    y_vals = [coefficient * x + constant for x in x_vals]
+    x_vals, y_vals = graph_for((coefficient, constant), [solution],
+                               *graph_params(args), compact=compact_series(args))
 
-    return jsonify({
+    return {
         "x_values": x_vals,
         "y_values": y_vals,
         "solution": solution
-    })
+    }
+
+
+@bp.route('/bootstrap/<int:eq_id>')
+def bootstrap(eq_id):
+    """Open an equation in one round trip: equation, steps, graph, hints, progress."""
+    linear_equations = get_catalog().linear
+    if eq_id >= len(linear_equations):
+        return jsonify({"error": "Equation not found"}), 404
+    try:
+        fields = parse_fields(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    eq = linear_equations[eq_id]
+    # Opening the equation (re)starts it, as /equation/<id> does
+    if 'equation' in fields:
+        start_linear(session, eq_id, eq)
+    step = student_step(session, 'linear', linear_equations, eq_id, 0)
+
+    return jsonify(bootstrap_payload(fields, {
+        'equation': lambda: equation_payload(eq_id, eq),
+        'steps': lambda: LINEAR_STEPS,
+        'graph': lambda: graph_payload(eq, request.args),
+        'hints': lambda: step_hints(eq, session, step, step),
+        'progress': lambda: load_progress(session, 'linear').row(eq_id),
+    }))
@@ -0,0 +1,14 @@
+from flask import Blueprint, Response, current_app
+from routes.admin import require_admin
+
+bp = Blueprint('metrics', __name__)
+
+# Same access rule as /admin: ADMIN_TOKEN if set, else loopback only
+bp.before_request(require_admin)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+@bp.route('/metrics', methods=['GET'])
+def metrics():
+    return Response(current_app.extensions['metrics'].render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,52 @@
+from flask import Blueprint, request, jsonify, session
+from routes.linear import equation_payload as linear_payload
+from routes.quadratic import equation_payload as quadratic_payload
+from utils.equation_generator import TIERS, generate_record, student_seed
+from utils.progress_store import student_key
+from utils.step_engine import (check_linear_answer, check_quadratic_answer,
+                               start_linear, start_quadratic)
+
+bp = Blueprint('practice', __name__, url_prefix='/practice')
+
+# eq_type -> (start function, check function, equation payload)
+PRACTICE_TYPES = {
+    'linear': (start_linear, check_linear_answer, linear_payload),
+    'quadratic': (start_quadratic, check_quadratic_answer, quadratic_payload),
+}
+
+
+def practice_record(eq_type, tier, index):
+    """The index-th equation of the logged-in student's generated stream."""
+    seed = student_seed(student_key(session.get('student_name')), eq_type, tier)
+    return generate_record(eq_type, tier, seed, index)
+
+
+@bp.route('/<eq_type>/<tier>/<int:index>')
+def get_equation(eq_type, tier, index):
+    """Start a generated equation; the same student always gets the same one."""
+    if eq_type not in PRACTICE_TYPES or tier not in TIERS:
+        return jsonify({"error": "Equation not found"}), 404
+
+    start, _, payload = PRACTICE_TYPES[eq_type]
+    eq = practice_record(eq_type, tier, index)
+    # Graded against a one-equation list, so it sits at position 0; its
+    # "gen:" uid keeps the catalog routes from grading it as a catalog equation
+    start(session, 0, eq)
+    session['practice'] = [eq_type, tier, index]
+    return jsonify(dict(payload(index, eq), tier=tier, generated=True))
+
+
+@bp.route('/check_answer', methods=['POST'])
+def check_answer():
+    practice = session.get('practice')
+    if not practice:
+        return jsonify({"success": False, "message": "Start a practice equation first"}), 400
+
+    eq_type, tier, index = practice
+    _, check, _ = PRACTICE_TYPES[eq_type]
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    # Practice equations are not part of the progress table
+    return jsonify(check(session, data, (practice_record(eq_type, tier, index),),
+                         record_progress=False))
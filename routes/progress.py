@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, jsonify, session
-from utils.ontology_loader import get_linear_equations, get_quadratic_equations
+from utils.ontology_loader import get_catalog
+from utils.progress_model import load_progress
 
 bp = Blueprint('progress', __name__, url_prefix='/progress')
 
@@ -11,26 +12,22 @@ def index():
 
 @bp.route('/data')
 def get_progress_data():
-    linear_progress = session.get('linear_progress', {})
-    quadratic_progress = session.get('quadratic_progress', {})
+    catalog = get_catalog()
+    linear_progress = load_progress(session, 'linear')
+    quadratic_progress = load_progress(session, 'quadratic')
     student_name = session.get('student_name', '')
 
-    # Calculate statistics for linear
-    linear_completed = sum(
-        1 for eq_data in linear_progress.values() if eq_data['status'] == 'completed')
-    linear_total = len(linear_progress)
-    linear_attempts = sum(eq_data['attempts']
-                          for eq_data in linear_progress.values())
-    linear_time = sum(eq_data['time'] for eq_data in linear_progress.values())
+    # Calculate statistics for linear (running aggregates, no rescans)
+    linear_completed = linear_progress.completed
+    linear_total = len(catalog.linear)
+    linear_attempts = linear_progress.total_attempts
+    linear_time = linear_progress.total_time
 
     # Calculate statistics for quadratic
-    quadratic_completed = sum(
-        1 for eq_data in quadratic_progress.values() if eq_data['status'] == 'completed')
-    quadratic_total = len(quadratic_progress)
-    quadratic_attempts = sum(eq_data['attempts']
-                             for eq_data in quadratic_progress.values())
-    quadratic_time = sum(eq_data['time']
-                         for eq_data in quadratic_progress.values())
+    quadratic_completed = quadratic_progress.completed
+    quadratic_total = len(catalog.quadratic)
+    quadratic_attempts = quadratic_progress.total_attempts
+    quadratic_time = quadratic_progress.total_time
 
     # Combined statistics
     total_completed = linear_completed + quadratic_completed
@@ -44,37 +41,21 @@ def get_progress_data():
                      1) if total_completed > 0 else 0
 
     # Prepare chart data
-    linear_equation_names = []
-    linear_attempts_data = []
-    linear_time_data = []
-
-    for i in range(linear_total):
-        eq_key = f"Equation{i+1}"
-        if linear_progress[eq_key]['status'] == 'completed':
-            linear_equation_names.append(f"L{i+1}")
-            linear_attempts_data.append(linear_progress[eq_key]['attempts'])
-            linear_time_data.append(linear_progress[eq_key]['time'])
-
-    quadratic_equation_names = []
-    quadratic_attempts_data = []
-    quadratic_time_data = []
-
-    for i in range(quadratic_total):
-        eq_key = f"Equation{i+1}"
-        if quadratic_progress[eq_key]['status'] == 'completed':
-            quadratic_equation_names.append(f"Q{i+1}")
-            quadratic_attempts_data.append(
-                quadratic_progress[eq_key]['attempts'])
-            quadratic_time_data.append(quadratic_progress[eq_key]['time'])
+    linear_ids, linear_attempts_data, linear_time_data = \
+        linear_progress.completed_series()
+    linear_equation_names = [f"L{i+1}" for i in linear_ids]
+
+    quadratic_ids, quadratic_attempts_data, quadratic_time_data = \
+        quadratic_progress.completed_series()
+    quadratic_equation_names = [f"Q{i+1}" for i in quadratic_ids]
 
     # Calculate achievements
     achievements = []
 
     # Speed Solver
-    all_progress = list(linear_progress.values()) + \
-        list(quadratic_progress.values())
-    speed_solver = any(eq_data['time'] > 0 and eq_data['time'] < 30 and eq_data['status'] == 'completed'
-                       for eq_data in all_progress)
+    fastest_times = [table.fastest for table in (linear_progress, quadratic_progress)
+                     if table.fastest is not None]
+    speed_solver = bool(fastest_times) and min(fastest_times) < 30
     if speed_solver:
         achievements.append({
             "icon": "⚡",
@@ -83,8 +64,7 @@ def get_progress_data():
         })
 
     # Perfect Score
-    perfect_score = any(eq_data['attempts'] == 1 and eq_data['status'] == 'completed'
-                        for eq_data in all_progress)
+    perfect_score = linear_progress.first_try + quadratic_progress.first_try > 0
     if perfect_score:
         achievements.append({
             "icon": "🎯",
@@ -120,8 +100,8 @@ def get_progress_data():
     insights = []
 
     if total_completed >= 2:
-        times = [eq_data['time'] for eq_data in all_progress if eq_data['status']
-                 == 'completed' and eq_data['time'] > 0]
+        times = [time_taken for time_taken in linear_time_data + quadratic_time_data
+                 if time_taken > 0]
         if len(times) >= 2:
             first_half_avg = sum(times[:len(times)//2]) / (len(times)//2)
             second_half_avg = sum(
@@ -133,8 +113,8 @@ def get_progress_data():
                     f"📈 You're getting faster! Your solving time improved by {improvement}%")
 
     if linear_completed > 0 and quadratic_completed > 0:
-        linear_avg_time = linear_time / linear_completed
-        quadratic_avg_time = quadratic_time / quadratic_completed
+        linear_avg_time = linear_progress.average_time()
+        quadratic_avg_time = quadratic_progress.average_time()
         if linear_avg_time < quadratic_avg_time:
             insights.append(
                 f"💡 Linear equations are your strength! You solve them faster than quadratic ones.")
@@ -1,5 +1,8 @@
 from flask import Blueprint, render_template, request, jsonify, session, redirect, url_for
-from utils.ontology_loader import get_linear_equations, get_quadratic_equations
+from utils.http_cache import conditional
+from utils.progress_model import ProgressTable, save_progress
+import hashlib
+import json
 
 bp = Blueprint('quiz', __name__, url_prefix='/quiz')
 
@@ -62,8 +65,13 @@ QUIZ_QUESTIONS = [
     }
 ]
 
+# Questions are static, so their hash is the cache validator
+QUIZ_VERSION = hashlib.sha256(json.dumps(
+    QUIZ_QUESTIONS, sort_keys=True).encode()).hexdigest()
+
 
 @bp.route('/get_questions')
+@conditional(version_fn=lambda: (QUIZ_VERSION, None))
 def get_questions():
     return jsonify({"questions": QUIZ_QUESTIONS})
 
@@ -97,25 +105,11 @@ def submit_quiz():
     session['quiz_score'] = score
     session['quiz_correct'] = correct
 
-    # Initialize progress
-    linear_equations = get_linear_equations()
-    quadratic_equations = get_quadratic_equations()
-
-    session['linear_progress'] = {
-        f"Equation{i+1}": {
-            "attempts": 0,
-            "time": 0,
-            "status": "unlocked" if i == 0 else "locked"
-        } for i in range(len(linear_equations))
-    }
-
-    session['quadratic_progress'] = {
-        f"Equation{i+1}": {
-            "attempts": 0,
-            "time": 0,
-            "status": "unlocked" if i == 0 else "locked"
-        } for i in range(len(quadratic_equations))
-    }
+    # Initialize progress for new students (empty tables: only the first
+    # equation is unlocked); progress restored at login is kept
+    for eq_type in ('linear', 'quadratic'):
+        if f'{eq_type}_progress' not in session:
+            save_progress(session, eq_type, ProgressTable())
 
     return jsonify({
         "success": True,
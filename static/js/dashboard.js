@@ -0,0 +1,28 @@
+function showPage(pageId) {
+    document.querySelectorAll('.page').forEach(p => p.classList.remove('active'));
+    document.getElementById(pageId).classList.add('active');
+}
+
+function backToDashboard() {
+    showPage('dashboardPage');
+    loadEquations();
+}
+
+function showMessage(message, type) {
+    const messageBox = document.getElementById('messageBox');
+    messageBox.innerHTML = `<div class="message ${type}">${message}</div>`;
+}
+
+// Graph series sent with ?series=compact are {scale, deltas}: running sums of scaled integers
+function decodeSeries(series) {
+    if (Array.isArray(series)) return series;
+    let total = 0;
+    return series.deltas.map(delta => (total += delta) / series.scale);
+}
+
+function decodeGraph(graph) {
+    return Object.assign({}, graph, {
+        x_values: decodeSeries(graph.x_values),
+        y_values: decodeSeries(graph.y_values)
+    });
+}
@@ -0,0 +1,110 @@
+const QUESTIONS = [];
+let currentQ = 0;
+let answers = {};
+
+async function loadQuestions() {
+    const response = await fetch('/quiz/get_questions');
+    const data = await response.json();
+    QUESTIONS.push(...data.questions);
+}
+
+function startQuiz() {
+    document.getElementById('introPage').classList.remove('active');
+    document.getElementById('quizPage').classList.add('active');
+    displayQuestion();
+}
+
+function displayQuestion() {
+    const q = QUESTIONS[currentQ];
+    const progress = ((currentQ + 1) / QUESTIONS.length) * 100;
+    document.getElementById('progressFill').style.width = progress + '%';
+    document.getElementById('currentQuestion').textContent = currentQ + 1;
+
+    let optionsHTML = '';
+    q.options.forEach((opt, idx) => {
+        const checked = answers[q.id] === idx ? 'checked' : '';
+        optionsHTML += `
+            <div class="option">
+                <label>
+                    <input type="radio" name="q${q.id}" value="${idx}" ${checked} 
+                           onchange="answers[${q.id}] = ${idx}">
+                    ${opt}
+                </label>
+            </div>
+        `;
+    });
+
+    document.getElementById('quizContainer').innerHTML = `
+        <div class="question-container">
+            <div class="question-number">Question ${currentQ + 1}</div>
+            <div class="question-text">${q.question}</div>
+            <div class="options">${optionsHTML}</div>
+        </div>
+    `;
+
+    // Update buttons
+    document.getElementById('prevBtn').style.display = currentQ > 0 ? 'inline-block' : 'none';
+    document.getElementById('nextBtn').style.display = currentQ < QUESTIONS.length - 1 ? 'inline-block' : 'none';
+    document.getElementById('submitBtn').style.display = currentQ === QUESTIONS.length - 1 ? 'inline-block' : 'none';
+}
+
+function nextQuestion() {
+    if (currentQ < QUESTIONS.length - 1) {
+        currentQ++;
+        displayQuestion();
+    }
+}
+
+function previousQuestion() {
+    if (currentQ > 0) {
+        currentQ--;
+        displayQuestion();
+    }
+}
+
+async function submitQuiz() {
+    const response = await fetch('/quiz/submit', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ answers })
+    });
+
+    const data = await response.json();
+
+    if (data.success) {
+        showResults(data);
+    }
+}
+
+function showResults(data) {
+    const levelClass = `level-${data.level}`;
+    const levelText = data.level.charAt(0).toUpperCase() + data.level.slice(1);
+
+    let resultMsg = '';
+    if (data.level === 'high') {
+        resultMsg = `🌟 Excellent work! You're performing at an advanced level. You'll receive concise hints to challenge yourself further.`;
+    } else if (data.level === 'moderate') {
+        resultMsg = `👍 Good job! You're performing at an intermediate level. You'll receive balanced hints to guide your learning.`;
+    } else {
+        resultMsg = `💪 Great effort! You're starting your algebra journey. You'll receive detailed, step-by-step hints to build your foundation.`;
+    }
+
+    document.getElementById('scoreDisplay').textContent = `${data.correct}/${data.total}`;
+    document.getElementById('scoreText').textContent = `(${Math.round(data.score)}%)`;
+    document.getElementById('levelInfo').innerHTML = `
+        <div class="level-badge ${levelClass}">
+            ${levelText} Performer
+        </div>
+    `;
+    document.getElementById('resultMessage').textContent = resultMsg;
+
+    document.getElementById('quizPage').classList.remove('active');
+    document.getElementById('resultsPage').classList.add('active');
+}
+
+function goToHome() {
+    window.location.href = '/home';
+}
+
+// Load questions on page load
+loadQuestions();
@@ -0,0 +1,319 @@
+let currentEquationId = null;
+let currentStep = 0;
+let equationData = null;
+let chart = null;
+let attemptsChart = null;
+let timeChart = null;
+
+function showPage(pageId) {
+    document.querySelectorAll('.page').forEach(p => p.classList.remove('active'));
+    document.getElementById(pageId).classList.add('active');
+}
+
+async function login() {
+    const name = document.getElementById('studentName').value.trim();
+    if (!name) {
+        alert('Please enter your name!');
+        return;
+    }
+
+    const response = await fetch('/login', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ name })
+    });
+
+    if (response.ok) {
+        loadDashboard();
+    }
+}
+
+async function loadDashboard() {
+    const response = await fetch('/dashboard');
+    const data = await response.json();
+
+    document.getElementById('studentNameDisplay').textContent = data.student_name;
+
+    const grid = document.getElementById('equationGrid');
+    grid.innerHTML = '';
+
+    data.equations.forEach(eq => {
+        const card = document.createElement('div');
+        card.className = `equation-card ${eq.status}`;
+        card.innerHTML = `
+            <h3>${eq.expression}</h3>
+            <p>Attempts: ${eq.attempts}</p>
+            ${eq.time > 0 ? `<p>Time: ${eq.time}s</p>` : ''}
+        `;
+
+        if (eq.status !== 'locked') {
+            card.onclick = () => loadEquation(eq.id);
+        }
+
+        grid.appendChild(card);
+    });
+
+    showPage('dashboardPage');
+}
+
+async function loadEquation(id) {
+    currentEquationId = id;
+    const response = await fetch(`/equation/${id}`);
+    equationData = await response.json();
+
+    document.getElementById('equationExpression').textContent = equationData.expression;
+    document.getElementById('stepInstruction').textContent = 'Step 1: What is the constant term?';
+    document.getElementById('progressText').style.display = 'none';
+    document.getElementById('answerInput').value = '';
+    document.getElementById('messageBox').innerHTML = '';
+    document.getElementById('graphContainer').style.display = 'none';
+
+    currentStep = 0;
+    showPage('equationPage');
+}
+
+async function submitAnswer() {
+    const answer = document.getElementById('answerInput').value;
+    if (!answer) {
+        showMessage('Please enter an answer!', 'error');
+        return;
+    }
+
+    const response = await fetch('/check_answer', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ answer })
+    });
+
+    const data = await response.json();
+
+    if (data.correct) {
+        showMessage(data.message, 'success');
+
+        if (data.completed) {
+            setTimeout(() => loadDashboard(), 2000);
+        } else {
+            currentStep = data.next_step;
+            updateStep(data.next_step, data.progress_text);
+            document.getElementById('answerInput').value = '';
+        }
+    } else {
+        showMessage(data.message, 'error');
+        if (data.hint) {
+            setTimeout(() => showMessage(`💡 ${data.hint}`, 'hint'), 1500);
+        }
+    }
+}
+
+function updateStep(step, progressText) {
+    const instructions = [
+        'Step 1: What is the constant term?',
+        'Step 2: What do you divide by?',
+        'Step 3: What is the value of x?'
+    ];
+
+    document.getElementById('stepInstruction').textContent = instructions[step];
+
+    if (progressText) {
+        const progressEl = document.getElementById('progressText');
+        progressEl.textContent = progressText;
+        progressEl.style.display = 'block';
+    }
+}
+
+async function getHint() {
+    const response = await fetch('/hint');
+    const data = await response.json();
+    showMessage(`💡 ${data.hint}`, 'hint');
+}
+
+async function showGraph() {
+    const response = await fetch(`/graph_data/${currentEquationId}`);
+    const data = await response.json();
+
+    const container = document.getElementById('graphContainer');
+    container.style.display = 'block';
+
+    const ctx = document.getElementById('equationChart').getContext('2d');
+
+    if (chart) {
+        chart.destroy();
+    }
+
+    chart = new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: data.x_values,
+            datasets: [{
+                label: 'y = ' + equationData.expression.split('=')[0].trim(),
+                data: data.y_values,
+                borderColor: '#667eea',
+                backgroundColor: 'rgba(102, 126, 234, 0.1)',
+                tension: 0.1,
+                pointRadius: 3
+            }, {
+                label: 'Solution',
+                data: data.x_values.map(x => x === data.solution ? 0 : null),
+                borderColor: '#f5576c',
+                backgroundColor: '#f5576c',
+                pointRadius: 8,
+                pointStyle: 'star',
+                showLine: false
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: true,
+            plugins: {
+                legend: { display: true }
+            },
+            scales: {
+                x: { title: { display: true, text: 'x' } },
+                y: { title: { display: true, text: 'y' } }
+            }
+        }
+    });
+}
+
+function showMessage(message, type) {
+    const messageBox = document.getElementById('messageBox');
+    messageBox.innerHTML = `<div class="message ${type}">${message}</div>`;
+}
+
+function backToDashboard() {
+    loadDashboard();
+}
+
+async function showProgressPage() {
+    const response = await fetch('/progress_data');
+    const data = await response.json();
+
+    // Update stats cards
+    const statsContainer = document.getElementById('statsContainer');
+    statsContainer.innerHTML = `
+        <div class="stat-card">
+            <h4>Completed</h4>
+            <p>${data.stats.completed}/${data.stats.total}</p>
+        </div>
+        <div class="stat-card">
+            <h4>Total Attempts</h4>
+            <p>${data.stats.total_attempts}</p>
+        </div>
+        <div class="stat-card">
+            <h4>Avg Attempts</h4>
+            <p>${data.stats.avg_attempts}</p>
+        </div>
+        <div class="stat-card">
+            <h4>Total Time</h4>
+            <p>${data.stats.total_time}s</p>
+        </div>
+        <div class="stat-card">
+            <h4>Avg Time</h4>
+            <p>${data.stats.avg_time}s</p>
+        </div>
+        <div class="stat-card">
+            <h4>Completion Rate</h4>
+            <p>${data.stats.accuracy}%</p>
+        </div>
+    `;
+
+    // Update achievements
+    const achievementsContainer = document.getElementById('achievementsContainer');
+    if (data.achievements.length > 0) {
+        achievementsContainer.innerHTML = data.achievements.map(ach => `
+            <div class="achievement-card">
+                <div class="icon">${ach.icon}</div>
+                <h4>${ach.name}</h4>
+                <p>${ach.description}</p>
+            </div>
+        `).join('');
+    } else {
+        achievementsContainer.innerHTML = '<p style="text-align: center; color: #999;">Complete equations to unlock achievements!</p>';
+    }
+
+    // Update insights
+    const insightsContainer = document.getElementById('insightsContainer');
+    if (data.insights.length > 0) {
+        insightsContainer.innerHTML = data.insights.map(insight => `
+            <div class="insight-item">${insight}</div>
+        `).join('');
+    } else {
+        insightsContainer.innerHTML = '<p style="text-align: center; color: #999;">Complete more equations to see insights!</p>';
+    }
+
+    // Draw charts if there's data
+    if (data.charts.equation_names.length > 0) {
+        // Attempts chart
+        const attemptsCtx = document.getElementById('attemptsChart').getContext('2d');
+        if (attemptsChart) attemptsChart.destroy();
+        attemptsChart = new Chart(attemptsCtx, {
+            type: 'bar',
+            data: {
+                labels: data.charts.equation_names,
+                datasets: [{
+                    label: 'Attempts per Equation',
+                    data: data.charts.attempts,
+                    backgroundColor: 'rgba(102, 126, 234, 0.7)',
+                    borderColor: '#667eea',
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: true,
+                plugins: {
+                    legend: { display: true }
+                },
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        title: { display: true, text: 'Number of Attempts' }
+                    }
+                }
+            }
+        });
+
+        // Time chart
+        const timeCtx = document.getElementById('timeChart').getContext('2d');
+        if (timeChart) timeChart.destroy();
+        timeChart = new Chart(timeCtx, {
+            type: 'line',
+            data: {
+                labels: data.charts.equation_names,
+                datasets: [{
+                    label: 'Time per Equation (seconds)',
+                    data: data.charts.times,
+                    backgroundColor: 'rgba(245, 87, 108, 0.2)',
+                    borderColor: '#f5576c',
+                    borderWidth: 3,
+                    tension: 0.4,
+                    fill: true
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: true,
+                plugins: {
+                    legend: { display: true }
+                },
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        title: { display: true, text: 'Time (seconds)' }
+                    }
+                }
+            }
+        });
+    }
+
+    showPage('progressPage');
+}
+
+// Allow Enter key to submit
+document.addEventListener('keypress', (e) => {
+    if (e.key === 'Enter') {
+        const activePage = document.querySelector('.page.active');
+        if (activePage.id === 'loginPage') login();
+        else if (activePage.id === 'equationPage') submitAnswer();
+    }
+});
@@ -0,0 +1,165 @@
+let currentEquationId = null;
+let currentStep = 0;
+let equationData = null;
+let graphData = null;
+let openingHints = null; // Hints for the step the equation opened on
+let chart = null;
+
+async function loadEquations() {
+    const response = await fetch('/linear/equations');
+    const data = await response.json();
+
+    const grid = document.getElementById('equationGrid');
+    grid.innerHTML = '';
+
+    data.equations.forEach(eq => {
+        const card = document.createElement('div');
+        card.className = `equation-card ${eq.status}`;
+        card.innerHTML = `
+            <h3>${eq.expression}</h3>
+            <p>Attempts: ${eq.attempts}</p>
+            ${eq.time > 0 ? `<p>Time: ${eq.time}s</p>` : ''}
+        `;
+
+        if (eq.status !== 'locked') {
+            card.onclick = () => openEquation(eq.id);
+        }
+
+        grid.appendChild(card);
+    });
+}
+
+async function openEquation(id) {
+    currentEquationId = id;
+    // Equation, graph and first-step hints in one round trip
+    const response = await fetch(`/linear/bootstrap/${id}?fields=equation,graph,hints&series=compact`);
+    const bootstrap = await response.json();
+    equationData = bootstrap.equation;
+    graphData = decodeGraph(bootstrap.graph);
+    openingHints = bootstrap.hints;
+
+    document.getElementById('equationExpression').textContent = equationData.expression;
+    document.getElementById('stepInstruction').textContent = 'Step 1: What is the constant term?';
+    document.getElementById('progressText').style.display = 'none';
+    document.getElementById('answerInput').value = '';
+    document.getElementById('messageBox').innerHTML = '';
+    document.getElementById('graphContainer').style.display = 'none';
+
+    currentStep = 0;
+    showPage('solverPage');
+}
+
+async function submitAnswer() {
+    const answer = document.getElementById('answerInput').value;
+    if (!answer) {
+        showMessage('Please enter an answer!', 'error');
+        return;
+    }
+
+    const response = await fetch('/linear/check_answer', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ answer })
+    });
+
+    const data = await response.json();
+
+    if (data.correct) {
+        showMessage(data.message, 'success');
+
+        if (data.completed) {
+            setTimeout(() => backToDashboard(), 2000);
+        } else {
+            currentStep = data.next_step;
+            updateStep(data.next_step, data.progress_text);
+            document.getElementById('answerInput').value = '';
+        }
+    } else {
+        showMessage(data.message, 'error');
+        if (data.hint) {
+            setTimeout(() => showMessage(`💡 ${data.hint}`, 'hint'), 1500);
+        }
+    }
+}
+
+function updateStep(step, progressText) {
+    const instructions = [
+        'Step 1: What is the constant term?',
+        'Step 2: What do you divide by?',
+        'Step 3: What is the value of x?'
+    ];
+
+    document.getElementById('stepInstruction').textContent = instructions[step];
+
+    if (progressText) {
+        const progressEl = document.getElementById('progressText');
+        progressEl.textContent = progressText;
+        progressEl.style.display = 'block';
+    }
+}
+
+async function getHint() {
+    if (openingHints && openingHints.step === currentStep) {
+        showMessage(`🎯 ${openingHints.hint}`, 'hint');
+        return;
+    }
+    const response = await fetch('/linear/hint');
+    const data = await response.json();
+    // Updated to show source of hint (Personalized or Default)
+    showMessage(`🎯 ${data.hint}`, 'hint');
+}
+
+async function showGraph() {
+    const data = graphData || await (await fetch(`/linear/graph_data/${currentEquationId}`)).json();
+
+    const container = document.getElementById('graphContainer');
+    container.style.display = 'block';
+
+    const ctx = document.getElementById('equationChart').getContext('2d');
+
+    if (chart) {
+        chart.destroy();
+    }
+
+    chart = new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: data.x_values,
+            datasets: [{
+                label: 'y = ' + equationData.expression.split('=')[0].trim(),
+                data: data.y_values,
+                borderColor: '#667eea',
+                backgroundColor: 'rgba(102, 126, 234, 0.1)',
+                tension: 0.1,
+                pointRadius: 3
+            }, {
+                label: 'Solution',
+                data: data.x_values.map(x => x === data.solution ? 0 : null),
+                borderColor: '#f5576c',
+                backgroundColor: '#f5576c',
+                pointRadius: 8,
+                pointStyle: 'star',
+                showLine: false
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: true,
+            plugins: {
+                legend: { display: true }
+            },
+            scales: {
+                x: { title: { display: true, text: 'x' } },
+                y: { title: { display: true, text: 'y' } }
+            }
+        }
+    });
+}
+
+document.addEventListener('keypress', (e) => {
+    if (e.key === 'Enter' && document.getElementById('solverPage').classList.contains('active')) {
+        submitAnswer();
+    }
+});
+
+loadEquations();
@@ -0,0 +1,22 @@
+async function login() {
+    const name = document.getElementById('studentName').value.trim();
+    if (!name) {
+        alert('Please enter your name!');
+        return;
+    }
+
+    const response = await fetch('/login', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ name })
+    });
+
+    if (response.ok) {
+        window.location.href = '/home';
+    }
+}
+
+// Allow Enter key to submit
+document.getElementById('studentName').addEventListener('keypress', (e) => {
+    if (e.key === 'Enter') login();
+});
@@ -0,0 +1,193 @@
+let linearAttemptsChart = null;
+let linearTimeChart = null;
+let quadraticAttemptsChart = null;
+let quadraticTimeChart = null;
+
+async function loadProgress() {
+    const response = await fetch('/progress/data');
+    const data = await response.json();
+
+    // Update student name
+    document.getElementById('studentName').textContent = `Welcome back, ${data.student_name}!`;
+
+    // Update statistics
+    const statsContainer = document.getElementById('statsContainer');
+    statsContainer.innerHTML = `
+        <div class="stat-card">
+            <h4>Total Completed</h4>
+            <p>${data.stats.completed}/${data.stats.total}</p>
+        </div>
+        <div class="stat-card">
+            <h4>Linear Completed</h4>
+            <p>${data.stats.linear_completed}/${data.stats.linear_total}</p>
+        </div>
+        <div class="stat-card">
+            <h4>Quadratic Completed</h4>
+            <p>${data.stats.quadratic_completed}/${data.stats.quadratic_total}</p>
+        </div>
+        <div class="stat-card">
+            <h4>Total Attempts</h4>
+            <p>${data.stats.total_attempts}</p>
+        </div>
+        <div class="stat-card">
+            <h4>Avg Attempts</h4>
+            <p>${data.stats.avg_attempts}</p>
+        </div>
+        <div class="stat-card">
+            <h4>Total Time</h4>
+            <p>${data.stats.total_time}s</p>
+        </div>
+        <div class="stat-card">
+            <h4>Avg Time</h4>
+            <p>${data.stats.avg_time}s</p>
+        </div>
+        <div class="stat-card">
+            <h4>Completion Rate</h4>
+            <p>${data.stats.accuracy}%</p>
+        </div>
+    `;
+
+    // Update achievements
+    const achievementsContainer = document.getElementById('achievementsContainer');
+    if (data.achievements.length > 0) {
+        achievementsContainer.innerHTML = data.achievements.map(ach => `
+            <div class="achievement-card">
+                <div class="icon">${ach.icon}</div>
+                <h4>${ach.name}</h4>
+                <p>${ach.description}</p>
+            </div>
+        `).join('');
+    } else {
+        achievementsContainer.innerHTML = '<div class="empty-state">Complete equations to unlock achievements! 🎯</div>';
+    }
+
+    // Update insights
+    const insightsContainer = document.getElementById('insightsContainer');
+    if (data.insights.length > 0) {
+        insightsContainer.innerHTML = data.insights.map(insight => `
+            <div class="insight-item">${insight}</div>
+        `).join('');
+    } else {
+        insightsContainer.innerHTML = '<div class="empty-state">Complete more equations to see personalized insights! 💡</div>';
+    }
+
+    // Draw linear charts
+    if (data.charts.linear.names.length > 0) {
+        document.getElementById('linearChartsContainer').style.display = 'block';
+
+        const linearAttemptsCtx = document.getElementById('linearAttemptsChart').getContext('2d');
+        if (linearAttemptsChart) linearAttemptsChart.destroy();
+        linearAttemptsChart = new Chart(linearAttemptsCtx, {
+            type: 'bar',
+            data: {
+                labels: data.charts.linear.names,
+                datasets: [{
+                    label: 'Attempts',
+                    data: data.charts.linear.attempts,
+                    backgroundColor: 'rgba(79, 172, 254, 0.7)',
+                    borderColor: '#4facfe',
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: true,
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        title: { display: true, text: 'Number of Attempts' }
+                    }
+                }
+            }
+        });
+
+        const linearTimeCtx = document.getElementById('linearTimeChart').getContext('2d');
+        if (linearTimeChart) linearTimeChart.destroy();
+        linearTimeChart = new Chart(linearTimeCtx, {
+            type: 'line',
+            data: {
+                labels: data.charts.linear.names,
+                datasets: [{
+                    label: 'Time (seconds)',
+                    data: data.charts.linear.times,
+                    backgroundColor: 'rgba(79, 172, 254, 0.2)',
+                    borderColor: '#4facfe',
+                    borderWidth: 3,
+                    tension: 0.4,
+                    fill: true
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: true,
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        title: { display: true, text: 'Time (seconds)' }
+                    }
+                }
+            }
+        });
+    }
+
+    // Draw quadratic charts
+    if (data.charts.quadratic.names.length > 0) {
+        document.getElementById('quadraticChartsContainer').style.display = 'block';
+
+        const quadraticAttemptsCtx = document.getElementById('quadraticAttemptsChart').getContext('2d');
+        if (quadraticAttemptsChart) quadraticAttemptsChart.destroy();
+        quadraticAttemptsChart = new Chart(quadraticAttemptsCtx, {
+            type: 'bar',
+            data: {
+                labels: data.charts.quadratic.names,
+                datasets: [{
+                    label: 'Attempts',
+                    data: data.charts.quadratic.attempts,
+                    backgroundColor: 'rgba(240, 147, 251, 0.7)',
+                    borderColor: '#f093fb',
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: true,
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        title: { display: true, text: 'Number of Attempts' }
+                    }
+                }
+            }
+        });
+
+        const quadraticTimeCtx = document.getElementById('quadraticTimeChart').getContext('2d');
+        if (quadraticTimeChart) quadraticTimeChart.destroy();
+        quadraticTimeChart = new Chart(quadraticTimeCtx, {
+            type: 'line',
+            data: {
+                labels: data.charts.quadratic.names,
+                datasets: [{
+                    label: 'Time (seconds)',
+                    data: data.charts.quadratic.times,
+                    backgroundColor: 'rgba(240, 147, 251, 0.2)',
+                    borderColor: '#f093fb',
+                    borderWidth: 3,
+                    tension: 0.4,
+                    fill: true
+                }]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: true,
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        title: { display: true, text: 'Time (seconds)' }
+                    }
+                }
+            }
+        });
+    }
+}
+
+loadProgress();
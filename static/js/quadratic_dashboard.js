@@ -0,0 +1,279 @@
+let currentEquationId = null;
+let currentStepData = null;
+let equationData = null;
+let graphData = null;
+let openingHints = null; // Hints for the step the equation opened on
+let chart = null;
+let sessionData = {}; // Store a, b, c, ac, factors
+let stepExpressions = {}; // Store step expressions from ontology
+
+async function loadEquations() {
+    const response = await fetch('/quadratic/equations');
+    const data = await response.json();
+
+    const grid = document.getElementById('equationGrid');
+    grid.innerHTML = '';
+
+    data.equations.forEach(eq => {
+        const card = document.createElement('div');
+        card.className = `equation-card ${eq.status}`;
+        card.innerHTML = `
+            <h3>${eq.expression}</h3>
+            <p>Attempts: ${eq.attempts}</p>
+            ${eq.time > 0 ? `<p>Time: ${eq.time}s</p>` : ''}
+        `;
+
+        if (eq.status !== 'locked') {
+            card.onclick = () => openEquation(eq.id);
+        }
+
+        grid.appendChild(card);
+    });
+}
+
+async function openEquation(id) {
+    currentEquationId = id;
+    sessionData = {}; // Reset
+
+    // Equation, graph and first-step hints in one round trip
+    const response = await fetch(`/quadratic/bootstrap/${id}?fields=equation,graph,hints&series=compact`);
+    const bootstrap = await response.json();
+    equationData = bootstrap.equation;
+    graphData = decodeGraph(bootstrap.graph);
+    openingHints = bootstrap.hints;
+
+    // Store step expressions from ontology
+    stepExpressions = {
+        step4: equationData.step4_expression || '',
+        step5: equationData.step5_expression || '',
+        step6: equationData.step6_expression || ''
+    };
+
+    document.getElementById('equationExpression').textContent = equationData.expression;
+    currentStepData = equationData.current_step;
+
+    updateStepDisplay();
+    document.getElementById('messageBox').innerHTML = '';
+    document.getElementById('graphContainer').style.display = 'none';
+
+    showPage('solverPage');
+}
+
+function updateStepDisplay() {
+    const stepInstruction = document.getElementById('stepInstruction');
+    const progressLabel = document.getElementById('progressLabel');
+    const inputArea = document.getElementById('inputArea');
+
+    stepInstruction.textContent = currentStepData.instruction;
+    progressLabel.style.display = 'none';
+    inputArea.innerHTML = '';
+
+    // Show progress labels based on step
+    if (currentStepData.id === 3 && sessionData.ac !== undefined) {
+        progressLabel.innerHTML = `After calculating: ac = ${sessionData.ac}, b = ${sessionData.b}`;
+        progressLabel.style.display = 'block';
+    } else if (currentStepData.id === 4 && stepExpressions.step4) {
+        // Use expression from ontology for step 4
+        progressLabel.innerHTML = `Split middle term: ${stepExpressions.step4}`;
+        progressLabel.style.display = 'block';
+    } else if (currentStepData.id === 5 && stepExpressions.step5) {
+        // Use expression from ontology for step 5
+        progressLabel.innerHTML = `Factor by grouping: ${stepExpressions.step5}`;
+        progressLabel.style.display = 'block';
+    } else if (currentStepData.id === 6 && stepExpressions.step6) {
+        // Use expression from ontology for step 6
+        progressLabel.innerHTML = `Factored equation: ${stepExpressions.step6}`;
+        progressLabel.style.display = 'block';
+    }
+
+    // Create input fields based on step
+    if (currentStepData.input_type === 'three_numbers') {
+        inputArea.innerHTML = `
+            <div class="three-inputs">
+                <div class="input-group">
+                    <label>a =</label>
+                    <input type="number" id="input_a" placeholder="a">
+                </div>
+                <div class="input-group">
+                    <label>b =</label>
+                    <input type="number" id="input_b" placeholder="b">
+                </div>
+                <div class="input-group">
+                    <label>c =</label>
+                    <input type="number" id="input_c" placeholder="c">
+                </div>
+            </div>
+        `;
+    } else if (currentStepData.input_type === 'two_numbers') {
+        const label1 = currentStepData.id === 6 ? 'x =' : 'First number';
+        const label2 = currentStepData.id === 6 ? 'x =' : 'Second number';
+        inputArea.innerHTML = `
+            <div class="two-inputs">
+                <div class="input-group">
+                    <label>${label1}</label>
+                    <input type="number" id="input_num1" placeholder="${label1}" step="0.01">
+                </div>
+                <div class="input-group">
+                    <label>${label2}</label>
+                    <input type="number" id="input_num2" placeholder="${label2}" step="0.01">
+                </div>
+            </div>
+        `;
+    } else if (currentStepData.input_type === 'number') {
+        inputArea.innerHTML = `
+            <input type="number" id="input_answer" placeholder="Enter your answer">
+        `;
+    } else if (currentStepData.input_type === 'text') {
+        inputArea.innerHTML = `
+            <input type="text" id="input_answer" placeholder="Enter your work">
+        `;
+    }
+}
+
+async function submitAnswer() {
+    let payload = {};
+
+    if (currentStepData.input_type === 'three_numbers') {
+        payload = {
+            a: document.getElementById('input_a').value,
+            b: document.getElementById('input_b').value,
+            c: document.getElementById('input_c').value
+        };
+    } else if (currentStepData.input_type === 'two_numbers') {
+        if (currentStepData.id === 6) {
+            payload = {
+                sol1: document.getElementById('input_num1').value,
+                sol2: document.getElementById('input_num2').value
+            };
+        } else {
+            payload = {
+                num1: document.getElementById('input_num1').value,
+                num2: document.getElementById('input_num2').value
+            };
+        }
+    } else {
+        payload = { answer: document.getElementById('input_answer').value };
+    }
+
+    const response = await fetch('/quadratic/check_answer', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(payload)
+    });
+
+    const data = await response.json();
+
+    if (data.correct) {
+        showMessage(data.message, 'success');
+
+        // Store session data for labels
+        if (currentStepData.id === 1) {
+            sessionData.a = parseInt(payload.a);
+            sessionData.b = parseInt(payload.b);
+            sessionData.c = parseInt(payload.c);
+        } else if (currentStepData.id === 2) {
+            sessionData.ac = parseInt(payload.answer);
+        } else if (currentStepData.id === 3) {
+            sessionData.factor1 = parseInt(payload.num1);
+            sessionData.factor2 = parseInt(payload.num2);
+        }
+
+        if (data.completed) {
+            setTimeout(() => backToDashboard(), 2500);
+        } else {
+            currentStepData = data.next_step;
+            setTimeout(() => {
+                updateStepDisplay();
+                document.getElementById('messageBox').innerHTML = '';
+            }, 1500);
+        }
+    } else {
+        showMessage(data.message, 'error');
+        if (data.hint) {
+            setTimeout(() => showMessage(`💡 ${data.hint}`, 'hint'), 1500);
+        }
+    }
+}
+
+async function getHint() {
+    if (openingHints && currentStepData && openingHints.step === currentStepData.id) {
+        showMessage(`🎯 ${openingHints.hint}`, 'hint');
+        return;
+    }
+    const response = await fetch('/quadratic/hint');
+    const data = await response.json();
+    showMessage(`🎯 ${data.hint}`, 'hint');
+}
+
+async function showGraph() {
+    const data = graphData || await (await fetch(`/quadratic/graph_data/${currentEquationId}`)).json();
+
+    const container = document.getElementById('graphContainer');
+    container.style.display = 'block';
+
+    const ctx = document.getElementById('equationChart').getContext('2d');
+
+    if (chart) {
+        chart.destroy();
+    }
+
+    const datasets = [{
+        label: 'Quadratic Function',
+        data: data.y_values,
+        borderColor: '#f093fb',
+        backgroundColor: 'rgba(240, 147, 251, 0.1)',
+        tension: 0.4,
+        pointRadius: 2
+    }];
+
+    if (data.solution1 !== null) {
+        datasets.push({
+            label: `x = ${data.solution1}`,
+            data: data.x_values.map(x => Math.abs(x - data.solution1) < 0.1 ? 0 : null),
+            borderColor: '#f5576c',
+            backgroundColor: '#f5576c',
+            pointRadius: 8,
+            pointStyle: 'star',
+            showLine: false
+        });
+    }
+
+    if (data.solution2 !== null && data.solution2 !== data.solution1) {
+        datasets.push({
+            label: `x = ${data.solution2}`,
+            data: data.x_values.map(x => Math.abs(x - data.solution2) < 0.1 ? 0 : null),
+            borderColor: '#4facfe',
+            backgroundColor: '#4facfe',
+            pointRadius: 8,
+            pointStyle: 'star',
+            showLine: false
+        });
+    }
+
+    chart = new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: data.x_values,
+            datasets: datasets
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: true,
+            plugins: {
+                legend: { display: true }
+            },
+            scales: {
+                x: { title: { display: true, text: 'x' } },
+                y: { title: { display: true, text: 'y' } }
+            }
+        }
+    });
+}
+
+document.addEventListener('keypress', (e) => {
+    if (e.key === 'Enter' && document.getElementById('solverPage').classList.contains('active')) {
+        submitAnswer();
+    }
+});
+
+loadEquations();
@@ -4,20 +4,18 @@ Run this to check if your ontology hints are working
 """
 from utils.ontology_loader import get_quadratic_equations, get_hints
 
-# Load equations
+# Load equations and read each one's hints once
 equations = get_quadratic_equations()
+hints_by_equation = [get_hints(eq) for eq in equations]
 
 print("=" * 60)
 print("TESTING ONTOLOGY HINTS")
 print("=" * 60)
 
-for i, eq in enumerate(equations):
+for i, (eq, hints) in enumerate(zip(equations, hints_by_equation)):
     print(f"\n📝 Equation {i+1}: {eq.name}")
     print("-" * 60)
 
-    # Get hints
-    hints = get_hints(eq)
-
     # Check each hint
     hint_steps = ['step1', 'step2', 'step3', 'step4', 'step5', 'solution']
 
@@ -35,7 +33,7 @@ print("=" * 60)
 # Count missing hints
 total_hints = len(equations) * 6
 missing_hints = sum(
-    1 for eq in equations for step in hint_steps if not get_hints(eq).get(step))
+    1 for hints in hints_by_equation for step in hint_steps if not hints.get(step))
 
 if missing_hints == 0:
     print("✅ ALL HINTS LOADED FROM ONTOLOGY!")
@@ -46,3 +44,5 @@ else:
     print(f"\n   Make sure all equations have these object properties:")
     print(f"   - hasHintStep1, hasHintStep2, hasHintStep3")
     print(f"   - hasHintStep4, hasHintStep5, hasHintSolution")
+
+print("\nFor a full consistency check run: python validate_ontology.py")
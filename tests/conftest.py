@@ -0,0 +1,17 @@
+import pytest
+
+from app import create_app
+
+
+@pytest.fixture(scope='session')
+def app():
+    with pytest.MonkeyPatch.context() as mp:
+        # Progress stays in the session; nothing is written under instance/
+        mp.setenv('PROGRESS_DB_PATH', '')
+        mp.setenv('SESSION_BACKEND', 'memory')
+        yield create_app(watch=False)
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,39 @@
+import pytest
+
+
+@pytest.fixture
+def admin_config(app, monkeypatch):
+    def configure(token=None, local_access=True):
+        monkeypatch.setitem(app.config, 'ADMIN_TOKEN', token)
+        monkeypatch.setitem(app.config, 'ADMIN_LOCAL_ACCESS', local_access)
+    return configure
+
+
+def status(client, remote_addr='127.0.0.1', **headers):
+    return client.get('/admin/ontology', headers=headers,
+                      environ_base={'REMOTE_ADDR': remote_addr}).status_code
+
+
+def test_local_calls_allowed_without_token(client, admin_config):
+    admin_config()
+    assert status(client) == 200
+    assert status(client, '::1') == 200
+    assert status(client, '10.0.0.5') == 403
+
+
+@pytest.mark.parametrize('header', ['X-Forwarded-For', 'Forwarded', 'X-Real-IP'])
+def test_proxied_calls_are_not_local(client, admin_config, header):
+    admin_config()
+    assert status(client, **{header: '203.0.113.7'}) == 403
+
+
+def test_production_needs_the_token(client, admin_config):
+    admin_config(local_access=False)
+    assert status(client) == 403
+
+
+def test_token_is_checked_wherever_the_call_comes_from(client, admin_config):
+    admin_config(token='secret', local_access=False)
+    assert status(client, '10.0.0.5', **{'X-Admin-Token': 'secret', 'X-Forwarded-For': '203.0.113.7'}) == 200
+    assert status(client, **{'X-Admin-Token': 'wrong'}) == 403
+    assert status(client) == 403
@@ -0,0 +1,79 @@
+import sys
+
+import pytest
+
+from utils.asgi_bridge import build_environ, call_wsgi
+
+
+def scope(path, raw_path=None, root_path='', query_string=b''):
+    return {'type': 'http', 'method': 'GET', 'path': path, 'raw_path': raw_path,
+            'root_path': root_path, 'query_string': query_string, 'headers': []}
+
+
+def test_path_info_is_decoded():
+    environ = build_environ(scope('/linear/equation/uid/7', raw_path=b'/linear/equation/uid/%37'), b'')
+    assert environ['PATH_INFO'] == '/linear/equation/uid/7'
+
+
+def test_non_ascii_path_is_utf8_as_latin1():
+    environ = build_environ(scope('/é x', raw_path=b'/%C3%A9%20x'), b'')
+    assert environ['PATH_INFO'] == '/é x'.encode('utf-8').decode('latin-1')
+
+
+def test_root_path_moves_to_script_name():
+    environ = build_environ(scope('/tutor/linear/equations', root_path='/tutor',
+                                  query_string=b'a=1'), b'')
+    assert (environ['SCRIPT_NAME'], environ['PATH_INFO'], environ['QUERY_STRING']) == \
+        ('/tutor', '/linear/equations', 'a=1')
+
+
+def test_encoded_route_reaches_flask(app):
+    environ = build_environ(dict(scope('/linear/equation/uid/0', raw_path=b'/linear/equation/%75id/0'),
+                                 server=('localhost', 80), client=('127.0.0.1', 1)), b'')
+    with app.request_context(environ) as ctx:
+        assert ctx.request.url_rule.rule == '/linear/equation/uid/<int:uid>'
+
+
+def test_write_callable_output_is_kept():
+    def app(environ, start_response):
+        write = start_response('200 OK', [('Content-Type', 'text/plain')])
+        write(b'written ')
+        return [b'and returned']
+
+    assert call_wsgi(app, {}) == (200, [(b'Content-Type', b'text/plain')], b'written and returned')
+
+
+def test_error_before_output_replaces_the_response():
+    def app(environ, start_response):
+        start_response('200 OK', [])
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            start_response('500 Internal Server Error', [], sys.exc_info())
+        return [b'error page']
+
+    assert call_wsgi(app, {}) == (500, [], b'error page')
+
+
+def test_error_after_output_is_raised():
+    def app(environ, start_response):
+        start_response('200 OK', [])
+        yield b'partial'
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            start_response('500 Internal Server Error', [], sys.exc_info())
+        yield b'never sent'
+
+    with pytest.raises(ValueError, match="boom"):
+        call_wsgi(app, {})
+
+
+def test_second_start_response_needs_exc_info():
+    def app(environ, start_response):
+        start_response('200 OK', [])
+        start_response('404 Not Found', [])
+        return []
+
+    with pytest.raises(AssertionError):
+        call_wsgi(app, {})
@@ -0,0 +1,58 @@
+import pytest
+
+GOOD_PROGRESS = {"v": 3, "ids": [0], "status": [2], "attempts": [1], "time": [3.0],
+                 "agg": [1, 1, 3.0, 1, 3.0]}
+
+# Steps 1-3 of the first quadratic, x² + 3x - 10 = 0
+FIRST_STEPS = [
+    {"type": "quadratic", "equation_id": 0, "step": 1, "a": 1, "b": 3, "c": -10},
+    {"type": "quadratic", "equation_id": 0, "step": 2, "answer": -10},
+    {"type": "quadratic", "equation_id": 0, "step": 3, "num1": 5, "num2": -2},
+]
+
+
+def grade(client, **payload):
+    response = client.post('/batch/check_answers', json=payload)
+    assert response.status_code == 200
+    return response.get_json()
+
+
+@pytest.mark.parametrize('answer', [5, None, ["x"], {"x": 1}])
+def test_written_step_answers_must_be_text(client, answer):
+    results = grade(client, answers=FIRST_STEPS + [
+        {"type": "quadratic", "equation_id": 0, "step": 4, "answer": answer},
+        {"type": "quadratic", "equation_id": 0, "step": 4, "answer": "x² + 5x - 2x - 10 = 0"},
+    ])['results']
+    assert [r['success'] for r in results] == [True] * 3 + [answer is None, True]
+    assert results[-1]['correct']
+
+
+@pytest.mark.parametrize('student, message', [
+    ("nope", "Each student must be an object"),
+    ({"answers": "x"}, "answers must be a list"),
+    ({"progress": "x"}, "progress must be an object"),
+    ({"progress": {"linear": [1]}}, "linear progress is malformed"),
+    ({"progress": {"linear": {"v": 3, "ids": [0]}}}, "linear progress is malformed"),
+    ({"progress": {"quadratic": dict(GOOD_PROGRESS, ids=[5], status=[9])}}, "quadratic progress is malformed"),
+    ({"progress": {"linear": dict(GOOD_PROGRESS, attempts=["1"])}}, "linear progress is malformed"),
+    ({"performance_level": [1]}, "performance_level must be a string"),
+])
+def test_malformed_student_is_reported_alone(client, student, message):
+    good = {"student_id": "ok", "progress": {"linear": GOOD_PROGRESS}, "answers": FIRST_STEPS[:1]}
+    graded = grade(client, students=[student, good])['students']
+    assert graded[0] == {"index": 0, "student_id": None, "success": False, "message": message}
+    assert graded[1]['results'][0]['correct']
+    assert graded[1]['progress']['linear'] == GOOD_PROGRESS
+
+
+def test_non_object_body_is_an_empty_batch(client):
+    response = client.post('/batch/check_answers', json=[1])
+    assert response.status_code == 200
+    assert response.get_json()['results'] == []
+
+
+@pytest.mark.parametrize('agg', [[50, 50, 900.0, 50, 0.1], ["a", 1, 2, 3, 4], None])
+def test_client_aggregates_are_recomputed(client, agg):
+    forged = dict(GOOD_PROGRESS, agg=agg)
+    graded = grade(client, students=[{"progress": {"linear": forged}}])['students']
+    assert graded[0]['progress']['linear']['agg'] == GOOD_PROGRESS['agg']
@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+from utils.expression_checker import (
+    MAX_INPUT_LENGTH, MAX_NESTING, ExpressionError, check_step, parse_expression,
+)
+
+FACTORED = '(x + 5)(x - 2) = 0'
+
+
+@pytest.mark.parametrize('answer', [
+    '(x+5)(x-2)=0',
+    '(x - 2)(x + 5) = 0',
+    '0 = (x + 5)(x - 2)',
+    '-(x + 5)(x - 2) = 0',
+    '2(x + 5)(x - 2) = 0',
+    '((x + 5)(x - 2)) = 0',
+    '(x + 5) * (x - 2) = 0',
+])
+def test_equivalent_factored_forms_are_accepted(answer):
+    assert check_step(answer, FACTORED, min_factors=2) == (True, None)
+
+
+def test_repeated_factor_counts_twice():
+    assert check_step('(x + 5)^2 = 0', 'x^2 + 10x + 25 = 0', min_factors=2) == (True, None)
+
+
+def test_different_equation_is_not_equivalent():
+    assert check_step('(x + 5)(x - 3) = 0', FACTORED, min_factors=2) == (False, 'not_equivalent')
+
+
+@pytest.mark.parametrize('answer', [
+    'x^2 + 3x - 10 = 0',
+    'x*x + 3x - 10 = 0',
+    'x(x + 3) - 10 = 0',
+    'x(x + 3) = 10',
+    '(x + 5)(x - 2) + 0x = 0',
+])
+def test_factored_form_must_be_one_product(answer):
+    assert check_step(answer, FACTORED, min_factors=2) == (False, 'shape')
+
+
+def test_expanded_form_needs_the_terms_written_out():
+    target = '2x(x - 1) - 6(x - 1) = 0'
+    assert check_step('2x(x - 1) - 6(x - 1) = 0', target, min_terms=2) == (True, None)
+    assert check_step('2x^2 - 8x + 6 = 0', target, min_terms=3) == (True, None)
+    assert check_step('(x - 1)(2x - 6) = 0', target, min_terms=2) == (False, 'shape')
+
+
+@pytest.mark.parametrize('answer', [
+    '',
+    '(x + 5',
+    'x + 5)',
+    'x + y = 0',
+    'x^x = 0',
+    'x = 1 = 2',
+    'x' * (MAX_INPUT_LENGTH + 1),
+    '(' * 199 + 'x',
+    '(' * (MAX_NESTING + 1) + 'x' + ')' * (MAX_NESTING + 1) + ' = 0',
+])
+def test_malformed_input_is_unreadable(answer):
+    assert check_step(answer, FACTORED, min_factors=2) == (False, 'unreadable')
+
+
+def test_nesting_up_to_the_limit_is_parsed():
+    answer = '(' * MAX_NESTING + 'x' + ')' * MAX_NESTING
+    assert parse_expression(answer).coeffs == parse_expression('x').coeffs
+    with pytest.raises(ExpressionError):
+        parse_expression('(' + answer + ')')
+
+
+def test_long_runs_of_signs_do_not_recurse():
+    assert check_step('-' * 190 + 'x = 0', 'x = 0') == (True, None)
+
+
+@pytest.mark.parametrize('answer', [
+    'x(x + 5) - 2(x + 5) = 0',
+    '(x + 5)x - 2(x + 5) = 0',
+    'x(x - 2) + 5(x - 2) = 0',
+])
+def test_grouped_form_shares_a_factor(answer):
+    assert check_step(answer, 'x(x + 5) - 2(x + 5) = 0', min_factors=2) == (True, None)
+
+
+def test_cancelling_terms_have_no_factors():
+    assert parse_expression('x(x + 1) - x(x + 1)').factors == 0
+
+
+@pytest.mark.parametrize('answer', [
+    '2^99999999 = x',
+    '(2^12)^99999999 = 0',
+    '9^9^9^9 = 0',
+    '(' * 12 + '2^12' + ')^12' * 12 + ' = 0',
+])
+def test_huge_constant_powers_are_rejected_quickly(answer):
+    start = time.perf_counter()
+    assert check_step(answer, FACTORED, min_factors=2) == (False, 'unreadable')
+    assert time.perf_counter() - start < 0.5
+
+
+def test_constant_powers_within_the_limit():
+    assert parse_expression('2^12 x = 0').coeffs == parse_expression('x = 0').coeffs
@@ -0,0 +1,23 @@
+from utils.factor_pairs import get_factor_index, pair_feedback
+
+
+def test_right_pair_has_no_feedback():
+    assert pair_feedback(-10, 3, 5, -2) == (None, None)
+    assert pair_feedback(-10, 3, -2, 5) == (None, None)
+
+
+def test_right_product_wrong_sum():
+    message, closest = pair_feedback(-10, 3, -5, 2)
+    assert message == "-5 × 2 = -10, but -5 + 2 = -3, not 3."
+    assert closest is None
+
+
+def test_wrong_product_names_a_nearby_pair():
+    message, closest = pair_feedback(-10, 3, 4, -2)
+    assert message.startswith("4 × -2 = -8, not -10.")
+    assert closest is not None and closest != (-2, 5)
+    assert closest[0] * closest[1] == -10
+
+
+def test_index_grows_for_large_products():
+    assert get_factor_index(5000).pair_for(5000, 150) == (50, 100)
@@ -0,0 +1,46 @@
+import pytest
+
+from utils.graph_sampler import (
+    MAX_ABS_X, MAX_SAMPLES, MAX_SPAN, _default_graph, encode_series, graph_for,
+)
+
+
+@pytest.mark.parametrize('x_min, x_max', [
+    (1e308, -1e308),
+    (-1e308, 1e308),
+    (-1e308, None),
+    (None, 1e308),
+])
+def test_extreme_domains_are_clamped(x_min, x_max):
+    x, y = graph_for((1, 2), [-2], x_min=x_min, x_max=x_max)
+    assert 2 <= len(x) <= MAX_SAMPLES
+    assert -MAX_ABS_X <= x[0] < x[-1] <= MAX_ABS_X
+    assert x[-1] - x[0] <= MAX_SPAN
+
+
+def test_default_resolution_follows_the_clamped_span():
+    x, _ = graph_for((1, 0, 0), [0], x_min=-1e308, x_max=1e308)
+    assert len(x) == MAX_SAMPLES
+    x, _ = graph_for((1, 2), [-2])
+    assert (x[0], x[-1], len(x)) == (-12.0, 8.0, 21)
+
+
+def test_graph_route_clamps_extreme_domains(client):
+    response = client.get('/linear/graph_data/0?x_min=1e308&x_max=-1e308')
+    assert response.status_code == 200
+
+
+def test_only_default_windows_are_memoized():
+    assert graph_for((1, 2, 3), [-1]) is graph_for((1, 2, 3), [-1])
+    cached = _default_graph.cache_info().currsize
+    for n in range(50):
+        graph_for((1, 2, 3), [-1], x_min=n / 7, x_max=n + 5.5)
+    assert _default_graph.cache_info().currsize == cached
+
+
+def test_compact_graph_matches_encoded_samples():
+    x, y = graph_for((1, 2, 3), [-1])
+    assert graph_for((1, 2, 3), [-1], compact=True) == (encode_series(x), encode_series(y))
+    x, y = graph_for((1, 2, 3), [-1], x_min=-3, x_max=3, samples=13)
+    assert graph_for((1, 2, 3), [-1], x_min=-3, x_max=3, samples=13, compact=True) == \
+        (encode_series(x), encode_series(y))
@@ -0,0 +1,53 @@
+from utils.equation_generator import generate_data, student_seed
+from utils.ontology_loader import get_catalog
+
+
+def login(client, name='Ann'):
+    client.post('/login', json={'name': name})
+
+
+def test_practice_equation_is_stable_per_student(client, app):
+    login(client)
+    first = client.get('/practice/linear/easy/3').get_json()
+    assert client.get('/practice/linear/easy/3').get_json() == first
+    assert first['uid'] == 'gen:linear:easy:3' and first['generated']
+
+    other = app.test_client()
+    login(other, 'Bob')
+    streams = [[c.get(f'/practice/linear/easy/{n}').get_json()['expression'] for n in range(5)]
+               for c in (client, other)]
+    assert streams[0] != streams[1]
+
+
+def test_generated_uids_never_match_catalog_uids(client):
+    catalog = get_catalog()
+    uid = client.get('/practice/quadratic/hard/0').get_json()['uid']
+    assert catalog.by_uid(uid) is None
+
+
+def test_unknown_type_or_tier(client):
+    assert client.get('/practice/cubic/easy/0').status_code == 404
+    assert client.get('/practice/linear/extreme/0').status_code == 404
+
+
+def test_check_needs_a_practice_equation(app):
+    assert app.test_client().post('/practice/check_answer', json={}).status_code == 400
+
+
+def test_solving_practice_leaves_progress_alone(client):
+    login(client)
+    before = client.get('/linear/equations').get_json()
+    client.get('/practice/linear/medium/7')
+    data = generate_data('linear', 'medium', student_seed('ann', 'linear', 'medium'), 7)
+    for answer in (data['constant'], data['coefficient'], int(data['solution'])):
+        result = client.post('/practice/check_answer', json={'answer': answer}).get_json()
+        assert result['correct']
+    assert result['completed']
+    assert client.get('/linear/equations').get_json() == before
+
+
+def test_catalog_routes_do_not_grade_practice(client):
+    login(client)
+    client.get('/practice/quadratic/easy/0')
+    result = client.post('/quadratic/check_answer', json={'a': 1, 'b': 1, 'c': 1}).get_json()
+    assert result == {"success": False, "message": "This equation is no longer available"}
@@ -0,0 +1,35 @@
+from utils.progress_model import ProgressTable, Status
+
+
+def aggregates(table):
+    return (table.completed, table.total_attempts, table.total_time, table.first_try, table.fastest)
+
+
+def recomputed(table):
+    return ProgressTable._aggregate(table._entries)
+
+
+def test_running_aggregates_match_a_recount():
+    table = ProgressTable()
+    table.complete(0, 12.0)
+    table.complete(0, 20.0)
+    table.complete(1, 5.0)
+    table.unlock(2)
+    assert aggregates(table) == recomputed(table) == (2, 3, 25.0, 1, 5.0)
+
+
+def test_completing_a_row_not_yet_completed_keeps_first_try():
+    # Legacy payloads can hold an attempt on a row that was never completed
+    table = ProgressTable({0: [Status.UNLOCKED, 1, 0]})
+    table.complete(0, 8.0)
+    assert aggregates(table) == recomputed(table)
+    assert table.first_try == 0
+
+
+def test_client_aggregates_can_be_ignored():
+    data = {"v": 3, "ids": [0], "status": [2], "attempts": [1], "time": [4.0],
+            "agg": [50, 50, 900.0, 50, 0.1]}
+    trusted = ProgressTable.from_json(data, {0: 0})
+    assert trusted.completed == 50
+    table = ProgressTable.from_json(data, {0: 0}, trust_aggregates=False)
+    assert aggregates(table) == (1, 1, 4.0, 1, 4.0)
@@ -0,0 +1,125 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from utils.progress_store import ProgressStore
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'progress.sqlite3')
+
+
+@pytest.fixture
+def open_store(db_path):
+    stores = []
+
+    def factory():
+        # Flushes only when a test asks for one
+        store = ProgressStore(db_path, flush_interval=3600)
+        stores.append(store)
+        return store
+
+    yield factory
+    for store in stores:
+        store.close()
+
+
+def rows(db_path):
+    db = sqlite3.connect(db_path)
+    try:
+        return {(student, eq_type): json.loads(data) for student, eq_type, data in
+                db.execute("SELECT student, eq_type, data FROM progress")}
+    finally:
+        db.close()
+
+
+def journals(db_path):
+    return sorted(os.listdir(f"{db_path}.journal"))
+
+
+def test_put_is_journaled_until_flushed(db_path, open_store):
+    store = open_store()
+    store.put('Ann', 'linear', {"n": 1})
+    assert rows(db_path) == {}
+    assert len(journals(db_path)) == 1
+
+    store.flush()
+    assert rows(db_path) == {('ann', 'linear'): {"n": 1}}
+    assert journals(db_path) == []
+
+
+def test_get_sees_unflushed_writes(open_store):
+    store = open_store()
+    store.put(' ANN ', 'linear', {"n": 1})
+    assert store.get('ann') == {'linear': {"n": 1}}
+    assert store.get('') == {}
+
+
+def test_get_reads_writes_from_other_processes(open_store):
+    worker_a, worker_b = open_store(), open_store()
+    worker_a.put('Ann', 'linear', {"n": 1})
+    worker_a.flush()
+    assert worker_a.get('Ann') == {'linear': {"n": 1}}
+
+    worker_b.put('Ann', 'linear', {"n": 2})
+    worker_b.flush()
+    assert worker_a.get('Ann') == {'linear': {"n": 2}}
+
+
+def test_older_unflushed_write_loses_to_newer_row(db_path, open_store):
+    worker_a, worker_b = open_store(), open_store()
+    worker_a.put('Ann', 'linear', {"n": 1})
+    worker_b.put('Ann', 'linear', {"n": 2})
+    worker_b.flush()
+    assert worker_a.get('Ann') == {'linear': {"n": 2}}
+
+    # The upsert keeps the newest write even when the older one lands last
+    worker_a.flush()
+    assert rows(db_path) == {('ann', 'linear'): {"n": 2}}
+
+
+def test_replay_writes_orphaned_journals(db_path, open_store):
+    open_store().close()
+    with open(os.path.join(f"{db_path}.journal", '1-1-1.log'), 'w') as f:
+        f.write(json.dumps(['ann', 'linear', 1.0, {"n": 1}]) + '\n')
+        f.write(json.dumps(['ann', 'linear', 2.0, {"n": 2}]) + '\n')
+        f.write(json.dumps(['bob', 'quadratic', 1.0, {"n": 3}]) + '\n')
+        f.write('["ann", "linear", 3.0, {"n"')  # cut short by the crash
+
+    open_store()
+    assert rows(db_path) == {('ann', 'linear'): {"n": 2}, ('bob', 'quadratic'): {"n": 3}}
+    assert journals(db_path) == []
+
+
+def test_replay_skips_journals_of_live_processes(db_path, open_store):
+    live = open_store()
+    live.put('Ann', 'linear', {"n": 1})
+
+    open_store()
+    assert rows(db_path) == {}
+    assert len(journals(db_path)) == 1
+
+    live.flush()
+    assert rows(db_path) == {('ann', 'linear'): {"n": 1}}
+
+
+def test_failed_flush_is_retried(db_path, open_store, monkeypatch):
+    store = open_store()
+    store.put('Ann', 'linear', {"n": 1})
+
+    def broken():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(store, '_connect', broken)
+    store.flush()
+    assert len(journals(db_path)) == 1
+
+    # A newer write made meanwhile is not undone by the retry
+    store.put('Ann', 'linear', {"n": 2})
+    monkeypatch.undo()
+    store.flush()
+    assert rows(db_path) == {('ann', 'linear'): {"n": 2}}
+    assert journals(db_path) == []
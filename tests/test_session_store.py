@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from utils.session_store import SQLiteSessionBackend
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs os.fork")
+def test_forked_child_opens_its_own_connection(tmp_path):
+    backend = SQLiteSessionBackend(str(tmp_path / 'sessions.sqlite3'))
+    parent_db = backend._connect()
+    backend.save('parent', '{}')
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            ok = backend._connect() is not parent_db and backend.load('parent', 60) == '{}'
+            backend.save('child', '{}')
+            os.write(write, b'1' if ok else b'0')
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read, 1) == b'1'
+    assert backend._connect() is parent_db
+    assert backend.load('child', 60) == '{}'
+
+
+def test_setup_connection_is_not_kept(tmp_path):
+    backend = SQLiteSessionBackend(str(tmp_path / 'sessions.sqlite3'))
+    assert backend._pid is None
@@ -0,0 +1,30 @@
+import hashlib
+import json
+
+from utils.static_assets import VENDOR_ASSETS, VENDOR_LOCK, asset_url, check_vendor_assets
+
+NAME = 'vendor/chart.umd.js'
+
+
+def vendored(tmp_path, content=b'/*! Chart.js v4.4.1 */', recorded=None):
+    static_dir = tmp_path / 'static'
+    (static_dir / 'vendor').mkdir(parents=True)
+    (static_dir / NAME).write_bytes(content)
+    digest = hashlib.sha256(recorded if recorded is not None else content).hexdigest()
+    (tmp_path / VENDOR_LOCK).write_text(json.dumps({NAME: {"url": VENDOR_ASSETS[NAME], "sha256": digest}}))
+    return str(static_dir)
+
+
+def test_vendored_file_matching_the_lock(tmp_path):
+    assert check_vendor_assets(vendored(tmp_path)) == []
+
+
+def test_missing_or_altered_files_are_reported(tmp_path):
+    assert check_vendor_assets(str(tmp_path / 'static')) == [f"static/{NAME} is missing"]
+    static_dir = vendored(tmp_path, recorded=b'something else')
+    assert check_vendor_assets(static_dir) == [f"static/{NAME} does not match {VENDOR_LOCK}"]
+
+
+def test_vendor_files_never_come_from_the_cdn(app):
+    with app.test_request_context():
+        assert asset_url(NAME).startswith('/')
@@ -0,0 +1,170 @@
+"""
+ASGI front end for the Flask app.
+
+The server's event loop holds the connections and reads request bodies, so
+an idle or slow client costs a coroutine, not a thread. Only a complete
+request is handed to the (synchronous) Flask app, on a bounded thread pool.
+This is where the CPU-bound work happens: step checking, graph sampling
+and progress analytics. The routes stay as they are and are shared with
+the WSGI entry point.
+"""
+import asyncio
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Request bodies are small JSON answers; refuse anything far larger
+MAX_BODY_BYTES = 1 << 20
+
+# read_body() results other than the body itself
+DISCONNECTED = object()
+TOO_LARGE = object()
+
+
+def build_environ(scope, body):
+    """WSGI environ for an ASGI HTTP scope (PEP 3333 strings are latin-1)."""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    # scope['path'] is already percent-decoded, as PATH_INFO must be;
+    # raw_path is not, so it is not used
+    path = scope['path']
+    root_path = scope.get('root_path', '')
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path.encode('utf-8').decode('latin-1'),
+        'PATH_INFO': path.encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for raw_name, raw_value in scope.get('headers', []):
+        name = raw_name.decode('latin-1').upper().replace('-', '_')
+        value = raw_value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+            continue
+        if name == 'CONTENT_LENGTH':
+            continue
+        key = f'HTTP_{name}'
+        if key in environ:
+            value = f"{environ[key]}{'; ' if name == 'COOKIE' else ','}{value}"
+        environ[key] = value
+    return environ
+
+
+def call_wsgi(wsgi_app, environ):
+    """Run one request through `wsgi_app`; returns (status, headers, body).
+
+    The body is buffered, including anything passed to the write callable.
+    Once the app has produced output its headers count as sent, so a later
+    start_response(..., exc_info) re-raises the error (PEP 3333).
+    """
+    response = {}
+    body = []
+
+    def start_response(status, headers, exc_info=None):
+        if exc_info is not None:
+            try:
+                if body:
+                    raise exc_info[1].with_traceback(exc_info[2])
+            finally:
+                exc_info = None
+        elif 'status' in response:
+            raise AssertionError("start_response called again without exc_info")
+        response['status'] = int(status.split(' ', 1)[0])
+        response['headers'] = [(name.encode('latin-1'), value.encode('latin-1'))
+                               for name, value in headers]
+        return body.append
+
+    chunks = wsgi_app(environ, start_response)
+    try:
+        for chunk in chunks:
+            body.append(chunk)
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+    return response['status'], response['headers'], b''.join(body)
+
+
+class AsgiBridge:
+    """ASGI application serving `wsgi_app` from a bounded thread pool."""
+
+    def __init__(self, wsgi_app, max_workers=8, on_startup=None):
+        self.wsgi_app = wsgi_app
+        self.max_workers = max_workers
+        self.on_startup = on_startup
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='asgi-worker')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self.http(scope, receive, send)
+        else:
+            # No websocket routes
+            raise RuntimeError(f"Unsupported ASGI scope type: {scope['type']}")
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    if self.on_startup is not None:
+                        await self.run(self.on_startup)
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def read_body(self, receive):
+        """The whole request body, DISCONNECTED or TOO_LARGE."""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return DISCONNECTED
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                return TOO_LARGE
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    async def http(self, scope, receive, send):
+        body = await self.read_body(receive)
+        if body is DISCONNECTED:
+            return
+        if body is TOO_LARGE:
+            await self.respond(send, 413, [(b'content-type', b'application/json')],
+                               b'{"success": false, "message": "Request body too large"}')
+            return
+
+        status, headers, payload = await self.run(call_wsgi, self.wsgi_app, build_environ(scope, body))
+        await self.respond(send, status, headers, payload)
+
+    @staticmethod
+    async def respond(send, status, headers, body):
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
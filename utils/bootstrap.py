@@ -0,0 +1,45 @@
+"""
+One-round-trip payload for opening an equation: the equation, its step
+definitions, graph samples, the hints for the student's current step and
+their progress row. ?fields= selects a subset; only the selected parts are
+computed.
+"""
+from utils.hint_personalizer import PERFORMANCE_LEVELS, lookup_hint
+from utils.step_engine import current_equation
+
+BOOTSTRAP_FIELDS = ('equation', 'steps', 'graph', 'hints', 'progress')
+
+
+def parse_fields(args):
+    """Fields named in ?fields=a,b (all when absent); ValueError on unknown ones."""
+    raw = args.get('fields', '')
+    if not raw.strip():
+        return BOOTSTRAP_FIELDS
+    fields = tuple(dict.fromkeys(f.strip() for f in raw.split(',') if f.strip()))
+    unknown = [f for f in fields if f not in BOOTSTRAP_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. "
+                         f"Choose from: {', '.join(BOOTSTRAP_FIELDS)}")
+    return fields
+
+
+def student_step(state, eq_type, equations, eq_id, first_step):
+    """The step the student is on in equation `eq_id`, or `first_step` if it is not open."""
+    if state.get('current_type') == eq_type and current_equation(state, equations) == eq_id:
+        return state.get('current_step', first_step)
+    return first_step
+
+
+def step_hints(eq, state, step, hint_step):
+    """Every level's hint for one step, plus the one for this student's level."""
+    return {
+        "step": step,
+        "hint": lookup_hint(eq.hint_table, state.get('performance_level', 'moderate'), hint_step),
+        "levels": {level: lookup_hint(eq.hint_table, level, hint_step)
+                   for level in PERFORMANCE_LEVELS},
+    }
+
+
+def bootstrap_payload(fields, parts):
+    """{field: parts[field]()} for the selected fields only."""
+    return {field: parts[field]() for field in fields}
@@ -0,0 +1,70 @@
+"""
+Negotiated gzip/brotli compression for dynamic responses.
+
+JSON, HTML and text responses of at least COMPRESS_MIN_SIZE bytes are
+compressed with the best encoding the client accepts. Brotli is used only
+when the brotli package is installed. Files served from disk (/static/,
+/assets/) are left alone, because /assets/ already serves precompressed
+copies. Compression turns a strong ETag into a weak one: the bytes differ,
+but If-None-Match still matches, so 304s keep working.
+"""
+import gzip
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip alone is still offered
+    brotli = None
+
+DEFAULT_MIN_SIZE = 500
+GZIP_LEVEL = 6
+# Per-request compression; quality 11 is only worth it for the prebuilt assets
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = {
+    'application/json', 'application/javascript', 'image/svg+xml',
+    'text/css', 'text/html', 'text/javascript', 'text/plain',
+}
+
+
+def supported_encodings():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response):
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 206, 304)
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    if len(data) < current_app.config.get('COMPRESS_MIN_SIZE', DEFAULT_MIN_SIZE):
+        return response
+    encoding = request.accept_encodings.best_match(supported_encodings())
+    if encoding is None:
+        return response
+
+    compressed = compress(data, encoding)
+    if len(compressed) >= len(data):
+        return response
+    response.set_data(compressed)
+    response.content_encoding = encoding
+
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app):
+    """Register the hook. Call it before other after_request hooks: the first registered runs last."""
+    app.after_request(compress_response)
@@ -0,0 +1,124 @@
+import hashlib
+from types import MappingProxyType
+
+from utils.hint_personalizer import build_hint_table
+
+EQUATION_TYPES = ('linear', 'quadratic')
+
+# Fields copied from the get_equation_data() dict onto each record
+RECORD_FIELDS = (
+    'expression', 'degree',
+    'constant', 'coefficient', 'solution',
+    'a_coefficient', 'b_coefficient', 'c_coefficient',
+    'solution1', 'solution2', 'discriminant',
+    'step4_expression', 'step5_expression', 'step6_expression',
+)
+
+
+class EquationRecord:
+    """Immutable, owlready2-free snapshot of one equation individual."""
+
+    __slots__ = ('id', 'uid', 'iri', 'name', 'type', 'data', 'hints', 'hint_table') + RECORD_FIELDS
+
+    def __init__(self, eq_id, name, eq_type, data, hints, uid=None, iri=None):
+        set_field = object.__setattr__
+        # id is the position in its type's list; uid is stable across reloads
+        set_field(self, 'id', eq_id)
+        set_field(self, 'uid', eq_id if uid is None else uid)
+        set_field(self, 'iri', iri)
+        set_field(self, 'name', name)
+        set_field(self, 'type', eq_type)
+        set_field(self, 'data', MappingProxyType(dict(data)))
+        set_field(self, 'hints', MappingProxyType(dict(hints)))
+        # hint_table[step][level] with defaults already folded in
+        set_field(self, 'hint_table', build_hint_table(hints))
+        for field in RECORD_FIELDS:
+            set_field(self, field, data.get(field))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("EquationRecord is read-only")
+
+    def __delattr__(self, key):
+        raise AttributeError("EquationRecord is read-only")
+
+    def __repr__(self):
+        return f"EquationRecord({self.type}, {self.id}, {self.name!r})"
+
+
+class EquationCatalog:
+    """Compiled equations indexed by type/position and by individual name.
+
+    `version` is the content hash of the source ontology and `last_modified`
+    its mtime; both feed the HTTP cache validators.
+    """
+
+    __slots__ = ('linear', 'quadratic', 'version', 'last_modified',
+                 '_by_type', '_by_name', '_by_uid', '_names', '_uids',
+                 '_positions', '_uid_positions', '_layouts')
+
+    def __init__(self, linear, quadratic, version='', last_modified=None):
+        self.linear = tuple(linear)
+        self.quadratic = tuple(quadratic)
+        self.version = version
+        self.last_modified = last_modified
+        self._by_type = {'linear': self.linear, 'quadratic': self.quadratic}
+        self._by_name = {record.name: record
+                         for record in self.linear + self.quadratic}
+        self._by_uid = {record.uid: record
+                        for record in self.linear + self.quadratic}
+        self._names = {eq_type: tuple(record.name for record in records)
+                       for eq_type, records in self._by_type.items()}
+        self._uids = {eq_type: tuple(record.uid for record in records)
+                      for eq_type, records in self._by_type.items()}
+        self._uid_positions = {eq_type: {uid: i for i, uid in enumerate(uids)}
+                               for eq_type, uids in self._uids.items()}
+        self._positions = {eq_type: {name: i for i, name in enumerate(names)}
+                           for eq_type, names in self._names.items()}
+        # Fingerprint of each type's name order; progress saved under another
+        # layout is remapped by name when loaded
+        self._layouts = {eq_type: hashlib.sha1('\n'.join(names).encode()).hexdigest()[:16]
+                         for eq_type, names in self._names.items()}
+
+    def equations(self, eq_type):
+        return self._by_type.get(eq_type, ())
+
+    def get(self, eq_type, eq_id):
+        equations = self._by_type.get(eq_type, ())
+        if 0 <= eq_id < len(equations):
+            return equations[eq_id]
+        return None
+
+    def by_name(self, name):
+        return self._by_name.get(name)
+
+    def by_uid(self, uid):
+        return self._by_uid.get(uid)
+
+    def names(self, eq_type):
+        return self._names.get(eq_type, ())
+
+    def uids(self, eq_type):
+        return self._uids.get(eq_type, ())
+
+    def uid_positions(self, eq_type):
+        return self._uid_positions.get(eq_type, {})
+
+    def position(self, eq_type, name):
+        return self._positions.get(eq_type, {}).get(name)
+
+    def positions(self, eq_type):
+        return self._positions.get(eq_type, {})
+
+    def layout(self, eq_type):
+        return self._layouts.get(eq_type, '')
+
+    def __len__(self):
+        return len(self.linear) + len(self.quadratic)
+
+
+def compile_records(individuals, eq_type, get_data, get_hints, registry=None):
+    individuals = list(individuals)
+    iris = [eq.iri for eq in individuals]
+    uids = registry.assign(iris) if registry is not None else range(len(individuals))
+    return [EquationRecord(i, eq.name, eq_type, get_data(eq), get_hints(eq), uid, iri)
+            for i, (eq, uid, iri) in enumerate(zip(individuals, uids, iris))]
@@ -0,0 +1,162 @@
+"""
+Procedural linear and factorable quadratic equations by difficulty tier.
+
+Every equation is drawn from a precomputed bank of integer-root parameters,
+so nothing is solved at request time. A student's stream is fixed by a seed
+derived from their id, so the n-th generated equation is always the same.
+"""
+import hashlib
+import random
+from functools import lru_cache
+from math import gcd
+
+from utils.equation_catalog import EquationRecord
+
+# Bump when banks or formatting change; it is part of every student seed
+GENERATOR_VERSION = 1
+
+TIERS = ('easy', 'medium', 'hard')
+
+# tier -> (coefficients, constants, solutions); zero is always excluded
+LINEAR_TIERS = {
+    'easy': (range(1, 6), range(1, 11), range(1, 11)),
+    'medium': (range(2, 10), range(-15, 16), range(-10, 11)),
+    'hard': (range(-12, 13), range(-30, 31), range(-20, 21)),
+}
+
+# tier -> (leading coefficients, roots); zero roots are excluded so the
+# AC method never degenerates
+QUADRATIC_TIERS = {
+    'easy': (range(1, 2), range(-6, 7)),
+    'medium': (range(1, 2), range(-12, 13)),
+    'hard': (range(2, 5), range(-9, 10)),
+}
+
+
+def format_terms(terms, keep_zero=()):
+    """Join (coefficient, variable) pairs as "2x² - 8x + 6".
+
+    Zero terms are dropped unless their variable is in keep_zero, which
+    mirrors the ontology writing "x² + 0x - 4".
+    """
+    text = ''
+    for coeff, var in terms:
+        if coeff == 0 and var not in keep_zero:
+            continue
+        magnitude = abs(coeff)
+        body = f"{'' if magnitude == 1 and var else magnitude}{var}"
+        if not text:
+            text = f"-{body}" if coeff < 0 else body
+        else:
+            text += f" - {body}" if coeff < 0 else f" + {body}"
+    return text or '0'
+
+
+def _binomial(coeff, constant):
+    return f"({format_terms([(coeff, 'x'), (constant, '')])})"
+
+
+def _signed_factor(factor, var=''):
+    if factor == 1:
+        return var
+    if factor == -1:
+        return f"-{var}" if var else '-1'
+    return f"{factor}{var}"
+
+
+@lru_cache(maxsize=None)
+def linear_bank(tier):
+    """All (coefficient, constant, solution) triples for a tier, in a fixed order."""
+    coefficients, constants, solutions = LINEAR_TIERS[tier]
+    return tuple((k, m, s) for k in coefficients if k != 0
+                 for m in constants if m != 0
+                 for s in solutions if s != 0)
+
+
+@lru_cache(maxsize=None)
+def quadratic_bank(tier):
+    """All (a, b, c, r1, r2) with integer roots r1 <= r2 for a tier, in a fixed order."""
+    leading, roots = QUADRATIC_TIERS[tier]
+    bank = []
+    for a in leading:
+        for r1 in roots:
+            for r2 in roots:
+                if r1 == 0 or r2 == 0 or r1 > r2:
+                    continue
+                bank.append((a, -a * (r1 + r2), a * r1 * r2, r1, r2))
+    return tuple(bank)
+
+
+def linear_data(coefficient, constant, solution):
+    """get_equation_data()-shaped dict for coefficient·x + constant = rhs."""
+    rhs = coefficient * solution + constant
+    return {
+        'expression': f"{format_terms([(coefficient, 'x'), (constant, '')])} = {rhs}",
+        'degree': 1,
+        'constant': constant,
+        'coefficient': coefficient,
+        'solution': float(solution),
+    }
+
+
+def quadratic_data(a, b, c, r1, r2):
+    """get_equation_data()-shaped dict, including the AC-method step expressions."""
+    # Split bx into px + qx with p·q = ac, then factor each pair by grouping
+    p, q = -a * r1, -a * r2
+    g1 = gcd(a, p)
+    g2 = gcd(q, c) * (1 if q > 0 else -1)
+    first = f"{_signed_factor(g1, 'x')}{_binomial(a // g1, p // g1)}"
+    second = f"{_signed_factor(abs(g2))}{_binomial(q // g2, c // g2)}"
+    grouped = f"{first} {'-' if g2 < 0 else '+'} {second}"
+
+    return {
+        'expression': f"{format_terms([(a, 'x²'), (b, 'x'), (c, '')], keep_zero=('x',))} = 0",
+        'degree': 2,
+        'a_coefficient': a,
+        'b_coefficient': b,
+        'c_coefficient': c,
+        'solution1': float(r1),
+        'solution2': float(r2),
+        'discriminant': b * b - 4 * a * c,
+        'step4_expression': f"{format_terms([(a, 'x²'), (p, 'x'), (q, 'x'), (c, '')])} = 0",
+        'step5_expression': f"{grouped} = 0",
+        'step6_expression': f"{_signed_factor(a)}{_binomial(1, -r1)}{_binomial(1, -r2)} = 0",
+    }
+
+
+def student_seed(student_id, eq_type, tier):
+    """Stable seed for one student's stream of a type and tier."""
+    key = f"{GENERATOR_VERSION}:{student_id}:{eq_type}:{tier}".encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big')
+
+
+def generate_data(eq_type, tier, seed, index):
+    """The index-th equation of the stream for `seed`; same inputs, same equation."""
+    rng = random.Random(f"{seed}:{index}")
+    if eq_type == 'linear':
+        return linear_data(*rng.choice(linear_bank(tier)))
+    if eq_type == 'quadratic':
+        return quadratic_data(*rng.choice(quadratic_bank(tier)))
+    raise ValueError(f"Unknown equation type: {eq_type}")
+
+
+def generated_uid(eq_type, tier, index):
+    """Uid of a stream's index-th equation.
+
+    Catalog uids are integers, so these strings can never collide with one.
+    """
+    return f"gen:{eq_type}:{tier}:{index}"
+
+
+def generate_record(eq_type, tier, seed, index):
+    """Generated equation as an EquationRecord with default hints."""
+    name = f"Generated-{eq_type}-{tier}-{seed}-{index}"
+    return EquationRecord(index, name, eq_type, generate_data(eq_type, tier, seed, index), {},
+                          uid=generated_uid(eq_type, tier, index))
+
+
+def generate_set(student_id, eq_type, tier, count, start=0):
+    """`count` records from a student's stream, starting at position `start`."""
+    seed = student_seed(student_id, eq_type, tier)
+    return [generate_record(eq_type, tier, seed, index)
+            for index in range(start, start + count)]
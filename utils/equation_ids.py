@@ -0,0 +1,107 @@
+"""
+Stable dense integer ids for equation individuals.
+
+Each individual IRI gets the next free integer the first time it is seen and
+keeps it forever: ids are never reused or renumbered, so progress and caches
+keyed by them survive reordering, edits and reloads of the ontology. The
+table is a JSON list of IRIs (position = id) kept next to the ontology; commit
+it alongside the .owl file so every deployment agrees on the ids.
+"""
+import json
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, writes are still atomic
+    fcntl = None
+
+IDS_FORMAT_VERSION = 1
+
+
+def default_ids_path(owl_path):
+    return f"{owl_path}.ids.json"
+
+
+class EquationIdRegistry:
+    """IRI <-> id table with O(1) lookups both ways; append-only."""
+
+    def __init__(self, path=None):
+        # path=None keeps the table in memory only
+        self.path = path
+        self._lock = threading.Lock()
+        self._iris = []
+        self._ids = {}
+        self._merge(self._read())
+
+    def _read(self):
+        if not self.path:
+            return []
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if data.get('version') != IDS_FORMAT_VERSION:
+            return []
+        return data.get('iris', [])
+
+    def _merge(self, iris):
+        # Ids already on disk win; the file only ever grows
+        for uid in range(len(self._iris), len(iris)):
+            self._iris.append(iris[uid])
+            self._ids[iris[uid]] = uid
+
+    def _write(self):
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": IDS_FORMAT_VERSION, "iris": self._iris}, f, indent=1)
+            f.write('\n')
+        os.replace(tmp_path, self.path)
+
+    def assign(self, iris):
+        """Ids for `iris`, giving new IRIs the next free ids (and saving them)."""
+        missing = [iri for iri in iris if iri not in self._ids]
+        if missing:
+            with self._lock:
+                self._assign_new(missing)
+        return [self._ids[iri] for iri in iris]
+
+    def _assign_new(self, missing):
+        if not self.path:
+            self._add(missing)
+            return
+
+        lock_file = None
+        try:
+            if fcntl is not None:
+                lock_file = open(f"{self.path}.lock", 'w')
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # Another worker may have assigned ids since we last read
+            self._merge(self._read())
+            if self._add(missing):
+                self._write()
+        except OSError as e:
+            print(f"Error saving equation ids to {self.path}: {e}")
+            self._add(missing)
+        finally:
+            if lock_file is not None:
+                lock_file.close()
+
+    def _add(self, iris):
+        added = False
+        for iri in iris:
+            if iri not in self._ids:
+                self._ids[iri] = len(self._iris)
+                self._iris.append(iri)
+                added = True
+        return added
+
+    def id_of(self, iri):
+        return self._ids.get(iri)
+
+    def iri_of(self, uid):
+        return self._iris[uid] if 0 <= uid < len(self._iris) else None
+
+    def __len__(self):
+        return len(self._iris)
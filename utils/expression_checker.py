@@ -0,0 +1,363 @@
+"""
+Fast equivalence checking for one-variable polynomial expressions and equations.
+
+Student input such as "2x(x - 1) - 6(x - 1) = 0" is tokenized, parsed by a
+small recursive-descent parser straight into a coefficient vector, and
+compared in that normal form. Parsed results are memoized, so re-checking a
+target expression or a common answer costs a dictionary lookup.
+"""
+import re
+from collections import Counter
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd
+
+# Guards against pathological input such as (x + 1)^1000
+MAX_DEGREE = 12
+MAX_INPUT_LENGTH = 200
+# Powers are the only way to grow numbers faster than the input; ((2^12)^12)^12...
+MAX_COEFFICIENT_BITS = 1024
+# The parser recurses once per bracket; ((((x)))) this deep is never a real answer
+MAX_NESTING = 20
+
+SUPERSCRIPTS = {'⁰': 0, '¹': 1, '²': 2, '³': 3, '⁴': 4,
+                '⁵': 5, '⁶': 6, '⁷': 7, '⁸': 8, '⁹': 9}
+
+# Typographic operators students paste in, mapped to the plain ones
+OPERATOR_ALIASES = {'−': '-', '–': '-', '×': '*', '·': '*', '⋅': '*',
+                    '÷': '/', '**': '^', '[': '(', ']': ')'}
+
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+      (?P<number>\d+(?:\.\d*)?|\.\d+)
+    | (?P<var>[A-Za-z])
+    | (?P<sup>[⁰¹²³⁴⁵⁶⁷⁸⁹]+)
+    | (?P<op>\*\*|[-+*/^()=\[\]−–×·⋅÷])
+    )""", re.VERBOSE)
+
+
+class ExpressionError(ValueError):
+    """Raised for input the verifier cannot read."""
+
+
+class ParsedExpression:
+    """Normal form of an expression or equation plus a little of its shape.
+
+    coeffs   - lowest degree first, trailing zeros trimmed; for equations
+               this is lhs - rhs scaled to primitive integers with a positive
+               leading coefficient, so equivalent equations compare equal
+    terms    - number of top-level terms written (across both sides)
+    factors  - non-constant factors the written expression is a product of
+               (for equations: one side, with the other side 0), or 0. A
+               sum counts only when every term shares a factor, as in the
+               grouped x(x + 5) - 2(x + 5) = 0. (x + 5)^2 = 0 counts 2;
+               x*x + 3x - 10 = 0 and x(x + 3) - 10 = 0 count 0
+    """
+
+    __slots__ = ('coeffs', 'is_equation', 'terms', 'factors')
+
+    def __init__(self, coeffs, is_equation, terms, factors):
+        self.coeffs = coeffs
+        self.is_equation = is_equation
+        self.terms = terms
+        self.factors = factors
+
+    @property
+    def degree(self):
+        return len(self.coeffs) - 1
+
+    def __repr__(self):
+        return (f"ParsedExpression(coeffs={self.coeffs!r}, is_equation={self.is_equation}, "
+                f"terms={self.terms}, factors={self.factors})")
+
+
+def tokenize(text):
+    """Split input into (kind, value) tokens: num, var, op."""
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if match is None:
+            raise ExpressionError(f"Unexpected character {text[pos:].lstrip()[:1]!r}")
+        pos = match.end()
+        if match.group('number'):
+            raw = match.group('number')
+            tokens.append(('num', int(raw) if raw.isdigit() else Fraction(raw)))
+        elif match.group('var'):
+            tokens.append(('var', match.group('var')))
+        elif match.group('sup'):
+            power = 0
+            for ch in match.group('sup'):
+                power = power * 10 + SUPERSCRIPTS[ch]
+            tokens.append(('op', '^'))
+            tokens.append(('num', power))
+        else:
+            op = match.group('op')
+            tokens.append(('op', OPERATOR_ALIASES.get(op, op)))
+    return tokens
+
+
+# Polynomials are tuples of coefficients, lowest degree first
+
+def _trim(p):
+    end = len(p)
+    while end > 1 and p[end - 1] == 0:
+        end -= 1
+    return p[:end]
+
+
+def _add(p, q):
+    if len(p) < len(q):
+        p, q = q, p
+    return _trim(tuple(c + q[i] if i < len(q) else c for i, c in enumerate(p)))
+
+
+def _neg(p):
+    return tuple(-c for c in p)
+
+
+def _mul(p, q):
+    if len(p) + len(q) - 2 > MAX_DEGREE:
+        raise ExpressionError("Expression degree is too high")
+    out = [0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a:
+            for j, b in enumerate(q):
+                out[i + j] += a * b
+    return _trim(tuple(out))
+
+
+def _is_constant(p):
+    return len(p) == 1
+
+
+def _divide(p, q):
+    """p / q for a q known to divide p exactly."""
+    rest = [Fraction(c) for c in p]
+    out = [0] * (len(p) - len(q) + 1)
+    for i in range(len(out) - 1, -1, -1):
+        out[i] = rest[i + len(q) - 1] / q[-1]
+        for j, c in enumerate(q):
+            rest[i + j] -= out[i] * c
+    return _trim(tuple(out))
+
+
+def _bits(c):
+    c = Fraction(c)
+    return max(c.numerator.bit_length(), c.denominator.bit_length())
+
+
+def _product(factors):
+    poly = (1,)
+    for factor in factors:
+        poly = _mul(poly, factor)
+    return poly
+
+
+def _primitive(p):
+    """Scale to coprime integers with a positive leading coefficient."""
+    denominator = 1
+    for c in p:
+        if isinstance(c, Fraction):
+            denominator = denominator * c.denominator // gcd(denominator, c.denominator)
+    ints = [int(c * denominator) for c in p]
+    divisor = 0
+    for c in ints:
+        divisor = gcd(divisor, c)
+    if divisor == 0:
+        return (0,)
+    if ints[-1] < 0:
+        divisor = -divisor
+    return tuple(c // divisor for c in ints)
+
+
+class _Parser:
+    """Recursive descent over the token list; each rule returns a polynomial
+    and the non-constant factors (in primitive form) it was written as.
+
+    equation := expr ['=' expr]
+    expr     := term (('+' | '-') term)*
+    term     := unary (('*' | '/') unary | implicit product)*
+    unary    := ('+' | '-')* power
+    power    := atom ['^' integer]
+    atom     := number | variable | '(' expr ')'
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.variable = None
+        self.depth = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expect(self, op):
+        if self.take() != ('op', op):
+            raise ExpressionError(f"Expected {op!r}")
+
+    def equation(self):
+        lhs, lhs_terms, lhs_factors = self.expr()
+        if self.peek() == ('op', '='):
+            self.take()
+            rhs, rhs_terms, rhs_factors = self.expr()
+            self.end()
+            # A bare "= 0" side does not count as a written term
+            terms = (lhs_terms if lhs != (0,) else 0) + (rhs_terms if rhs != (0,) else 0)
+            # Factored form is one product on one side and 0 on the other
+            if rhs == (0,):
+                factors = lhs_factors
+            elif lhs == (0,):
+                factors = rhs_factors
+            else:
+                factors = ()
+            return ParsedExpression(_primitive(_add(lhs, _neg(rhs))), True, terms, len(factors))
+        self.end()
+        return ParsedExpression(lhs, False, lhs_terms, len(lhs_factors))
+
+    def end(self):
+        if self.pos != len(self.tokens):
+            raise ExpressionError("Unexpected input after the expression")
+
+    def expr(self):
+        poly, factors = self.term()
+        terms = 1
+        common = Counter(factors)
+        while self.peek() in (('op', '+'), ('op', '-')):
+            sign = self.take()[1]
+            right, right_factors = self.term()
+            poly = _add(poly, right if sign == '+' else _neg(right))
+            terms += 1
+            common &= Counter(right_factors)
+        if terms == 1:
+            return poly, terms, factors
+        # A sum is a product only through the factors all its terms share:
+        # x(x + 5) - 2(x + 5) is (x + 5)(x - 2)
+        factors = tuple(sorted(common.elements())) if poly != (0,) else ()
+        if factors:
+            rest = _divide(poly, _product(factors))
+            if not _is_constant(rest):
+                factors += (_primitive(rest),)
+        return poly, terms, factors
+
+    def term(self):
+        poly, factors = self.unary()
+        while True:
+            kind, value = self.peek()
+            if kind == 'op' and value in ('*', '/'):
+                self.take()
+                right, right_factors = self.unary()
+                if value == '/':
+                    if not _is_constant(right) or right[0] == 0:
+                        raise ExpressionError("Can only divide by a non-zero number")
+                    poly = tuple(Fraction(c) / right[0] for c in poly)
+                    continue
+            elif kind == 'var' or kind == 'op' and value == '(':
+                # Implicit product: 2x, x(x + 5), (x + 5)(x - 2)
+                right, right_factors = self.power()
+            else:
+                return poly, factors
+            poly = _mul(poly, right)
+            factors += right_factors
+
+    def unary(self):
+        negative = False
+        while self.peek() in (('op', '+'), ('op', '-')):
+            negative ^= self.take()[1] == '-'
+        poly, factors = self.power()
+        return (_neg(poly) if negative else poly), factors
+
+    def power(self):
+        base, factors = self.atom()
+        if self.peek() != ('op', '^'):
+            return base, factors
+        self.take()
+        kind, exponent = self.take()
+        if kind != 'num' or not isinstance(exponent, int):
+            raise ExpressionError("Exponents must be whole numbers")
+        # Also bounds constants: 2^99999999 would otherwise be computed
+        if exponent > MAX_DEGREE or (len(base) - 1) * exponent > MAX_DEGREE:
+            raise ExpressionError("Expression degree is too high")
+        if max(_bits(c) for c in base) * exponent > MAX_COEFFICIENT_BITS:
+            raise ExpressionError("Numbers are too large")
+        poly = (1,)
+        for _ in range(exponent):
+            poly = _mul(poly, base)
+        return poly, () if _is_constant(poly) else factors * exponent
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == 'num':
+            return (value,), ()
+        if kind == 'var':
+            if self.variable is None:
+                self.variable = value
+            elif value != self.variable:
+                raise ExpressionError("Only one variable is supported")
+            return (0, 1), ((0, 1),)
+        if (kind, value) == ('op', '('):
+            self.depth += 1
+            if self.depth > MAX_NESTING:
+                raise ExpressionError("Too many nested brackets")
+            poly, terms, factors = self.expr()
+            self.expect(')')
+            self.depth -= 1
+            # ((x + 5)(x - 2)) is still two factors; (x + 5) is one
+            if _is_constant(poly):
+                return poly, ()
+            return poly, factors if len(factors) > 1 else (_primitive(poly),)
+        raise ExpressionError("Expression is incomplete")
+
+
+@lru_cache(maxsize=4096)
+def parse_expression(text):
+    """Parse an expression or equation into its ParsedExpression (memoized)."""
+    if len(text) > MAX_INPUT_LENGTH:
+        raise ExpressionError("Expression is too long")
+    tokens = tokenize(text)
+    if not tokens:
+        raise ExpressionError("Expression is empty")
+    return _Parser(tokens).equation()
+
+
+def normal_form(text):
+    return parse_expression(text).coeffs
+
+
+def equivalent(answer, target):
+    """True when `answer` is algebraically the same as `target`.
+
+    Raises ExpressionError if the answer cannot be parsed. An equation only
+    matches an equation (up to a non-zero factor); an expression given for an
+    equation target is compared against its left-hand side minus right.
+    """
+    return _equivalent(parse_expression(answer.strip()), parse_expression(target.strip()))
+
+
+def _equivalent(answer, target):
+    if answer.is_equation != target.is_equation and target.is_equation:
+        answer = ParsedExpression(_primitive(answer.coeffs), True, answer.terms, answer.factors)
+    return answer.is_equation == target.is_equation and answer.coeffs == target.coeffs
+
+
+def check_step(answer, target, min_terms=0, min_factors=0):
+    """Equivalence plus a shape requirement for a worked step.
+
+    Returns (ok, reason) where reason is None, 'unreadable', 'not_equivalent'
+    or 'shape' (right value, but not written the way the step asks).
+    """
+    try:
+        parsed = parse_expression(answer.strip())
+    except ExpressionError:
+        return False, 'unreadable'
+    if not _equivalent(parsed, parse_expression(target.strip())):
+        return False, 'not_equivalent'
+    if parsed.terms < min_terms or parsed.factors < min_factors:
+        return False, 'shape'
+    return True, None
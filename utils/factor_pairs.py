@@ -0,0 +1,123 @@
+"""
+Precomputed signed factor pairs for the AC-method step.
+
+For every non-zero n with |n| <= limit the index holds the integer pairs
+(p, q), p <= q, with p * q == n, plus a (product, sum) -> pair map. Step 3
+feedback, candidate-pair hints and the catalog's factorability check are all
+dictionary lookups instead of trial division per request.
+"""
+import threading
+
+# Covers the ontology and the generator's hard tier (|ac| <= 4² · 9 · 9)
+DEFAULT_LIMIT = 1296
+
+# Most candidate pairs a hint names
+MAX_HINT_PAIRS = 8
+
+
+class FactorPairIndex:
+
+    __slots__ = ('limit', '_pairs', '_by_sum')
+
+    def __init__(self, limit):
+        positive = {}
+        for p in range(1, int(limit ** 0.5) + 1):
+            for n in range(p * p, limit + 1, p):
+                positive.setdefault(n, []).append((p, n // p))
+
+        pairs, by_sum = {}, {}
+        for n, factors in positive.items():
+            plus = [(p, q) for p, q in factors] + [(-q, -p) for p, q in factors]
+            minus = sorted({(-p, q) for p, q in factors} | {(-q, p) for p, q in factors})
+            for product, signed in ((n, sorted(plus)), (-n, minus)):
+                pairs[product] = tuple(signed)
+                for p, q in signed:
+                    by_sum[(product, p + q)] = (p, q)
+
+        self.limit = limit
+        self._pairs = pairs
+        self._by_sum = by_sum
+
+    def pairs(self, n):
+        """All signed pairs multiplying to n, smallest first; () for 0 or out of range."""
+        return self._pairs.get(n, ())
+
+    def pair_for(self, product, total):
+        """The pair multiplying to `product` and adding to `total`, or None."""
+        if product == 0:
+            return (0, total)
+        return self._by_sum.get((product, total))
+
+    def closest(self, product, total, num1, num2):
+        """Pair of `product` nearest the student's (num1, num2), skipping the answer."""
+        answer = self.pair_for(product, total)
+        best, best_distance = None, None
+        for p, q in self.pairs(product):
+            if (p, q) == answer:
+                continue
+            distance = min(abs(p - num1) + abs(q - num2), abs(q - num1) + abs(p - num2))
+            if best is None or distance < best_distance:
+                best, best_distance = (p, q), distance
+        return best
+
+
+# Built on first use; replaced wholesale when a larger range is needed
+_index = None
+_lock = threading.Lock()
+
+
+def get_factor_index(n=0):
+    """The shared index, rebuilt larger (and swapped in) if |n| is out of range."""
+    global _index
+    index = _index
+    if index is None or abs(n) > index.limit:
+        with _lock:
+            index = _index
+            if index is None:
+                index = FactorPairIndex(max(abs(n), DEFAULT_LIMIT))
+            elif abs(n) > index.limit:
+                index = FactorPairIndex(max(abs(n), 2 * index.limit))
+            _index = index
+    return index
+
+
+def pair_feedback(ac, b, num1, num2):
+    """(message, closest pair) for a step-3 pair; (None, None) if the pair is right.
+
+    closest is a nearby pair that does multiply to ac, when the product is wrong.
+    """
+    index = get_factor_index(ac)
+    if num1 * num2 == ac and num1 + num2 == b:
+        return None, None
+    if num1 * num2 == ac:
+        return (f"{num1} × {num2} = {ac}, but {num1} + {num2} = {num1 + num2}, "
+                f"not {b}."), None
+
+    closest = index.closest(ac, b, num1, num2)
+    message = f"{num1} × {num2} = {num1 * num2}, not {ac}."
+    if closest:
+        p, q = closest
+        message += f" A nearby pair that does multiply to {ac} is {p} × {q}, which adds to {p + q}."
+    return message, closest
+
+
+def pair_hint(ac, b):
+    """Default step-3 hint naming candidate pairs of ac."""
+    candidates = get_factor_index(ac).pairs(ac)[:MAX_HINT_PAIRS]
+    hint = f"Find two numbers that multiply to {ac} and add to {b}."
+    if candidates:
+        hint += " Try pairs such as " + ", ".join(f"{p} × {q}" for p, q in candidates) + "."
+    return hint
+
+
+def unfactorable(records):
+    """Names of quadratic records whose a·c has no integer pair summing to b."""
+    names = []
+    for record in records:
+        a, b, c = record.a_coefficient, record.b_coefficient, record.c_coefficient
+        if a is None or b is None or c is None:
+            names.append(record.name)
+            continue
+        if get_factor_index(a * c).pair_for(a * c, b) is None:
+            names.append(record.name)
+    return names
@@ -0,0 +1,147 @@
+import math
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to pure-Python Horner
+    np = None
+
+# Server-side caps for client-supplied graph parameters
+MAX_SAMPLES = 2001
+MAX_SPAN = 2000
+MAX_ABS_X = 10000
+
+# Half-width of the default window, as in the original range(-10, 11)
+DEFAULT_HALF_WIDTH = 10
+
+# Default samples per unit of x: straight lines need few points
+DEFAULT_DENSITY = {1: 1, 2: 4}
+
+# Default-window graphs kept per process; one per catalog equation and format
+GRAPH_CACHE_SIZE = 256
+
+# Samples are rounded to 6 decimals, so at most this many digits need scaling
+SERIES_DECIMALS = 6
+# Keeps values and their deltas within a JavaScript number's exact range (2**53)
+MAX_SCALED = 2 ** 51
+
+
+def horner(coeffs, x):
+    """Evaluate a polynomial given highest-degree-first coefficients."""
+    y = 0
+    for c in coeffs:
+        y = y * x + c
+    return y
+
+
+def auto_window(points, half_width=DEFAULT_HALF_WIDTH):
+    """Integer x-domain centred on the interesting points (roots, vertex)."""
+    points = [p for p in points if p is not None and math.isfinite(p)]
+    if not points:
+        return -half_width, half_width
+    low, high = min(points), max(points)
+    center = round((low + high) / 2)
+    half = max(half_width, math.ceil((high - low) / 2) + 2)
+    return center - half, center + half
+
+
+def clamp_domain(x_min, x_max, samples):
+    # Leaves room for the 1-unit minimum span below the upper cap
+    x_min = max(-MAX_ABS_X, min(MAX_ABS_X - 1, x_min))
+    x_max = max(-MAX_ABS_X, min(MAX_ABS_X, x_max))
+    if x_max <= x_min:
+        x_max = x_min + 1
+    if x_max - x_min > MAX_SPAN:
+        x_max = x_min + MAX_SPAN
+    samples = max(2, min(MAX_SAMPLES, int(samples)))
+    return x_min, x_max, samples
+
+
+def sample_polynomial(coeffs, x_min, x_max, samples):
+    """Sample a polynomial on [x_min, x_max]; returns (x_values, y_values) tuples."""
+    if np is not None:
+        x = np.round(np.linspace(x_min, x_max, samples), 6)
+        y = np.round(np.polyval(coeffs, x), 6)
+        return tuple(x.tolist()), tuple(y.tolist())
+
+    step = (x_max - x_min) / (samples - 1)
+    x_values = tuple(round(x_min + i * step, 6) for i in range(samples))
+    y_values = tuple(round(horner(coeffs, x), 6) for x in x_values)
+    return x_values, y_values
+
+
+@lru_cache(maxsize=GRAPH_CACHE_SIZE)
+def _default_graph(coeffs, x_min, x_max, samples, compact):
+    x_values, y_values = sample_polynomial(coeffs, x_min, x_max, samples)
+    if compact:
+        return encode_series(x_values), encode_series(y_values)
+    return x_values, y_values
+
+
+def graph_for(coeffs, points, x_min=None, x_max=None, samples=None, compact=False):
+    """Resolve defaults and caps, then sample; compact=True encode_series() both.
+
+    coeffs are highest-degree first; points (roots, vertex) pick the default
+    window when x_min/x_max are not given. Only that default window is
+    memoized (and shared, so callers must not modify it): client-chosen
+    windows are unbounded in number, so they are sampled each time.
+    """
+    default = x_min is None and x_max is None and samples is None
+    default_min, default_max = auto_window(points)
+    x_min = default_min if x_min is None else x_min
+    x_max = default_max if x_max is None else x_max
+    # Clamp before deriving the default resolution from the span
+    x_min, x_max, _ = clamp_domain(x_min, x_max, MAX_SAMPLES)
+    if samples is None:
+        density = DEFAULT_DENSITY.get(len(coeffs) - 1, 4)
+        samples = int((x_max - x_min) * density) + 1
+    x_min, x_max, samples = clamp_domain(x_min, x_max, samples)
+    if default:
+        return _default_graph(tuple(coeffs), x_min, x_max, samples, compact)
+    x_values, y_values = sample_polynomial(tuple(coeffs), x_min, x_max, samples)
+    if compact:
+        return encode_series(x_values), encode_series(y_values)
+    return x_values, y_values
+
+
+def _finite_arg(args, name, type):
+    value = args.get(name, type=type)
+    return value if value is not None and math.isfinite(value) else None
+
+
+def graph_params(args):
+    """Read x_min, x_max and samples from request args (None when absent)."""
+    return (_finite_arg(args, 'x_min', float),
+            _finite_arg(args, 'x_max', float),
+            _finite_arg(args, 'samples', int))
+
+
+def compact_series(args):
+    """True for ?series=compact: send the samples as encode_series() objects."""
+    return args.get('series') == 'compact'
+
+
+def series_decimals(values):
+    """Fewest decimal places that represent every value exactly."""
+    for decimals in range(SERIES_DECIMALS):
+        if all(round(v, decimals) == v for v in values):
+            return decimals
+    return SERIES_DECIMALS
+
+
+def encode_series(values):
+    """{"scale", "deltas"}: a tuple of samples as differences of scaled integers.
+
+    The scale is the smallest power of ten that makes every value an
+    integer. Evenly spaced x values, and the y values of a line, then come
+    out as one small repeated delta, which is shorter than the floats and
+    compresses far better. The client recovers each value as the running
+    sum / scale, which gives back the same doubles. Values too large for
+    that stay a plain list.
+    """
+    scale = 10 ** series_decimals(values)
+    scaled = [round(v * scale) for v in values]
+    if any(abs(v) > MAX_SCALED for v in scaled):
+        return list(values)
+    deltas = [b - a for a, b in zip([0] + scaled, scaled)]
+    return {"scale": scale, "deltas": deltas}
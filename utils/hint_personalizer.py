@@ -90,20 +90,32 @@ def personalize_hint_for_linear(hint_text, performance_level):
         return hint_text
 
 
-def get_hint_for_performance(ontology_hints, performance_level, equation_type, step):
+# Step index (0-based) -> hint key, shared by linear and quadratic equations
+STEP_KEYS = ('step1', 'step2', 'step3', 'step4', 'step5', 'solution')
 
-    step_map = {
-        0: 'step1',
-        1: 'step2',
-        2: 'step3',
-        3: 'step4',
-        4: 'step5',
-        5: 'solution'
-    }
+# Column order of the hint table; unknown levels use the last column
+PERFORMANCE_LEVELS = ('low', 'moderate', 'high')
+LEVEL_INDEX = {level: i for i, level in enumerate(PERFORMANCE_LEVELS)}
+UNKNOWN_LEVEL_INDEX = len(PERFORMANCE_LEVELS)
 
-    step_key = step_map.get(step, 'step1')
+
+def get_hint_for_performance(ontology_hints, performance_level, equation_type, step):
+    step_key = STEP_KEYS[step] if 0 <= step < len(STEP_KEYS) else 'step1'
 
     # Try adaptive hint first
     hint = get_adaptive_hint(ontology_hints, performance_level, step_key)
 
     return hint if hint else "Try again! You're doing great!"
+
+
+def build_hint_table(ontology_hints):
+    # Resolve every (step, level) hint once, ontology text first, then defaults
+    return tuple(
+        tuple(get_hint_for_performance(ontology_hints, level, None, step)
+              for level in PERFORMANCE_LEVELS + (None,))
+        for step in range(len(STEP_KEYS)))
+
+
+def lookup_hint(hint_table, performance_level, step):
+    row = hint_table[step] if 0 <= step < len(hint_table) else hint_table[0]
+    return row[LEVEL_INDEX.get(performance_level, UNKNOWN_LEVEL_INDEX)]
@@ -0,0 +1,65 @@
+import hashlib
+from functools import wraps
+
+from flask import current_app, make_response, request
+from werkzeug.http import is_resource_modified
+
+from utils.ontology_loader import get_catalog
+
+# Bump when the JSON shape of a cached endpoint changes, so clients refetch
+PAYLOAD_VERSION = '1'
+
+DEFAULT_MAX_AGE = 3600
+
+
+def content_etag(version, path):
+    digest = hashlib.sha1(f"{PAYLOAD_VERSION}:{version}:{path}".encode()).hexdigest()
+    return digest[:32]
+
+
+def _apply_validators(response, etag, last_modified, cache_control):
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+
+def conditional(version_fn=None, stateful=False):
+    """ETag/Last-Modified caching for responses that only depend on static content.
+
+    The validators come from version_fn() (default: the ontology catalog's
+    content hash and mtime) plus the request path and query string, so a
+    conditional GET is answered with 304 without building the body.
+    Views with session side effects pass stateful=True: the view always runs,
+    the response is marked private/no-cache, and only the body is skipped.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if version_fn is None:
+                catalog = get_catalog()
+                version, last_modified = catalog.version, catalog.last_modified
+            else:
+                version, last_modified = version_fn()
+
+            etag = content_etag(version, request.full_path)
+            if stateful:
+                cache_control = 'private, no-cache'
+            else:
+                max_age = current_app.config.get('CATALOG_CACHE_MAX_AGE', DEFAULT_MAX_AGE)
+                cache_control = f'public, max-age={max_age}'
+
+            if not stateful and not is_resource_modified(request.environ, etag=etag,
+                                                         last_modified=last_modified):
+                response = current_app.response_class(status=304)
+                return _apply_validators(response, etag, last_modified, cache_control)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+            _apply_validators(response, etag, last_modified, cache_control)
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
@@ -0,0 +1,247 @@
+"""
+Opt-in request metrics, exported in the Prometheus text format.
+
+Nothing here runs unless install_instrumentation() is called (INSTRUMENTATION=1
+in app.py): the request hooks, the session serializer wrapper and the
+function wrappers are only put in place then, so the disabled app pays
+nothing.
+"""
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+from flask import g, request
+
+# Seconds; Prometheus' default buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Finer buckets for in-process calls such as hint lookups
+FAST_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144)
+
+PREFIX = 'algebra_tutor_'
+
+# The installed Metrics; the function wrappers report to whatever is current
+_metrics = None
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels_text(names, values, extra=''):
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+class Counter:
+    def __init__(self, name, help_text, labels=()):
+        self.name, self.help, self.labels = PREFIX + name, help_text, tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for values, total in sorted(self._values.items()):
+                lines.append(f'{self.name}{_labels_text(self.labels, values)} {total}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name, self.help, self.labels = PREFIX + name, help_text, tuple(labels)
+        self.buckets = tuple(buckets)
+        # label values -> [per-bucket counts (+Inf last), sum, count]
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][slot] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for values, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + ('+Inf',), counts):
+                    cumulative += bucket_count
+                    le = f'le="{bound}"'
+                    lines.append(f'{self.name}_bucket{_labels_text(self.labels, values, le)} {cumulative}')
+                lines.append(f'{self.name}_sum{_labels_text(self.labels, values)} {total}')
+                lines.append(f'{self.name}_count{_labels_text(self.labels, values)} {count}')
+        return lines
+
+
+class Metrics:
+    """The app's metric families."""
+
+    def __init__(self):
+        self.request_latency = Histogram(
+            'request_duration_seconds', 'Request latency by endpoint.',
+            ('endpoint', 'method'))
+        self.requests = Counter(
+            'requests_total', 'Requests by endpoint and status.',
+            ('endpoint', 'method', 'status'))
+        self.ontology_reads = Counter(
+            'ontology_property_reads_total',
+            'owlready2 attribute reads while extracting equation data and hints.',
+            ('function', 'property'))
+        self.call_latency = Histogram(
+            'call_duration_seconds', 'Latency of instrumented functions.',
+            ('function',), FAST_BUCKETS)
+        self.session_latency = Histogram(
+            'session_serialize_seconds', 'Session (de)serialization time.',
+            ('operation',), FAST_BUCKETS)
+        self.session_size = Histogram(
+            'session_payload_bytes', 'Serialized session size.', (), SIZE_BUCKETS)
+
+    def families(self):
+        return (self.request_latency, self.requests, self.call_latency,
+                self.ontology_reads, self.session_latency, self.session_size)
+
+    def render(self):
+        lines = []
+        for family in self.families():
+            lines.extend(family.render())
+        return '\n'.join(lines) + '\n'
+
+
+class CountingIndividual:
+    """Forwards attribute reads to an owlready2 individual, counting each one."""
+
+    __slots__ = ('_individual', '_counter', '_function')
+
+    def __init__(self, individual, counter, function):
+        object.__setattr__(self, '_individual', individual)
+        object.__setattr__(self, '_counter', counter)
+        object.__setattr__(self, '_function', function)
+
+    def __getattr__(self, name):
+        self._counter.inc(self._function, name)
+        return getattr(self._individual, name)
+
+
+def count_property_reads(fn):
+    """Wrap an fn(individual) extractor so its property reads are counted and timed."""
+    function = fn.__name__
+
+    @wraps(fn)
+    def wrapper(individual):
+        metrics = _metrics
+        start = time.perf_counter()
+        try:
+            return fn(CountingIndividual(individual, metrics.ontology_reads, function))
+        finally:
+            metrics.call_latency.observe(time.perf_counter() - start, function)
+    wrapper.instrumented = True
+    return wrapper
+
+
+def timed(fn):
+    function = fn.__name__
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _metrics.call_latency.observe(time.perf_counter() - start, function)
+    wrapper.instrumented = True
+    return wrapper
+
+
+class TimedSerializer:
+    """Session serializer wrapper recording payload size and (de)serialization time."""
+
+    def __init__(self, serializer, metrics):
+        self.serializer = serializer
+        self.metrics = metrics
+
+    def dumps(self, value):
+        start = time.perf_counter()
+        payload = self.serializer.dumps(value)
+        self.metrics.session_latency.observe(time.perf_counter() - start, 'dumps')
+        self.metrics.session_size.observe(len(payload))
+        return payload
+
+    def loads(self, value):
+        start = time.perf_counter()
+        try:
+            return self.serializer.loads(value)
+        finally:
+            self.metrics.session_latency.observe(time.perf_counter() - start, 'loads')
+
+
+def _patch(modules, name, wrap):
+    """Replace `name` in every module that imported it with wrap(original), once."""
+    wrapped = {}
+    for module in modules:
+        original = getattr(module, name)
+        if getattr(original, 'instrumented', False):
+            continue
+        if original not in wrapped:
+            wrapped[original] = wrap(original)
+        setattr(module, name, wrapped[original])
+
+
+def install_instrumentation(app, profiler=None):
+    """Attach metrics (and optionally a SamplingProfiler) to `app`."""
+    global _metrics
+    from routes import linear, quadratic
+    from utils import hint_personalizer, ontology_loader, step_engine
+
+    metrics = _metrics = Metrics()
+    app.extensions['metrics'] = metrics
+
+    # Hot-path functions, in every module that imported them by name
+    _patch((ontology_loader,), 'get_equation_data', count_property_reads)
+    _patch((ontology_loader,), 'get_hints', count_property_reads)
+    _patch((ontology_loader,), 'build_catalog', timed)
+    _patch((hint_personalizer,), 'get_hint_for_performance', timed)
+    _patch((hint_personalizer, step_engine, linear, quadratic), 'lookup_hint', timed)
+
+    interface = app.session_interface
+    if getattr(interface, 'serializer', None) is not None and \
+            not isinstance(interface.serializer, TimedSerializer):
+        interface.serializer = TimedSerializer(interface.serializer, metrics)
+
+    @app.before_request
+    def start_timer():
+        g.instrument_start = time.perf_counter()
+        if profiler is not None:
+            profiler.begin()
+
+    @app.teardown_request
+    def record_request(exc=None):
+        start = g.pop('instrument_start', None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        endpoint = request.endpoint or 'unmatched'
+        metrics.request_latency.observe(elapsed, endpoint, request.method)
+        status = getattr(g, 'instrument_status', 500 if exc else 200)
+        metrics.requests.inc(endpoint, request.method, status)
+        if profiler is not None:
+            profiler.end(endpoint, elapsed)
+
+    @app.after_request
+    def remember_status(response):
+        g.instrument_status = response.status_code
+        return response
+
+    return metrics
@@ -0,0 +1,44 @@
+"""
+Compact JSON for API responses.
+
+Flask's default provider pretty-prints in debug mode (how app.py runs) and
+escapes every non-ASCII character. This one always writes the compact form,
+keeps UTF-8 as is and uses orjson when it is installed. Keys stay sorted,
+so the bytes for a given payload do not change between requests.
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is used instead
+    orjson = None
+
+SEPARATORS = (',', ':')
+
+if orjson is not None:
+    # Dates and dataclasses go through Flask's default() as before
+    ORJSON_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                      | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+class CompactJSONProvider(DefaultJSONProvider):
+    ensure_ascii = False
+    compact = True
+
+    def encode(self, obj, **kwargs):
+        """UTF-8 JSON bytes for `obj`."""
+        # orjson has no options for indent and the like; those calls use the stdlib
+        if orjson is not None and kwargs in ({}, {'separators': SEPARATORS}):
+            try:
+                return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits, which the stdlib handles
+        kwargs.setdefault('separators', SEPARATORS)
+        return super().dumps(obj, **kwargs).encode('utf-8')
+
+    def dumps(self, obj, **kwargs):
+        return self.encode(obj, **kwargs).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.encode(obj) + b'\n', mimetype=self.mimetype)
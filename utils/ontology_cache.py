@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+
+# Bump when the snapshot layout changes so stale caches get rebuilt
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_path(owl_path):
+    return f"{owl_path}.sqlite3"
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, meta):
+    tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def _is_fresh(meta, owl_path, cache_path, meta_path):
+    if not meta or meta.get('version') != CACHE_FORMAT_VERSION:
+        return False
+    if not os.path.exists(cache_path):
+        return False
+
+    stat = os.stat(owl_path)
+    if meta.get('mtime_ns') == stat.st_mtime_ns and meta.get('size') == stat.st_size:
+        return True
+
+    # mtime changed (e.g. git checkout) - fall back to comparing content
+    if meta.get('size') != stat.st_size or meta.get('sha256') != file_sha256(owl_path):
+        return False
+    try:
+        _write_meta(meta_path, dict(meta, mtime_ns=stat.st_mtime_ns))
+    except OSError:
+        pass
+    return True
+
+
+def _open_snapshot(cache_path, base_iri):
+    from owlready2 import World
+
+    world = World(filename=cache_path, exclusive=False, read_only=True)
+    return world.get_ontology(base_iri)
+
+
+def _write_snapshot(owl_path, cache_path, meta_path):
+    stat = os.stat(owl_path)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    from owlready2 import World
+
+    world = World(filename=tmp_path)
+    try:
+        onto = world.get_ontology(owl_path).load()
+        base_iri = onto.base_iri
+        world.save()
+    finally:
+        world.close()
+    os.replace(tmp_path, cache_path)
+
+    meta = {
+        "version": CACHE_FORMAT_VERSION,
+        "source": os.path.abspath(owl_path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": file_sha256(owl_path),
+        "base_iri": base_iri,
+    }
+    _write_meta(meta_path, meta)
+    return meta
+
+
+def load_ontology(owl_path, cache_path=None, fresh=False):
+    """Load the ontology, reusing the SQLite quadstore snapshot when it is current.
+
+    Pass cache_path='' to disable the snapshot and always parse the .owl file.
+    fresh=True parses into a new World instead of owlready2's default one,
+    which would hand back the already-loaded ontology (used for reloads).
+    owlready2 is imported here so that importing this module stays cheap.
+    """
+    from owlready2 import World, get_ontology
+
+    if fresh:
+        get_ontology = World().get_ontology
+
+    if cache_path == '':
+        return get_ontology(owl_path).load()
+
+    cache_path = cache_path or default_cache_path(owl_path)
+    meta_path = f"{cache_path}.json"
+
+    meta = _read_meta(meta_path)
+    if _is_fresh(meta, owl_path, cache_path, meta_path):
+        try:
+            return _open_snapshot(cache_path, meta['base_iri'])
+        except Exception as e:
+            print(f"Error opening ontology cache {cache_path}: {e}")
+
+    try:
+        meta = _write_snapshot(owl_path, cache_path, meta_path)
+        return _open_snapshot(cache_path, meta['base_iri'])
+    except Exception as e:
+        print(f"Error writing ontology cache {cache_path}: {e}")
+        return get_ontology(owl_path).load()
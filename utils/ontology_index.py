@@ -0,0 +1,50 @@
+class OntologyIndex:
+    """Class-to-individuals and name-to-individual lookups built in one pass.
+
+    Classes are keyed by name. `direct` holds individuals asserted as members
+    of a class (the old `cls in eq.is_a` test); `inclusive` also holds members
+    of every subclass, so e.g. 'Equation' covers linear and quadratic ones.
+    Lists keep the order of onto.individuals().
+    """
+
+    __slots__ = ('direct', 'inclusive', 'by_name', 'class_names')
+
+    def __init__(self, individuals):
+        self.direct = {}
+        self.inclusive = {}
+        self.by_name = {}
+        self.class_names = {}
+        ancestor_names = {}
+
+        for individual in individuals:
+            self.by_name[individual.name] = individual
+            seen = set()
+            for cls in individual.is_a:
+                cls_name = getattr(cls, 'name', None)
+                if cls_name is None:
+                    # Restrictions and other class expressions
+                    continue
+                self.direct.setdefault(cls_name, []).append(individual)
+
+                if cls not in ancestor_names:
+                    ancestor_names[cls] = [ancestor.name for ancestor in cls.ancestors()
+                                           if getattr(ancestor, 'name', None)]
+                for name in ancestor_names[cls]:
+                    if name not in seen:
+                        seen.add(name)
+                        self.inclusive.setdefault(name, []).append(individual)
+            self.class_names[individual.name] = frozenset(seen)
+
+    @staticmethod
+    def _key(cls):
+        return cls if isinstance(cls, str) else cls.name
+
+    def individuals_of(self, cls, include_subclasses=False):
+        table = self.inclusive if include_subclasses else self.direct
+        return table.get(self._key(cls), [])
+
+    def get(self, name):
+        return self.by_name.get(name)
+
+    def is_instance(self, name, cls):
+        return self._key(cls) in self.class_names.get(name, ())
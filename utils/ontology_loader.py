@@ -1,16 +1,77 @@
-from owlready2 import get_ontology
+import gc
+import os
+import threading
+import time
+from datetime import datetime, timezone
 
-# Load ontology
-ONTOLOGY_PATH = "/AI/Algebra/algebra_tutor2.owl"
-onto = get_ontology(ONTOLOGY_PATH).load()
+from flask import g, has_request_context
+
+from utils.equation_catalog import EquationCatalog, compile_records
+from utils.equation_ids import EquationIdRegistry, default_ids_path
+from utils.factor_pairs import get_factor_index, unfactorable
+from utils.ontology_cache import file_sha256, load_ontology
+from utils.ontology_index import OntologyIndex
+
+ONTOLOGY_PATH = os.environ.get(
+    'ONTOLOGY_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                 'algebra_tutor2.owl'))
+ONTOLOGY_CACHE_PATH = os.environ.get('ONTOLOGY_CACHE_PATH')
+# Stable equation ids; set to an empty value to keep them in memory only
+EQUATION_IDS_PATH = os.environ.get('EQUATION_IDS_PATH', default_ids_path(ONTOLOGY_PATH))
+
+# Ontology and compiled catalog are built on first use, not at import time
+_lock = threading.RLock()
+_onto = None
+_index = None
+_catalog = None
+_registry = None
+
+# Reloads run one at a time, off the request path
+_reload_lock = threading.Lock()
+_reload_state = {'signature': None, 'reloaded_at': None, 'error': None}
+_watcher = None
+
+
+def get_onto():
+    global _onto
+    if _onto is None:
+        with _lock:
+            if _onto is None:
+                _onto = load_ontology(ONTOLOGY_PATH, ONTOLOGY_CACHE_PATH)
+    return _onto
+
+
+def __getattr__(name):
+    # Keep `from utils.ontology_loader import onto` working, lazily
+    if name == 'onto':
+        return get_onto()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_index():
+    # One pass over the individuals replaces the per-call is_a scans
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = OntologyIndex(get_onto().individuals())
+    return _index
 
 
 def get_linear_equations():
-    return [eq for eq in onto.individuals() if onto.LinearEquation in eq.is_a]
+    return list(get_index().individuals_of('LinearEquation'))
 
 
 def get_quadratic_equations():
-    return [eq for eq in onto.individuals() if onto.QuadraticEquation in eq.is_a]
+    return list(get_index().individuals_of('QuadraticEquation'))
+
+
+def get_equation_by_name(name):
+    index = get_index()
+    if index.is_instance(name, 'Equation'):
+        return index.get(name)
+    return None
 
 
 def get_equation_data(eq):
@@ -126,11 +187,178 @@ def get_hints(eq):
 
 def get_performance_levels():
     try:
-        levels = {}
-        for individual in onto.individuals():
-            if onto.PerformanceLevel in individual.is_a:
-                levels[individual.name] = individual
-        return levels
+        return {individual.name: individual
+                for individual in get_index().individuals_of('PerformanceLevel')}
     except Exception as e:
         print(f"Error getting performance levels: {e}")
         return {}
+
+
+def get_registry():
+    global _registry
+    if _registry is None:
+        with _lock:
+            if _registry is None:
+                _registry = EquationIdRegistry(EQUATION_IDS_PATH or None)
+    return _registry
+
+
+def build_catalog(index=None):
+    index = index or get_index()
+    registry = get_registry()
+    linear = compile_records(index.individuals_of('LinearEquation'), 'linear',
+                             get_equation_data, get_hints, registry)
+    quadratic = compile_records(index.individuals_of('QuadraticEquation'), 'quadratic',
+                                get_equation_data, get_hints, registry)
+
+    # Size the factor-pair index for this catalog and flag equations the
+    # AC method cannot solve
+    get_factor_index(max((abs((r.a_coefficient or 0) * (r.c_coefficient or 0))
+                          for r in quadratic), default=0))
+    for name in unfactorable(quadratic):
+        print(f"Warning: {name} is not factorable over the integers")
+
+    return EquationCatalog(
+        linear,
+        quadratic,
+        version=file_sha256(ONTOLOGY_PATH),
+        last_modified=datetime.fromtimestamp(os.path.getmtime(ONTOLOGY_PATH), timezone.utc))
+
+
+def get_catalog():
+    # Compiled once so routes never touch owlready2 per request
+    global _catalog
+    catalog = _catalog
+    if catalog is None:
+        with _lock:
+            if _catalog is None:
+                _reload_state['signature'] = _file_signature(ONTOLOGY_PATH)
+                _catalog = build_catalog()
+            catalog = _catalog
+
+    # Pin one snapshot per request so a reload mid-request can't mix catalogs
+    if has_request_context():
+        if 'catalog' not in g:
+            g.catalog = catalog
+        return g.catalog
+    return catalog
+
+
+def warm_up():
+    """Load the ontology and compile the catalog ahead of the first request."""
+    return get_catalog()
+
+
+def prepare_for_fork():
+    """Build the catalog in a pre-fork master so workers share it copy-on-write.
+
+    Routes only read the compiled catalog, so the owlready2 world is closed
+    afterwards: it is the bulk of the memory, and its SQLite connection must
+    not be used across fork. Anything that still needs it reopens it lazily.
+    gc.freeze() keeps the collector from writing to (and so copying) the
+    shared pages in every worker.
+    """
+    global _onto, _index
+    catalog = get_catalog()
+    with _lock:
+        onto, _onto, _index = _onto, None, None
+    if onto is not None:
+        from owlready2 import default_world
+        if onto.world is not default_world:
+            try:
+                onto.world.close()
+            except Exception as e:
+                print(f"Error closing ontology world: {e}")
+    gc.collect()
+    gc.freeze()
+    return catalog
+
+
+def reset():
+    """Drop the loaded ontology, index and catalog; the next access rebuilds them."""
+    global _onto, _index, _catalog
+    with _lock:
+        _onto = None
+        _index = None
+        _catalog = None
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def reload_catalog():
+    """Rebuild the ontology, index and catalog from disk, then swap them in.
+
+    Everything is built off to the side while requests keep using the old
+    catalog; only the final reference swap takes the lock. Returns the
+    current catalog, which is the old one if the file is unchanged or the
+    rebuild failed.
+    """
+    global _onto, _index, _catalog
+    with _reload_lock:
+        signature = _file_signature(ONTOLOGY_PATH)
+        try:
+            onto = load_ontology(ONTOLOGY_PATH, ONTOLOGY_CACHE_PATH, fresh=True)
+            index = OntologyIndex(onto.individuals())
+            catalog = build_catalog(index)
+        except Exception as e:
+            print(f"Error reloading ontology: {e}")
+            _reload_state['error'] = str(e)
+            return _catalog
+
+        _reload_state.update(signature=signature, error=None,
+                             reloaded_at=datetime.now(timezone.utc))
+        if _catalog is not None and catalog.version == _catalog.version:
+            return _catalog
+        with _lock:
+            _onto, _index, _catalog = onto, index, catalog
+        print(f"Ontology reloaded: {len(catalog)} equations, version {catalog.version[:12]}")
+        return catalog
+
+
+def request_reload():
+    """Start reload_catalog() in a background thread; False if one is already running."""
+    if _reload_lock.locked():
+        return False
+    threading.Thread(target=reload_catalog, name='ontology-reload', daemon=True).start()
+    return True
+
+
+def reload_status():
+    catalog = _catalog
+    return {
+        "version": catalog.version if catalog else None,
+        "equations": len(catalog) if catalog else 0,
+        "reloading": _reload_lock.locked(),
+        "reloaded_at": _reload_state['reloaded_at'].isoformat() if _reload_state['reloaded_at'] else None,
+        "error": _reload_state['error'],
+    }
+
+
+def _watch(interval):
+    seen = _file_signature(ONTOLOGY_PATH)
+    while True:
+        time.sleep(interval)
+        current = _file_signature(ONTOLOGY_PATH)
+        # Reload once the file has stopped changing for a whole interval,
+        # so a save in progress is never parsed
+        if current is not None and current == seen and current != _reload_state['signature']:
+            reload_catalog()
+        seen = current
+
+
+def start_watcher(interval=2.0):
+    """Poll the ontology file and reload the catalog when it changes (once per process)."""
+    global _watcher
+    with _lock:
+        # A forked worker inherits the Thread object but not the thread
+        if _watcher is None or not _watcher.is_alive():
+            _watcher = threading.Thread(target=_watch, args=(interval,),
+                                        name='ontology-watcher', daemon=True)
+            _watcher.start()
+    return _watcher
@@ -0,0 +1,172 @@
+"""
+Consistency checks for the equations in the ontology.
+
+Equation data and hints are extracted from owlready2 once, in the parent
+process, as plain dicts; the checks themselves run on those dicts in chunks
+across a process pool. Errors are mathematical inconsistencies; warnings are
+missing hints, which fall back to the hardcoded defaults at runtime.
+"""
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.equation_generator import format_terms
+from utils.expression_checker import ExpressionError, equivalent, parse_expression
+from utils.factor_pairs import get_factor_index
+from utils.hint_personalizer import PERFORMANCE_LEVELS, STEP_KEYS
+
+# Hint keys each type's step machine can ask for
+HINT_STEPS = {'linear': STEP_KEYS[:3], 'quadratic': STEP_KEYS}
+
+REQUIRED_FIELDS = {
+    'linear': ('coefficient', 'constant', 'solution'),
+    'quadratic': ('a_coefficient', 'b_coefficient', 'c_coefficient',
+                  'solution1', 'solution2', 'discriminant'),
+}
+
+STEP_EXPRESSIONS = ('step4_expression', 'step5_expression', 'step6_expression')
+
+# Roots are stored as floats; allow for rounding when substituting them back
+TOLERANCE = 1e-9
+
+# Below this many equations the pool costs more than it saves
+MIN_PARALLEL = 2000
+
+
+def _close(value, expected):
+    return abs(value - expected) <= TOLERANCE * max(1.0, abs(expected))
+
+
+def _issue(check, message):
+    return {"check": check, "message": message}
+
+
+def _parse_equation(expression):
+    """(lhs coefficients, lhs - rhs normal form) of "lhs = rhs"."""
+    lhs = expression.split('=', 1)[0]
+    return parse_expression(lhs.strip()).coeffs, parse_expression(expression.strip())
+
+
+def check_linear(data):
+    coefficient, constant, solution = data['coefficient'], data['constant'], data['solution']
+    if coefficient == 0:
+        return [_issue('coefficient_zero', "coefficient is 0")]
+
+    try:
+        lhs, parsed = _parse_equation(data.get('expression', ''))
+    except ExpressionError as e:
+        return [_issue('expression_unreadable', f"expression: {e}")]
+    if not parsed.is_equation or parsed.degree != 1:
+        return [_issue('expression_degree', "expression is not a linear equation")]
+
+    errors = []
+    if lhs != (constant, coefficient):
+        errors.append(_issue('coefficients_mismatch',
+                             f"left-hand side is not {coefficient}x + {constant}"))
+
+    # lhs - rhs = c0 + c1·x, so the expression's own root is -c0 / c1
+    c0, c1 = parsed.coeffs
+    if not _close(solution, -c0 / c1):
+        errors.append(_issue('solution_mismatch',
+                             f"hasSolution {solution} does not satisfy "
+                             f"{coefficient}x + {constant} = {data['expression'].split('=', 1)[1].strip()}"))
+    return errors
+
+
+def check_quadratic(data):
+    a, b, c = data['a_coefficient'], data['b_coefficient'], data['c_coefficient']
+    roots = (data['solution1'], data['solution2'])
+    if a == 0:
+        return [_issue('coefficient_zero', "a is 0")]
+
+    polynomial = format_terms([(a, 'x²'), (b, 'x'), (c, '')])
+    errors = []
+    for root in roots:
+        if not _close(a * root * root + b * root + c, 0):
+            errors.append(_issue('root_mismatch',
+                                 f"x = {root} does not satisfy {polynomial} = 0"))
+    # Both roots solving it is not enough when one is listed twice
+    if not errors and not (_close(sum(roots), -b / a) and _close(roots[0] * roots[1], c / a)):
+        errors.append(_issue('root_mismatch', f"{roots} are not both roots of {polynomial}"))
+
+    if data['discriminant'] != b * b - 4 * a * c:
+        errors.append(_issue('discriminant_mismatch',
+                             f"hasDiscriminant {data['discriminant']} != b² - 4ac = {b * b - 4 * a * c}"))
+
+    if get_factor_index(a * c).pair_for(a * c, b) is None:
+        errors.append(_issue('not_factorable', f"no integer pair multiplies to {a * c} and adds to {b}"))
+
+    standard = f"{a}x^2 + {b}x + {c} = 0"
+    for field in ('expression',) + STEP_EXPRESSIONS:
+        expression = data.get(field)
+        if expression is None:
+            continue
+        try:
+            if not equivalent(expression, standard):
+                errors.append(_issue(f'{field}_mismatch', f"{expression!r} is not {polynomial} = 0"))
+        except ExpressionError as e:
+            errors.append(_issue(f'{field}_unreadable', f"{expression!r}: {e}"))
+    return errors
+
+
+def check_hints(eq_type, hints):
+    # Only the per-level keys are read at runtime; plain stepN text is legacy
+    missing = [f'{step}_{level}' for step in HINT_STEPS[eq_type]
+               for level in PERFORMANCE_LEVELS
+               if not hints.get(f'{step}_{level}')]
+    if not missing:
+        return []
+    return [_issue('hints_missing', ", ".join(missing))]
+
+
+def validate_equation(item):
+    """Check one (type, name, data, hints) tuple; returns a result dict."""
+    eq_type, name, data, hints = item
+    missing = [field for field in REQUIRED_FIELDS[eq_type] if data.get(field) is None]
+    if missing:
+        errors = [_issue('fields_missing', ", ".join(missing))]
+    elif eq_type == 'linear':
+        errors = check_linear(data)
+    else:
+        errors = check_quadratic(data)
+    return {"type": eq_type, "name": name, "errors": errors,
+            "warnings": check_hints(eq_type, hints)}
+
+
+def validate_chunk(items):
+    return [validate_equation(item) for item in items]
+
+
+def extract_items(equations_by_type, get_data, get_hints):
+    """Plain, picklable (type, name, data, hints) tuples; each individual is read once."""
+    return [(eq_type, eq.name, get_data(eq), get_hints(eq))
+            for eq_type, equations in equations_by_type
+            for eq in equations]
+
+
+def validate_items(items, workers=None, chunk_size=500):
+    """Run validate_equation over items, in a process pool when it pays off."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(items) < MIN_PARALLEL:
+        return validate_chunk(items)
+
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_results in pool.map(validate_chunk, chunks):
+            results.extend(chunk_results)
+    return results
+
+
+def build_report(results, include_clean=False):
+    errors = Counter(issue['check'] for result in results for issue in result['errors'])
+    warnings = Counter(issue['check'] for result in results for issue in result['warnings'])
+    return {
+        "equations": len(results),
+        "by_type": dict(Counter(result['type'] for result in results)),
+        "invalid": sum(1 for result in results if result['errors']),
+        "errors": dict(errors),
+        "warnings": dict(warnings),
+        "results": [result for result in results
+                    if include_clean or result['errors'] or result['warnings']],
+    }
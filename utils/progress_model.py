@@ -0,0 +1,240 @@
+from enum import IntEnum
+
+from utils.ontology_loader import get_catalog
+from utils.progress_store import progress_store
+
+# Bump when the serialized layout changes; from_json() still reads older ones
+PROGRESS_FORMAT_VERSION = 3
+
+
+class Status(IntEnum):
+    LOCKED = 0
+    UNLOCKED = 1
+    COMPLETED = 2
+
+    @property
+    def label(self):
+        return self.name.lower()
+
+
+STATUS_BY_LABEL = {status.label: status for status in Status}
+
+
+class ProgressTable:
+    """Per-type progress holding only the equations a student has touched.
+
+    Entries are keyed by the equation's position in the catalog and saved
+    under its stable uid, so they survive reordering of the ontology. Untouched
+    equations read as locked with no attempts, except the first, which starts
+    unlocked. Serialized as parallel arrays so the payload grows with the
+    equations touched rather than the size of the catalog.
+
+    Running aggregates are updated in O(1) by complete(). `fastest` is the
+    quickest solve ever recorded, so it survives a slower re-solve.
+    """
+
+    __slots__ = ('_entries', 'completed', 'total_attempts', 'total_time',
+                 'first_try', 'fastest')
+
+    def __init__(self, entries=None, aggregates=None):
+        # index -> [status, attempts, time]
+        self._entries = entries if entries is not None else {}
+        if aggregates is None:
+            aggregates = self._aggregate(self._entries)
+        (self.completed, self.total_attempts, self.total_time,
+         self.first_try, self.fastest) = aggregates
+
+    @staticmethod
+    def _aggregate(entries):
+        completed = [entry for entry in entries.values() if entry[0] == Status.COMPLETED]
+        times = [entry[2] for entry in completed if entry[2] > 0]
+        return (len(completed),
+                sum(entry[1] for entry in entries.values()),
+                sum(entry[2] for entry in entries.values()),
+                sum(1 for entry in completed if entry[1] == 1),
+                min(times) if times else None)
+
+    def _default(self, index):
+        return [Status.UNLOCKED if index == 0 else Status.LOCKED, 0, 0]
+
+    def status(self, index):
+        entry = self._entries.get(index)
+        return Status(entry[0]) if entry else self._default(index)[0]
+
+    def attempts(self, index):
+        entry = self._entries.get(index)
+        return entry[1] if entry else 0
+
+    def time(self, index):
+        entry = self._entries.get(index)
+        return entry[2] if entry else 0
+
+    def row(self, index):
+        entry = self._entries.get(index) or self._default(index)
+        return {"status": Status(entry[0]).label, "attempts": entry[1], "time": entry[2]}
+
+    def complete(self, index, time_taken):
+        entry = self._entries.setdefault(index, self._default(index))
+        # first_try counts completed entries with one attempt; only a row that
+        # was already one of them leaves it
+        if entry[0] != Status.COMPLETED:
+            self.completed += 1
+        elif entry[1] == 1:
+            self.first_try -= 1
+        self.total_attempts += 1
+        self.total_time += time_taken - entry[2]
+
+        entry[0] = Status.COMPLETED
+        entry[1] += 1
+        entry[2] = time_taken
+
+        if entry[1] == 1:
+            self.first_try += 1
+        if time_taken > 0 and (self.fastest is None or time_taken < self.fastest):
+            self.fastest = time_taken
+
+    def average_time(self):
+        return self.total_time / self.completed if self.completed else 0
+
+    def unlock(self, index):
+        # Never downgrade an equation that is already completed
+        if self.status(index) == Status.LOCKED:
+            self._entries.setdefault(index, self._default(index))[0] = Status.UNLOCKED
+
+    def touched(self):
+        return sorted(self._entries)
+
+    def entries(self):
+        """Yield (index, status, attempts, time) for touched equations in order."""
+        for index in self.touched():
+            status, attempts, time_taken = self._entries[index]
+            yield index, Status(status), attempts, time_taken
+
+    def completed_series(self):
+        """Indices, attempts and times of completed equations, in order."""
+        ids, attempts, times = [], [], []
+        for index in self.touched():
+            status, entry_attempts, time_taken = self._entries[index]
+            if status == Status.COMPLETED:
+                ids.append(index)
+                attempts.append(entry_attempts)
+                times.append(time_taken)
+        return ids, attempts, times
+
+    def to_json(self, uids=None):
+        """Serialize, storing each equation's stable uid (uids[position]).
+
+        Without `uids` positions are written as-is, i.e. uid == position.
+        """
+        positions = self.touched()
+        return {
+            "v": PROGRESS_FORMAT_VERSION,
+            "ids": [uids[i] for i in positions] if uids is not None else positions,
+            "status": [int(self._entries[i][0]) for i in positions],
+            "attempts": [self._entries[i][1] for i in positions],
+            "time": [self._entries[i][2] for i in positions],
+            "agg": [self.completed, self.total_attempts, self.total_time,
+                    self.first_try, self.fastest],
+        }
+
+    @classmethod
+    def from_json(cls, data, uid_positions=None, name_positions=None, layout=None,
+                  trust_aggregates=True):
+        """Rebuild a table; `uid_positions` maps stored uids to current positions.
+
+        Version 2 stored positions, tagged with the catalog `layout` and names
+        so they can be remapped by `name_positions`; older payloads are
+        positional. With trust_aggregates=False (progress sent by a client)
+        the stored aggregates are ignored and recomputed from the entries.
+        """
+        if not trust_aggregates and isinstance(data, dict):
+            data = {key: value for key, value in data.items() if key != "agg"}
+        if not data:
+            return cls()
+
+        rows = None
+        if data.get("v", 0) >= 3:
+            if uid_positions is not None:
+                rows = zip((uid_positions.get(uid) for uid in data["ids"]),
+                           data["status"], data["attempts"], data["time"])
+        elif layout is not None and data.get("layout", layout) != layout and "names" in data:
+            rows = zip((name_positions.get(name) for name in data["names"]),
+                       data["status"], data["attempts"], data["time"])
+
+        if rows is not None:
+            # Equations removed from the ontology are dropped, so the stored
+            # aggregates no longer apply
+            entries = {index: [Status(s), a, t] for index, s, a, t in rows if index is not None}
+            if len(entries) != len(data["ids"]):
+                return cls._checked(entries)
+            return cls._checked(entries, data.get("agg"))
+
+        if "v" not in data:
+            # Legacy {"EquationN": {"attempts", "time", "status"}} dicts
+            entries = {}
+            for key, row in data.items():
+                index = int(key[len("Equation"):]) - 1
+                status = STATUS_BY_LABEL.get(row.get("status"), Status.LOCKED)
+                entry = [status, row.get("attempts", 0), row.get("time", 0)]
+                if entry != [Status.UNLOCKED if index == 0 else Status.LOCKED, 0, 0]:
+                    entries[index] = entry
+            return cls._checked(entries)
+
+        entries = {i: [Status(s), a, t] for i, s, a, t in
+                   zip(data["ids"], data["status"], data["attempts"], data["time"])}
+        # Version 1 had no stored aggregates; rebuild them once
+        return cls._checked(entries, data.get("agg"))
+
+    @classmethod
+    def _checked(cls, entries, aggregates=None):
+        """Build from decoded JSON, which may come from a client (batch grading)."""
+        numbers = [value for _, attempts, time_taken in entries.values()
+                   for value in (attempts, time_taken)]
+        if aggregates is not None:
+            if not isinstance(aggregates, list) or len(aggregates) != 5:
+                raise ValueError("Malformed progress aggregates")
+            numbers += aggregates[:4] + [aggregates[4] or 0]
+        if not all(isinstance(value, (int, float)) for value in numbers):
+            raise ValueError("Malformed progress")
+        return cls(entries, aggregates)
+
+    def to_legacy(self, total):
+        """The old {"EquationN": {...}} shape for the first `total` equations."""
+        return {f"Equation{i+1}": self.row(i) for i in range(total)}
+
+
+def dump_progress(table, eq_type):
+    """JSON for `table`, keyed by the current catalog's stable uids."""
+    return table.to_json(get_catalog().uids(eq_type))
+
+
+def load_progress(session, eq_type, trust_aggregates=True):
+    catalog = get_catalog()
+    return ProgressTable.from_json(session.get(f'{eq_type}_progress'),
+                                   catalog.uid_positions(eq_type),
+                                   catalog.positions(eq_type), catalog.layout(eq_type),
+                                   trust_aggregates)
+
+
+def save_progress(session, eq_type, table):
+    data = dump_progress(table, eq_type)
+    session[f'{eq_type}_progress'] = data
+    # Durable copy, written behind; stateless batch grading has no student
+    store = progress_store()
+    if store is not None and session.get('student_name'):
+        store.put(session['student_name'], eq_type, data)
+
+
+def restore_progress(session, eq_types=('linear', 'quadratic')):
+    """Load the logged-in student's saved progress into the session.
+
+    Equation types with nothing saved are cleared, so a different student
+    logging in from the same browser starts empty.
+    """
+    store = progress_store()
+    saved = store.get(session.get('student_name')) if store is not None else {}
+    for eq_type in eq_types:
+        if eq_type in saved:
+            session[f'{eq_type}_progress'] = saved[eq_type]
+        else:
+            session.pop(f'{eq_type}_progress', None)
@@ -0,0 +1,268 @@
+"""
+Durable student progress in SQLite (WAL mode), written behind in batches.
+
+The session stays the working copy, and save_progress() also hands each
+table to the store, keyed by student. A write only queues the table in
+memory and appends one line to a journal file, so a solve costs
+microseconds. A
+background thread then writes the batch to SQLite in one transaction and
+deletes the journal segment it covered. Journal segments left behind by a
+crashed process are replayed on the next start. They are plain write()s,
+so they survive a process crash; power loss can lose the last flush
+interval.
+
+/login reads the student's progress back into the session. That read goes
+to SQLite, because another worker may have saved newer progress, and
+this process's unflushed writes win only where they are newer. Each
+process (gunicorn worker) has its own queue and flusher. The database
+keeps the newest write for each student and equation type.
+"""
+import atexit
+import glob
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from flask import current_app, has_app_context
+
+try:
+    import fcntl
+except ImportError:  # Windows: live journals can't be told apart, so run one process
+    fcntl = None
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Flush early once this many (student, type) writes are waiting
+DEFAULT_MAX_PENDING = 1000
+
+UPSERT = ("INSERT INTO progress (student, eq_type, data, updated_at) VALUES (?, ?, ?, ?) "
+          "ON CONFLICT (student, eq_type) DO UPDATE "
+          "SET data = excluded.data, updated_at = excluded.updated_at "
+          "WHERE excluded.updated_at >= progress.updated_at")
+
+
+def student_key(name):
+    """Students are identified by name (login has no accounts); '' for none."""
+    return (name or '').strip().casefold()
+
+
+class ProgressStore:
+    """Write-behind progress store; put() never waits for SQLite."""
+
+    def __init__(self, path, flush_interval=DEFAULT_FLUSH_INTERVAL, max_pending=DEFAULT_MAX_PENDING):
+        self.path = path
+        self.journal_dir = f"{path}.journal"
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        os.makedirs(self.journal_dir, exist_ok=True)
+        self._reset()
+        # A connection of its own, closed again: it must not be inherited by
+        # workers forked from a preloading master
+        db = self._open()
+        try:
+            with db:
+                db.execute("CREATE TABLE IF NOT EXISTS progress ("
+                           "student TEXT NOT NULL, eq_type TEXT NOT NULL, data TEXT NOT NULL, "
+                           "updated_at REAL NOT NULL, PRIMARY KEY (student, eq_type))")
+            self.replay(db)
+        finally:
+            db.close()
+
+    def _reset(self):
+        # Per-process state; rebuilt in a forked child, where the parent's
+        # thread, locks and journal file are not usable
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._local = threading.local()
+        self._pending = {}            # (student, eq_type) -> (updated_at, data)
+        self._flushing = {}           # the batch being written right now
+        self._segments = []           # journal files covered by the pending writes
+        self._flushes = 0             # completed flushes, to detect one racing a read
+        self._journal = None
+        self._sequence = 0
+        self._thread = None
+        self._stopped = False
+
+    def _open(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _connect(self):
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = self._local.db = self._open()
+        return db
+
+    def _ensure_started(self):
+        if self._pid != os.getpid():
+            self._reset()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='progress-flusher', daemon=True)
+            self._thread.start()
+
+    # --- journal -----------------------------------------------------------
+
+    def _open_segment(self):
+        """Start a new journal segment; the caller holds self._lock."""
+        self._sequence += 1
+        path = os.path.join(self.journal_dir, f"{self._pid}-{time.time_ns()}-{self._sequence}.log")
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            # Held while this process is alive, so replay() skips live journals
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        self._journal = (path, fd)
+        self._segments.append((path, fd))
+
+    def _close_segment(self, segment):
+        path, fd = segment
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        os.close(fd)
+
+    def replay(self, db):
+        """Write journal segments left by crashed processes to the database."""
+        for path in sorted(glob.glob(os.path.join(self.journal_dir, '*.log'))):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                if fcntl is not None:
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        continue  # its process is still running
+                with os.fdopen(os.dup(fd), 'rb') as f:
+                    rows = []
+                    for line in f:
+                        try:
+                            student, eq_type, updated_at, data = json.loads(line)
+                        except ValueError:
+                            continue  # a line cut short by the crash
+                        rows.append((student, eq_type, json.dumps(data, separators=(',', ':')),
+                                     updated_at))
+                with db:
+                    db.executemany(UPSERT, rows)
+                os.remove(path)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Error replaying progress journal {path}: {e}")
+            finally:
+                os.close(fd)
+
+    # --- reads and writes ----------------------------------------------------
+
+    def get(self, name):
+        """{eq_type: progress JSON} for a student: the newest of SQLite and unflushed writes."""
+        student = student_key(name)
+        if not student:
+            return {}
+        self._ensure_started()
+        while True:
+            with self._lock:
+                flushes = self._flushes
+
+            rows = self._connect().execute(
+                "SELECT eq_type, updated_at, data FROM progress WHERE student = ?",
+                (student,)).fetchall()
+            newest = {eq_type: (updated_at, json.loads(data)) for eq_type, updated_at, data in rows}
+            with self._lock:
+                if self._flushes != flushes:
+                    continue  # a batch landed after the SELECT; read again
+                for batch in (self._flushing, self._pending):
+                    for (pending_student, eq_type), (updated_at, data) in batch.items():
+                        if pending_student == student and updated_at >= newest.get(eq_type, (0,))[0]:
+                            newest[eq_type] = (updated_at, data)
+            return {eq_type: data for eq_type, (_, data) in newest.items()}
+
+    def put(self, name, eq_type, data):
+        """Record a student's progress table; written to SQLite later."""
+        student = student_key(name)
+        if not student:
+            return
+        self._ensure_started()
+        updated_at = time.time()
+        line = (json.dumps([student, eq_type, updated_at, data], separators=(',', ':')) + '\n').encode()
+        with self._lock:
+            if self._journal is None:
+                self._open_segment()
+            os.write(self._journal[1], line)
+            self._pending[(student, eq_type)] = (updated_at, data)
+            if len(self._pending) >= self.max_pending:
+                self._wake.set()
+
+    # --- write-behind ----------------------------------------------------------
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Write every pending change in one transaction."""
+        with self._lock:
+            if not self._pending or os.getpid() != self._pid:
+                return
+            batch, self._pending = self._pending, {}
+            segments, self._segments = self._segments, []
+            self._journal = None
+            self._flushing = batch
+
+        rows = [(student, eq_type, json.dumps(data, separators=(',', ':')), updated_at)
+                for (student, eq_type), (updated_at, data) in batch.items()]
+        try:
+            with self._connect() as db:
+                db.executemany(UPSERT, rows)
+        except sqlite3.Error as e:
+            print(f"Error writing progress: {e}")
+            with self._lock:
+                # Retry on the next flush; newer writes since then take precedence
+                for key, value in batch.items():
+                    self._pending.setdefault(key, value)
+                self._segments = segments + self._segments
+                self._flushing = {}
+            return
+
+        with self._lock:
+            self._flushing = {}
+            self._flushes += 1
+        for segment in segments:
+            self._close_segment(segment)
+
+    def close(self):
+        """Flush and stop the background thread (registered with atexit)."""
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+
+def init_progress_store(app):
+    """Open the store at PROGRESS_DB_PATH; an empty path keeps progress in the session only."""
+    path = app.config.get('PROGRESS_DB_PATH')
+    if path is None:
+        path = os.path.join(app.instance_path, 'progress.sqlite3')
+    if not path:
+        return
+    try:
+        store = ProgressStore(path, app.config.get('PROGRESS_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL))
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error opening progress store {path}: {e}")
+        return
+    app.extensions['progress_store'] = store
+    atexit.register(store.close)
+
+
+def progress_store():
+    """The current app's store, or None outside an app or when disabled."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('progress_store')
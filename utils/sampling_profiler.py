@@ -0,0 +1,92 @@
+"""
+Sampling profiler for slow requests.
+
+While a request is running, a background thread samples its stack every
+few milliseconds. When the request ends, the samples are thrown away,
+unless the request took longer than the threshold. In that case they are
+written out in the collapsed-stack format ("frame;frame;frame count" per
+line). flamegraph.pl, speedscope and inferno all read that format directly.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+# Oldest profiles are removed past this many files
+MAX_PROFILES = 200
+
+
+def fold_stack(frame):
+    """'file:function;...' for `frame`, outermost call first."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class SamplingProfiler:
+    def __init__(self, threshold_ms, interval_ms=5, output_dir='profiles'):
+        self.threshold = threshold_ms / 1000.0
+        self.interval = interval_ms / 1000.0
+        self.output_dir = output_dir
+        # thread ident -> Counter of folded stacks
+        self._active = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def begin(self):
+        """Start sampling the calling thread."""
+        with self._lock:
+            self._active[threading.get_ident()] = Counter()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def end(self, label, elapsed):
+        """Stop sampling the calling thread; returns the profile path if one was written."""
+        with self._lock:
+            samples = self._active.pop(threading.get_ident(), None)
+            if not self._active:
+                self._wakeup.clear()
+        if not samples or elapsed < self.threshold:
+            return None
+        return self.write(label, elapsed, samples)
+
+    def _run(self):
+        own = threading.get_ident()
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, samples in self._active.items():
+                    frame = frames.get(ident)
+                    if frame is not None and ident != own:
+                        samples[fold_stack(frame)] += 1
+            del frames
+
+    def write(self, label, elapsed, samples):
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+            safe_label = ''.join(c if c.isalnum() or c in '._-' else '_' for c in label)
+            path = os.path.join(self.output_dir, f"{stamp}-{safe_label}-{elapsed * 1000:.0f}ms.folded")
+            with open(path, 'w') as f:
+                for stack, count in samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            self._prune()
+        except OSError as e:
+            print(f"Error writing profile to {self.output_dir}: {e}")
+            return None
+        return path
+
+    def _prune(self):
+        profiles = sorted(name for name in os.listdir(self.output_dir) if name.endswith('.folded'))
+        for name in profiles[:-MAX_PROFILES]:
+            os.remove(os.path.join(self.output_dir, name))
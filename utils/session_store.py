@@ -0,0 +1,213 @@
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer
+from werkzeug.datastructures import CallbackDict
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session dict whose contents live in a backend; the cookie holds only its id."""
+
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(self):
+            self.modified = True
+            self.accessed = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.accessed = False
+
+
+class MemorySessionBackend:
+    """In-process LRU store. Sessions are per worker process."""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, sid, max_age):
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            payload, saved_at = entry
+            if time.time() - saved_at > max_age:
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+            return payload
+
+    def save(self, sid, payload):
+        with self._lock:
+            self._entries[sid] = (payload, time.time())
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+
+class SQLiteSessionBackend:
+    """Local SQLite store shared by every worker on the host."""
+
+    # Expired rows are purged every PURGE_INTERVAL saves
+    PURGE_INTERVAL = 1000
+
+    def __init__(self, path, max_age=None):
+        self.path = path
+        self.max_age = max_age
+        self._pid = None
+        self._saves = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # A connection of its own, closed again: it must not be inherited by
+        # workers forked from a preloading master
+        db = self._open()
+        try:
+            with db:
+                db.execute("CREATE TABLE IF NOT EXISTS sessions ("
+                           "sid TEXT PRIMARY KEY, payload TEXT NOT NULL, saved_at REAL NOT NULL)")
+        finally:
+            db.close()
+
+    def _open(self):
+        db = sqlite3.connect(self.path, timeout=10)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _connect(self):
+        # Connections are per thread and per process; a forked child starts afresh
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._local = threading.local()
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = self._local.db = self._open()
+        return db
+
+    def load(self, sid, max_age):
+        row = self._connect().execute(
+            "SELECT payload, saved_at FROM sessions WHERE sid = ?", (sid,)).fetchone()
+        if row is None or time.time() - row[1] > max_age:
+            return None
+        return row[0]
+
+    def save(self, sid, payload):
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO sessions (sid, payload, saved_at) VALUES (?, ?, ?)",
+                       (sid, payload, time.time()))
+        self._saves += 1
+        if self.max_age and self._saves % self.PURGE_INTERVAL == 0:
+            self.purge(self.max_age)
+
+    def delete(self, sid):
+        with self._connect() as db:
+            db.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+    def purge(self, max_age):
+        with self._connect() as db:
+            db.execute("DELETE FROM sessions WHERE saved_at < ?", (time.time() - max_age,))
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Stores session data in a backend and sends only a signed session id."""
+
+    serializer = TaggedJSONSerializer()
+    session_class = ServerSideSession
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt='server-side-session')
+
+    def _max_age(self, app):
+        return app.permanent_session_lifetime.total_seconds()
+
+    def open_session(self, app, request):
+        if not app.secret_key:
+            return None
+
+        signed_sid = request.cookies.get(self.get_cookie_name(app))
+        if signed_sid:
+            try:
+                sid = self._signer(app).unsign(signed_sid).decode()
+            except BadSignature:
+                sid = None
+            if sid:
+                payload = self.backend.load(sid, self._max_age(app))
+                if payload is not None:
+                    try:
+                        return self.session_class(self.serializer.loads(payload), sid=sid)
+                    except ValueError:
+                        pass
+
+        return self.session_class(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+
+        # Same empty-session handling as Flask's cookie sessions
+        if not session:
+            if session.modified:
+                self.backend.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path, secure=secure,
+                                       samesite=samesite, httponly=httponly)
+            return
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if session.modified:
+            self.backend.save(session.sid, self.serializer.dumps(dict(session)))
+
+        # The id never changes, so the cookie is only (re)sent when it is new
+        # or when a permanent session's expiry must be refreshed
+        refresh = session.permanent and app.config['SESSION_REFRESH_EACH_REQUEST']
+        if not (session.new or refresh):
+            return
+
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid).decode(),
+            expires=self.get_expiration_time(app, session),
+            httponly=httponly,
+            domain=domain,
+            path=path,
+            secure=secure,
+            samesite=samesite,
+        )
+
+
+def init_session_store(app):
+    """Install the backend named by SESSION_BACKEND: 'memory', 'sqlite' or 'cookie'."""
+    backend_name = app.config.get('SESSION_BACKEND', 'memory')
+    if backend_name == 'cookie':
+        return
+
+    if backend_name == 'memory':
+        backend = MemorySessionBackend(app.config.get('SESSION_MEMORY_MAX_ENTRIES', 10000))
+    elif backend_name == 'sqlite':
+        path = app.config.get('SESSION_SQLITE_PATH') or os.path.join(app.instance_path, 'sessions.sqlite3')
+        backend = SQLiteSessionBackend(path, app.permanent_session_lifetime.total_seconds())
+    else:
+        raise ValueError(f"Unknown SESSION_BACKEND: {backend_name}")
+
+    app.session_interface = ServerSideSessionInterface(backend)
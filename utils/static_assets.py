@@ -0,0 +1,227 @@
+"""
+Fingerprinted, precompressed static assets.
+
+Every file under static/ is copied to static/dist/ as name.<hash>.ext, with
+gzip and (when the brotli package is installed) brotli siblings, and listed
+in static/dist/manifest.json. Templates link to the files through
+asset_url(). The URL changes whenever the content does, so /assets/ can
+serve it with an immutable, year-long cache header.
+
+The build reruns at startup whenever a source file has changed. It can also
+be run ahead of time with `python build_assets.py`.
+
+Third-party files (VENDOR_ASSETS) are always served from here, never from
+their CDN. `python build_assets.py --vendor` downloads them and records
+their SHA-256 in vendor.lock.json; a file that is missing or does not match
+its recorded checksum is reported by check_vendor_assets(), which makes
+build_assets.py and the production entry points fail.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+
+from flask import Blueprint, abort, current_app, request, send_from_directory, url_for
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip alone is still served
+    brotli = None
+
+MANIFEST_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+DIST_DIR = 'dist'
+
+# Third-party files vendored into static/ by `build_assets.py --vendor`
+VENDOR_ASSETS = {
+    'vendor/chart.umd.js': 'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js',
+}
+# Banner each vendored file must start with, so a download is the pinned version
+VENDOR_BANNERS = {
+    'vendor/chart.umd.js': b'Chart.js v4.4.1',
+}
+# {name: {"url", "sha256"}} for the vendored files, next to static/
+VENDOR_LOCK = 'vendor.lock.json'
+
+COMPRESSIBLE = ('.css', '.js', '.json', '.svg', '.txt', '.html', '.map')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+bp = Blueprint('assets', __name__, url_prefix='/assets')
+
+
+def _sources(static_dir):
+    """{logical name: (mtime_ns, size)} for every file under static/ but dist/."""
+    sources = {}
+    for root, dirs, files in os.walk(static_dir):
+        if root == static_dir and DIST_DIR in dirs:
+            dirs.remove(DIST_DIR)
+        for filename in files:
+            path = os.path.join(root, filename)
+            name = os.path.relpath(path, static_dir).replace(os.sep, '/')
+            stat = os.stat(path)
+            sources[name] = [stat.st_mtime_ns, stat.st_size]
+    return sources
+
+
+def fingerprinted_name(name, content):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _compressed(name, content):
+    """{encoding: (suffix, bytes)} for the variants that are actually smaller."""
+    if not name.endswith(COMPRESSIBLE):
+        return {}
+    variants = {'gzip': ('.gz', gzip.compress(content, compresslevel=9, mtime=0))}
+    if brotli is not None:
+        variants['br'] = ('.br', brotli.compress(content, quality=11))
+    return {encoding: variant for encoding, variant in variants.items()
+            if len(variant[1]) < len(content)}
+
+
+def build(static_dir):
+    """Write fingerprinted and compressed copies to static/dist/; returns the manifest."""
+    dist_dir = os.path.join(static_dir, DIST_DIR)
+    sources = _sources(static_dir)
+    files = {}
+    keep = {MANIFEST_NAME}
+
+    for name in sorted(sources):
+        with open(os.path.join(static_dir, name), 'rb') as f:
+            content = f.read()
+        target = fingerprinted_name(name, content)
+        target_path = os.path.join(dist_dir, target)
+        # Content-addressed: an existing file with this name is already right
+        if not os.path.exists(target_path):
+            _write(target_path, content)
+        encodings = []
+        for encoding, (suffix, data) in _compressed(name, content).items():
+            if not os.path.exists(target_path + suffix):
+                _write(target_path + suffix, data)
+            encodings.append(encoding)
+            keep.add(target + suffix)
+        keep.add(target)
+        files[name] = {"path": target, "encodings": encodings}
+
+    # Drop outputs of sources that changed or went away
+    for root, _, filenames in os.walk(dist_dir):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if os.path.relpath(path, dist_dir).replace(os.sep, '/') not in keep:
+                os.remove(path)
+
+    manifest = {"version": MANIFEST_VERSION, "brotli": brotli is not None,
+                "sources": sources, "files": files}
+    _write(os.path.join(dist_dir, MANIFEST_NAME), json.dumps(manifest, indent=1).encode())
+    return manifest
+
+
+def load_manifest(static_dir):
+    """The current manifest, rebuilding static/dist/ when any source changed."""
+    try:
+        with open(os.path.join(static_dir, DIST_DIR, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+
+    if (manifest and manifest.get('version') == MANIFEST_VERSION
+            and manifest.get('brotli') == (brotli is not None)
+            and manifest.get('sources') == _sources(static_dir)):
+        return manifest
+    return build(static_dir)
+
+
+def vendor_lock_path(static_dir):
+    return os.path.join(os.path.dirname(os.path.abspath(static_dir)), VENDOR_LOCK)
+
+
+def load_vendor_lock(static_dir):
+    try:
+        with open(vendor_lock_path(static_dir)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def check_vendor_assets(static_dir):
+    """Problems with the vendored files, one message each; empty when all is well."""
+    lock = load_vendor_lock(static_dir)
+    problems = []
+    for name, url in VENDOR_ASSETS.items():
+        try:
+            with open(os.path.join(static_dir, name), 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            problems.append(f"static/{name} is missing")
+            continue
+        entry = lock.get(name) or {}
+        if entry.get('url') != url or entry.get('sha256') != digest:
+            problems.append(f"static/{name} does not match {VENDOR_LOCK}")
+    return problems
+
+
+def require_vendor_assets(static_dir):
+    """Exit with the problems found; for deploys, where a missing file must not go unnoticed."""
+    problems = check_vendor_assets(static_dir)
+    if problems:
+        raise SystemExit("Vendored assets are not ready: " + '; '.join(problems)
+                         + ". Run python build_assets.py --vendor and commit the result")
+
+
+def asset_url(name):
+    """URL for static/<name>: fingerprinted when built, else plain /static/."""
+    manifest = current_app.extensions.get('assets') or {}
+    entry = manifest.get('files', {}).get(name)
+    if entry is not None:
+        return url_for('assets.asset', filename=entry['path'])
+    return url_for('static', filename=name)
+
+
+@bp.route('/<path:filename>')
+def asset(filename):
+    paths = current_app.extensions.get('asset_paths') or {}
+    entry = paths.get(filename)
+    if entry is None:
+        abort(404)
+
+    dist_dir = os.path.join(current_app.static_folder, DIST_DIR)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    accepted = request.accept_encodings
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if encoding in entry['encodings'] and accepted[encoding]:
+            response = send_from_directory(dist_dir, filename + suffix, mimetype=mimetype)
+            response.content_encoding = encoding
+            break
+    else:
+        response = send_from_directory(dist_dir, filename, mimetype=mimetype)
+
+    # Not a download; and the .gz/.br file name would be misleading
+    response.headers.pop('Content-Disposition', None)
+    response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = IMMUTABLE
+    return response
+
+
+def init_static_assets(app):
+    """Build (if stale) and register fingerprinted assets; falls back to /static/ on errors."""
+    try:
+        manifest = load_manifest(app.static_folder)
+    except OSError as e:
+        print(f"Error building static assets: {e}")
+        manifest = {}
+    for problem in check_vendor_assets(app.static_folder):
+        print(f"Error: {problem}; run python build_assets.py --vendor")
+    app.extensions['assets'] = manifest
+    app.extensions['asset_paths'] = {entry['path']: entry
+                                     for entry in manifest.get('files', {}).values()}
+    app.add_template_global(asset_url)
+    app.register_blueprint(bp)
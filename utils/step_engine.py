@@ -0,0 +1,435 @@
+"""
+Step-by-step answer checking shared by the linear/quadratic routes and the
+batch endpoint. `state` is any mutable mapping: the Flask session for
+interactive use, or a plain dict per student when grading in bulk.
+"""
+import time
+
+from utils.expression_checker import ExpressionError, check_step, parse_expression
+from utils.factor_pairs import pair_feedback, pair_hint
+from utils.hint_personalizer import lookup_hint
+from utils.progress_model import load_progress, save_progress
+
+# Step definitions - 6 clear steps
+STEPS = [
+    {"id": 1, "instruction": "Step 1: Identify the coefficients. What are a, b, and c?",
+        "input_type": "three_numbers"},
+    {"id": 2,
+        "instruction": "Step 2: Calculate a × c (the AC product).", "input_type": "number"},
+    {"id": 3, "instruction": "Step 3: Find two numbers that multiply to ac AND add to b.",
+        "input_type": "two_numbers"},
+    {"id": 4, "instruction": "Step 4: Rewrite the equation with common factors.",
+        "input_type": "text"},
+    {"id": 5, "instruction": "Step 5: Rewrite the equation in factored form.",
+        "input_type": "text"},
+    {"id": 6, "instruction": "Step 6: What are the values of x?",
+        "input_type": "two_numbers"},
+]
+
+# Linear equations: constant, coefficient, then x
+LINEAR_STEPS = [
+    {"id": 0, "instruction": "Step 1: What is the constant term?", "input_type": "number"},
+    {"id": 1, "instruction": "Step 2: What do you divide by?", "input_type": "number"},
+    {"id": 2, "instruction": "Step 3: What is the value of x?", "input_type": "number"},
+]
+
+# Returned when the state does not point at a step of this equation type
+NO_ACTIVE_STEP = {"success": False, "message": "No active step for this equation"}
+
+# Returned when a reload removed the equation being worked on
+EQUATION_REMOVED = {"success": False, "message": "This equation is no longer available"}
+
+# Feedback for written steps 4 and 5, keyed by check_step()'s reason
+STEP_REJECTIONS = {
+    'unreadable': "I couldn't read that. Use x, numbers, + - * ^ and brackets.",
+    'not_equivalent': "That isn't equal to the original equation. Check your signs.",
+    'shape': "That's equal to the original, but not written the way this step asks.",
+}
+
+# Work from a previous quadratic attempt, cleared when a new one starts
+QUADRATIC_WORK_KEYS = ('a', 'b', 'c', 'ac_product', 'factor1', 'factor2',
+                       'rewritten_eq', 'factored_eq')
+
+
+def check_worked_step(answer, target, match_terms=False, min_factors=0):
+    """Verify a written step against the ontology's expression for it.
+
+    match_terms requires at least as many terms as the target (the split
+    middle term); min_factors requires a product of that many factors.
+    Equations without a usable target expression accept any answer.
+    """
+    if not target:
+        return True, None
+    try:
+        min_terms = parse_expression(target).terms if match_terms else 0
+        return check_step(answer, target, min_terms=min_terms, min_factors=min_factors)
+    except ExpressionError as e:
+        print(f"Could not parse step expression {target!r}: {e}")
+        return True, None
+
+
+def current_equation(state, equations):
+    """Position of the state's equation in `equations`, or None if it is gone.
+
+    The uid saved by start_*() follows the equation to its new position
+    when a reloaded catalog has reordered it.
+    """
+    eq_id = state.get('current_equation', 0)
+    uid = state.get('current_uid')
+    if 0 <= eq_id < len(equations) and (uid is None or equations[eq_id].uid == uid):
+        return eq_id
+    for i, record in enumerate(equations):
+        if record.uid == uid:
+            state['current_equation'] = i
+            return i
+    return None
+
+
+def start_linear(state, eq_id, eq):
+    state['current_equation'] = eq_id
+    state['current_uid'] = eq.uid
+    state['current_type'] = 'linear'
+    state['current_step'] = 0
+    state['step_attempts'] = 0
+    state['start_time'] = time.time()
+
+
+def start_quadratic(state, eq_id, eq):
+    eq_data = eq.data
+
+    state['current_equation'] = eq_id
+    state['current_uid'] = eq.uid
+    state['current_type'] = 'quadratic'
+    state['current_step'] = 1
+    state['step_attempts'] = 0
+    state['start_time'] = time.time()
+
+    # Clear previous work
+    for key in QUADRATIC_WORK_KEYS:
+        state.pop(key, None)
+
+    # Store step expressions from ontology
+    state['step4_expression'] = eq_data.get('step4_expression', '')
+    state['step5_expression'] = eq_data.get('step5_expression', '')
+    state['step6_expression'] = eq_data.get('step6_expression', '')
+
+
+def check_linear_answer(state, data, linear_equations, record_progress=True):
+    """Apply one linear step answer to `state` and return the response payload.
+
+    record_progress=False leaves the progress table alone (generated practice).
+    """
+    user_input = data.get('answer', '')
+    eq_id = current_equation(state, linear_equations)
+    if eq_id is None:
+        return EQUATION_REMOVED
+    current_step = state.get('current_step', 0)
+    step_attempts = state.get('step_attempts', 0)
+
+    try:
+        user_value = int(user_input)
+    except (TypeError, ValueError):
+        return {"success": False, "message": "Please enter a valid number"}
+
+    eq = linear_equations[eq_id]
+    eq_data = eq.data
+    constant = eq_data.get('constant', 0)
+    coefficient = eq_data.get('coefficient', 0)
+    solution = eq_data.get('solution', 0)
+
+    step_attempts += 1
+    state['step_attempts'] = step_attempts
+
+    # Get personalized hint after 3 attempts
+    hint = None
+    if step_attempts >= 3:
+        performance_level = state.get('performance_level', 'moderate')
+
+        # Get adaptive hint based on performance level
+        hint = lookup_hint(eq.hint_table, performance_level, current_step)
+        state['step_attempts'] = 0
+
+    # Check answer based on step
+    if current_step == 0:  # Constant
+        if user_value == constant:
+            state['current_step'] = 1
+            state['step_attempts'] = 0
+            return {
+                "success": True,
+                "correct": True,
+                "message": "Correct! Moving to next step.",
+                "next_step": 1,
+                "progress_text": f"After subtracting constant: {coefficient}x = {solution * coefficient}"
+            }
+        else:
+            return {"success": True, "correct": False, "message": "Incorrect. Try again!", "hint": hint}
+
+    elif current_step == 1:  # Coefficient
+        if user_value == coefficient:
+            state['current_step'] = 2
+            state['step_attempts'] = 0
+            return {
+                "success": True,
+                "correct": True,
+                "message": "Correct! Moving to final step.",
+                "next_step": 2,
+                "progress_text": f"After dividing: x = {solution}"
+            }
+        else:
+            return {"success": True, "correct": False, "message": "Incorrect. Try again!", "hint": hint}
+
+    elif current_step == 2:  # Solution
+        if user_value == solution:
+            time_taken = round(
+                time.time() - state.get('start_time', time.time()), 2)
+
+            if record_progress:
+                progress = load_progress(state, 'linear')
+                progress.complete(eq_id, time_taken)
+
+                if eq_id + 1 < len(linear_equations):
+                    progress.unlock(eq_id + 1)
+
+                save_progress(state, 'linear', progress)
+
+            return {
+                "success": True,
+                "correct": True,
+                "message": "Excellent! You've solved the equation!",
+                "completed": True,
+                "time": time_taken
+            }
+        else:
+            return {"success": True, "correct": False, "message": "Incorrect. Try again!", "hint": hint}
+
+    return NO_ACTIVE_STEP
+
+
+def check_quadratic_answer(state, data, quadratic_equations, record_progress=True):
+    """Apply one quadratic step answer to `state` and return the response payload.
+
+    record_progress=False leaves the progress table alone (generated practice).
+    """
+    eq_id = current_equation(state, quadratic_equations)
+    if eq_id is None:
+        return EQUATION_REMOVED
+    current_step = state.get('current_step', 1)
+    step_attempts = state.get('step_attempts', 0)
+
+    eq = quadratic_equations[eq_id]
+    eq_data = eq.data
+
+    a = eq_data.get('a_coefficient', 1)
+    b = eq_data.get('b_coefficient', 0)
+    c = eq_data.get('c_coefficient', 0)
+    ac_product = a * c
+    solution1 = eq_data.get('solution1', 0)
+    solution2 = eq_data.get('solution2', 0)
+
+    step_attempts += 1
+    state['step_attempts'] = step_attempts
+
+    # Get hint after 3 attempts with performance personalization
+    hint = None
+    if step_attempts >= 3:
+        performance_level = state.get('performance_level', 'moderate')
+
+        # Get adaptive hint based on current step and performance level
+        hint = lookup_hint(eq.hint_table, performance_level, current_step - 1)
+        state['step_attempts'] = 0
+
+    # Step 1: Identify a, b, c
+    if current_step == 1:
+        try:
+            user_a = float(data.get('a', 0))
+            user_b = float(data.get('b', 0))
+            user_c = float(data.get('c', 0))
+
+            if user_a == a and user_b == b and user_c == c:
+                state['current_step'] = 2
+                state['step_attempts'] = 0
+                state['a'] = int(a)
+                state['b'] = int(b)
+                state['c'] = int(c)
+                return {
+                    "success": True,
+                    "correct": True,
+                    "message": f"Correct! a = {int(a)}, b = {int(b)}, c = {int(c)}",
+                    "next_step": STEPS[1],
+                    "progress": 17
+                }
+            else:
+                return {
+                    "success": True,
+                    "correct": False,
+                    "message": "Not quite. Match with ax² + bx + c.",
+                    "hint": hint or "The coefficient of x² is a, the coefficient of x is b, and the constant is c."
+                }
+        except:
+            return {"success": False, "message": "Please enter valid numbers"}
+
+    # Step 2: Calculate a × c
+    elif current_step == 2:
+        try:
+            user_ac = float(data.get('answer', 0))
+            if user_ac == ac_product:
+                state['current_step'] = 3
+                state['step_attempts'] = 0
+                state['ac_product'] = int(ac_product)
+                return {
+                    "success": True,
+                    "correct": True,
+                    "message": f"Correct! a × c = {int(ac_product)}",
+                    "next_step": STEPS[2],
+                    "progress": 34
+                }
+            else:
+                return {
+                    "success": True,
+                    "correct": False,
+                    "message": "Incorrect. Try again!",
+                    "hint": hint or f"Multiply a ({int(a)}) by c ({int(c)})."
+                }
+        except:
+            return {"success": False, "message": "Please enter a valid number"}
+
+    # Step 3: Find two numbers that multiply to ac and add to b
+    elif current_step == 3:
+        try:
+            num1 = float(data.get('num1', 0))
+            num2 = float(data.get('num2', 0))
+
+            # Check if they multiply to ac and add to b
+            if (num1 * num2 == ac_product and num1 + num2 == b):
+                state['factor1'] = int(num1)
+                state['factor2'] = int(num2)
+                state['current_step'] = 4
+                state['step_attempts'] = 0
+                return {
+                    "success": True,
+                    "correct": True,
+                    "message": f"Excellent! {int(num1)} × {int(num2)} = {int(ac_product)} and {int(num1)} + {int(num2)} = {int(b)}",
+                    "next_step": STEPS[3],
+                    "progress": 51
+                }
+            else:
+                # Show whole numbers without a trailing .0
+                num1, num2 = (int(n) if n.is_integer() else n for n in (num1, num2))
+                message, closest = pair_feedback(int(ac_product), int(b), num1, num2)
+                return {
+                    "success": True,
+                    "correct": False,
+                    "message": f"These numbers don't work. {message}",
+                    "closest_pair": closest,
+                    "hint": hint or pair_hint(int(ac_product), int(b))
+                }
+        except:
+            return {"success": False, "message": "Please enter valid numbers"}
+
+    # Step 4: Rewrite equation with common factors
+    elif current_step == 4:
+        answer = data.get('answer') or ''
+        if not isinstance(answer, str):
+            return {"success": False, "message": "Please enter your equation as text"}
+        answer = answer.strip()
+        if answer:
+            ok, reason = check_worked_step(answer, state.get('step4_expression'), match_terms=True)
+            if not ok:
+                return {
+                    "success": True,
+                    "correct": False,
+                    "message": STEP_REJECTIONS[reason],
+                    "hint": hint or f"Split the middle term using {state.get('factor1')} and {state.get('factor2')}."
+                }
+            state['rewritten_eq'] = answer
+            state['current_step'] = 5
+            state['step_attempts'] = 0
+            return {
+                "success": True,
+                "correct": True,
+                "message": "Good! Now write the factored form.",
+                "next_step": STEPS[4],
+                "progress": 68
+            }
+        else:
+            return {
+                "success": True,
+                "correct": False,
+                "message": "Please enter your rewritten equation.",
+                "hint": hint or f"Split the middle term using {state.get('factor1')} and {state.get('factor2')}."
+            }
+
+    # Step 5: Write factored form
+    elif current_step == 5:
+        answer = data.get('answer') or ''
+        if not isinstance(answer, str):
+            return {"success": False, "message": "Please enter your equation as text"}
+        answer = answer.strip()
+        if answer:
+            ok, reason = check_worked_step(answer, state.get('step5_expression'), min_factors=2)
+            if not ok:
+                return {
+                    "success": True,
+                    "correct": False,
+                    "message": STEP_REJECTIONS[reason],
+                    "hint": hint or "Factor out common terms from each group."
+                }
+            state['factored_eq'] = answer
+            state['current_step'] = 6
+            state['step_attempts'] = 0
+            return {
+                "success": True,
+                "correct": True,
+                "message": "Great! Now find the values of x.",
+                "next_step": STEPS[5],
+                "progress": 85
+            }
+        else:
+            return {
+                "success": True,
+                "correct": False,
+                "message": "Please enter your factored form.",
+                "hint": hint or "Factor out common terms from each group."
+            }
+
+    # Step 6: Final solutions
+    elif current_step == 6:
+        try:
+            sol1 = float(data.get('sol1', 0))
+            sol2 = float(data.get('sol2', 0))
+
+            correct_sols = sorted([solution1, solution2])
+            user_sols = sorted([sol1, sol2])
+
+            if user_sols == correct_sols:
+                time_taken = round(
+                    time.time() - state.get('start_time', time.time()), 2)
+
+                if record_progress:
+                    progress = load_progress(state, 'quadratic')
+                    progress.complete(eq_id, time_taken)
+
+                    if eq_id + 1 < len(quadratic_equations):
+                        progress.unlock(eq_id + 1)
+
+                    save_progress(state, 'quadratic', progress)
+
+                return {
+                    "success": True,
+                    "correct": True,
+                    "message": f"🎉 Perfect! The solutions are x = {solution1} and x = {solution2}",
+                    "completed": True,
+                    "time": time_taken,
+                    "progress": 100
+                }
+            else:
+                return {
+                    "success": True,
+                    "correct": False,
+                    "message": "Not quite right. Check your work.",
+                    "hint": hint or "Set each factor equal to 0 and solve."
+                }
+        except:
+            return {"success": False, "message": "Please enter valid numbers"}
+
+    return NO_ACTIVE_STEP
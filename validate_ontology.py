@@ -0,0 +1,59 @@
+"""
+Validate every equation in the ontology and write a JSON report.
+Run: python validate_ontology.py [--workers N] [--output report.json] [--strict]
+Exits with status 1 if any equation is inconsistent (or, with --strict, has
+missing hints).
+"""
+import argparse
+import json
+import sys
+import time
+
+from utils.ontology_cache import file_sha256
+from utils.ontology_loader import (ONTOLOGY_PATH, get_equation_data, get_hints,
+                                   get_linear_equations, get_quadratic_equations)
+from utils.ontology_validator import build_report, extract_items, validate_items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--output', help="write the report here instead of stdout")
+    parser.add_argument('--all', action='store_true', help="also list equations with no issues")
+    parser.add_argument('--strict', action='store_true', help="fail on warnings too")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    items = extract_items([('linear', get_linear_equations()),
+                           ('quadratic', get_quadratic_equations())],
+                          get_equation_data, get_hints)
+    extracted = time.perf_counter()
+    results = validate_items(items, args.workers, args.chunk_size)
+    finished = time.perf_counter()
+
+    report = build_report(results, include_clean=args.all)
+    report = {
+        "ontology": ONTOLOGY_PATH,
+        "version": file_sha256(ONTOLOGY_PATH),
+        "timings": {"extract_s": round(extracted - start, 3),
+                    "validate_s": round(finished - extracted, 3)},
+        **report,
+    }
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"{report['equations']} equations, {report['invalid']} invalid, "
+              f"report written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    failed = report['invalid'] or (args.strict and report['warnings'])
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
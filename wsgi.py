@@ -0,0 +1,30 @@
+"""
+Production entry point:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+gunicorn.conf.py sets preload_app, so this module is imported once in the
+master: the catalog is compiled here and every worker forks with it already
+in memory, instead of each parsing the ontology on its first request.
+
+Sessions default to the sqlite backend here: the in-memory store is
+per process, so with several workers a student's session would vanish
+whenever a request reached a different worker. Admin routes and /metrics
+need ADMIN_TOKEN here: behind a reverse proxy every client looks local.
+The vendored assets (build_assets.py --vendor) must be in place, or the
+server refuses to start.
+"""
+import os
+
+# Before create_app(), which reads them
+os.environ.setdefault('SESSION_BACKEND', 'sqlite')
+os.environ.setdefault('ADMIN_LOCAL_ACCESS', '0')
+
+from app import create_app
+from utils.ontology_loader import prepare_for_fork
+from utils.static_assets import require_vendor_assets
+
+# The ontology watcher is a thread, so it is started per worker (post_fork)
+app = create_app(watch=False)
+require_vendor_assets(app.static_folder)
+prepare_for_fork()